@@ -1,8 +1,9 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from config.admin_perf import FastChangelistMixin # 큰 테이블용 목록 설정 (추정 개수 등)
 from .models import User
 
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(FastChangelistMixin, UserAdmin):
     # 목록 화면에서 보이는 컬럼 설정
     # (기본) 아이디, 이메일, 이름, 스태프여부 + (추가) 닉네임, 게시판관리자여부
     list_display = ('username', 'nickname', 'email', 'is_board_manager', 'is_staff', 'is_superuser')
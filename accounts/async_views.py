@@ -0,0 +1,39 @@
+# 쪽지함 async(ASGI 전용) 버전 (boards/async_views.py 참고)
+# settings.ASYNC_READ_VIEWS = True 일 때 urls.py 에서 기존 뷰 대신 연결됩니다.
+import asyncio
+
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from boards.pagination import acursor_paginate
+from config.db_router import replica_reads
+
+from . import unread
+from .views import MESSAGES_PER_PAGE, message_box_queryset
+
+
+# 1. 쪽지함 (목록)
+@replica_reads
+@login_required
+async def message_list(request, box='received'):
+    request.user = user = await request.auser()
+
+    # 쪽지 한 페이지 / 안 읽은 개수를 함께 기다립니다.
+    message_page, unread_count = await asyncio.gather(
+        acursor_paginate(
+            message_box_queryset(user, box),
+            after=request.GET.get('after'),
+            before=request.GET.get('before'),
+            per_page=MESSAGES_PER_PAGE,
+        ),
+        unread.aunread_count(user.pk),
+    )
+    # 상단 메뉴 배지 (accounts/context_processors.py)
+    request.unread_message_count = unread_count
+
+    context = {
+        'box': box,
+        'message_page': message_page,
+        'unread_count': unread_count,
+    }
+    return render(request, 'accounts/message_list.html', context)
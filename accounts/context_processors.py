@@ -0,0 +1,14 @@
+# 모든 템플릿에서 쓸 수 있는 값 (settings.TEMPLATES 의 context_processors 에 등록)
+from . import unread
+
+
+def unread_messages(request):
+    # 상단 메뉴의 안 읽은 쪽지 배지용
+    # async 뷰는 템플릿을 그리는 중에 DB를 조회할 수 없으므로 미리 구해 둔 값(request.unread_message_count)을 씁니다.
+    count = getattr(request, 'unread_message_count', None)
+    if count is None:
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return {}
+        count = unread.unread_count(user.pk)
+    return {'unread_message_count': count}
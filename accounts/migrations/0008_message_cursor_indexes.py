@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_message_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_receiver_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_sender_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['receiver', '-created_at', '-id'], name='message_receiver_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['sender', '-created_at', '-id'], name='message_sender_created_idx'),
+        ),
+    ]
@@ -46,4 +46,17 @@ class Message(models.Model):
         return f"To {self.receiver}: {self.title}"
     
     class Meta:
-        ordering = ['-created_at']  # 최신 쪽지가 맨 위에 오도록 정렬
\ No newline at end of file
+        ordering = ['-created_at']  # 최신 쪽지가 맨 위에 오도록 정렬
+
+        # 쪽지함 조회 조건 + 정렬 조합에 맞춘 색인
+        indexes = [
+            # 받은 쪽지함: WHERE receiver_id = ? ORDER BY created_at DESC, id DESC (커서 페이징 기준과 같은 순서)
+            models.Index(fields=['receiver', '-created_at', '-id'], name='message_receiver_created_idx'),
+            # 보낸 쪽지함: WHERE sender_id = ? ORDER BY created_at DESC, id DESC
+            models.Index(fields=['sender', '-created_at', '-id'], name='message_sender_created_idx'),
+            # 읽음 여부로 거르기: WHERE receiver_id = ? AND read_at ...
+            models.Index(fields=['receiver', 'read_at'], name='message_receiver_read_idx'),
+            # 안 읽은 쪽지 개수 (부분 색인): WHERE receiver_id = ? AND read_at IS NULL
+            # 안 읽은 쪽지만 색인에 들어가므로 읽은 쪽지가 아무리 많아도 색인이 작게 유지됩니다.
+            models.Index(fields=['receiver'], condition=models.Q(read_at__isnull=True), name='message_unread_idx'),
+        ]
\ No newline at end of file
@@ -1,3 +1,185 @@
-from django.test import TestCase
+import threading
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from boards.tests import LOCMEM_CACHE, QueryPlanAssertions
+
+from . import unread
+from .models import Message
+
+User = get_user_model()
+
+
+# 쪽지함 화면 쿼리가 색인을 타는지 (boards/tests.py 의 BoardQueryPlanTests 와 같은 방식)
+class MessageQueryPlanTests(QueryPlanAssertions, TestCase):
+    def test_received(self):
+        self.assertUsesIndex(Message.objects.filter(receiver_id=1).order_by('-created_at', '-id')[:21])
+
+    def test_sent(self):
+        self.assertUsesIndex(Message.objects.filter(sender_id=1).order_by('-created_at', '-id')[:21])
+
+    def test_unread_count(self):
+        self.assertUsesIndex(Message.objects.filter(receiver_id=1, read_at__isnull=True).values('pk'))
+
+
+def send_message(sender, receiver, title='제목'):
+    return Message.objects.create(sender=sender, receiver=receiver, title=title, content='내용')
+
+
+# 세션은 캐시에 두어 스레드끼리 django_session 에 동시에 쓰지 않도록 함
+@override_settings(
+    CACHES=LOCMEM_CACHE, SESSION_ENGINE='django.contrib.sessions.backends.cache', DATABASE_REPLICAS=[],
+)
+class UnreadCountConcurrencyTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.receiver = User.objects.create_user('receiver')
+        self.senders = [User.objects.create_user(f'sender{i}') for i in range(4)]
+
+    def run_threads(self, works):
+        errors = []
+        db_lock = threading.Lock()
+
+        def one_query_at_a_time(execute, sql, params, many, context):
+            # 테스트 DB(SQLite 공유 캐시 메모리 DB)는 동시 쓰기를 기다리지 않고 바로 'table is locked' 를 내므로
+            # 쿼리는 한 번에 하나씩만 실행합니다. 요청끼리는 쿼리 사이사이에서 계속 섞임
+            with db_lock:
+                return execute(sql, params, many, context)
+
+        def worker(work):
+            try:
+                # 다 읽지 않은 SELECT 커서가 테이블 읽기 잠금을 쥐고 있지 않도록
+                with connection.cursor() as cursor:
+                    cursor.execute('PRAGMA read_uncommitted = 1')
+                # INSERT ... RETURNING 은 커서를 닫을 때까지 끝나지 않아 쓰기 잠금을 쥐고 있으므로 lastrowid 를 씀
+                connection.features.can_return_columns_from_insert = False
+                with connection.execute_wrapper(one_query_at_a_time):
+                    work()
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(work,)) for work in works]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def logged_in(self, user):
+        # 로그인(last_login 저장)은 스레드를 띄우기 전에 미리
+        client = Client()
+        client.force_login(user)
+        return client
+
+    def test_send_and_read_from_threads(self):
+        # 이미 받은 쪽지를 읽는 동안(-1) 다른 사람들이 새 쪽지를 보냄(+1) -> 카운터가 DB와 같아야 함
+        existing = [send_message(self.senders[0], self.receiver).pk for _ in range(20)]
+        self.assertEqual(unread.unread_count(self.receiver.pk), 20)    # 캐시 채우기
+
+        def sender(client):
+            url = reverse('accounts:message_send', args=[self.receiver.pk])
+            return lambda: [client.post(url, {'title': f'새 쪽지 {i}', 'content': '-'}) for i in range(10)]
+
+        def reader(client, message_ids):
+            return lambda: [client.get(reverse('accounts:message_detail', args=[pk])) for pk in message_ids]
+
+        # 받은 사람이 여러 창에서 같은 순서로 열어도(같은 쪽지를 동시에 읽음 처리) 쪽지마다 한 번만 -1
+        self.run_threads(
+            [sender(self.logged_in(user)) for user in self.senders]
+            + [reader(self.logged_in(self.receiver), existing) for _ in range(4)]
+        )
+
+        db_count = Message.objects.filter(receiver=self.receiver, read_at__isnull=True).count()
+        self.assertEqual(db_count, 40)
+        self.assertEqual(unread.unread_count(self.receiver.pk), db_count)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, DATABASE_REPLICAS=[])
+class UnreadBadgeQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('receiver')
+        sender = User.objects.create_user('sender')
+        for _ in range(3):
+            send_message(sender, cls.user)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def test_warm_badge_runs_no_message_count(self):
+        # 상단 메뉴(base.html)의 배지는 캐시된 카운터만 읽음: 세션 + 사용자 조회 외에 쿼리 없음
+        url = reverse('accounts:profile')
+        self.client.get(url)
+        with self.assertNumQueries(2), CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.context['unread_message_count'], 3)
+        self.assertFalse([q['sql'] for q in queries if 'accounts_message' in q['sql']])
+
+    def test_cold_badge_counts_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('accounts:profile'))
+        counts = [q['sql'] for q in queries if 'accounts_message' in q['sql']]
+        self.assertEqual(len(counts), 1)
+        self.assertIn('COUNT(', counts[0])
+
+
+# 쪽지함 목록: 상대방은 JOIN 으로 함께 읽으므로 쪽지/상대방이 늘어도 쿼리 수가 같아야 함
+@override_settings(CACHES=LOCMEM_CACHE, DATABASE_REPLICAS=[])
+class MessageListQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner')
+        for i in range(25):
+            other = User.objects.create_user(f'other{i}')
+            send_message(other, cls.user, f'받은 쪽지 {i}')
+            send_message(cls.user, other, f'보낸 쪽지 {i}')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.client.get(reverse('accounts:message_inbox'))     # 안 읽은 쪽지 개수 캐시 채우기
+
+    def next_page_url(self, name):
+        response = self.client.get(reverse(name))
+        return f"{reverse(name)}?after={response.context['message_page'].next_cursor}"
+
+    def assertPageQueries(self, url, rows):
+        # 세션 + 사용자 + 쪽지 한 페이지(상대방 JOIN)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(len(response.context['message_page']), rows)
+
+    def test_inbox_first_page(self):
+        self.assertPageQueries(reverse('accounts:message_inbox'), 20)
+
+    def test_inbox_next_page(self):
+        self.assertPageQueries(self.next_page_url('accounts:message_inbox'), 5)
+
+    def test_outbox_first_page(self):
+        self.assertPageQueries(reverse('accounts:message_outbox'), 20)
+
+    def test_outbox_next_page(self):
+        self.assertPageQueries(self.next_page_url('accounts:message_outbox'), 5)
+
+    def test_more_counterparts_same_queries(self):
+        for i in range(10):
+            other = User.objects.create_user(f'extra{i}')
+            send_message(other, self.user)
+            send_message(self.user, other)
+        self.client.get(reverse('accounts:message_inbox'))     # 새 쪽지로 바뀐 개수 캐시 채우기
+        self.assertPageQueries(reverse('accounts:message_inbox'), 20)
+        self.assertPageQueries(reverse('accounts:message_outbox'), 20)
+
+    def test_cold_unread_count_adds_one_count(self):
+        cache.clear()
+        with self.assertNumQueries(4):
+            self.client.get(reverse('accounts:message_inbox'))
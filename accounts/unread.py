@@ -0,0 +1,74 @@
+# 안 읽은 쪽지 개수 카운터 (사용자별, 캐시에 보관)
+# 기존에는 쪽지함 화면에서만 COUNT 쿼리로 계산했습니다.
+# 상단 메뉴(base.html)에 모든 화면마다 배지를 보여주려면 요청마다 COUNT 를 돌릴 수 없으므로
+#  - 쪽지를 보내면 받는 사람의 카운터 +1 (message_send)
+#  - 받은 사람이 처음 읽으면 -1 (message_detail)
+#  - 캐시에 값이 없으면 DB에서 한 번 세어서 채웁니다. (DB fallback)
+#  - 관리자 페이지에서 지우는 등 뷰를 거치지 않은 변경으로 어긋나도,
+#    UNREAD_COUNT_CACHE_TIMEOUT 이 지나면 DB 기준으로 다시 계산되어 스스로 맞춰집니다.
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Message
+
+CACHE_KEY_PREFIX = 'unread'
+
+
+def _key(user_id):
+    return f'{CACHE_KEY_PREFIX}:{user_id}'
+
+
+def _timeout():
+    return getattr(settings, 'UNREAD_COUNT_CACHE_TIMEOUT', 300)
+
+
+def _unread_queryset(user_id):
+    return Message.objects.filter(receiver_id=user_id, read_at__isnull=True)
+
+
+def recompute(user_id):
+    """DB에서 다시 세어서 캐시에 저장합니다."""
+    count = _unread_queryset(user_id).count()
+    cache.set(_key(user_id), count, _timeout())
+    return count
+
+
+async def arecompute(user_id):
+    """recompute() 의 async 버전"""
+    count = await _unread_queryset(user_id).acount()
+    await cache.aset(_key(user_id), count, _timeout())
+    return count
+
+
+def unread_count(user_id):
+    """안 읽은 쪽지 개수 (캐시에 있으면 쿼리 없음)"""
+    count = cache.get(_key(user_id))
+    if count is None or count < 0:
+        count = recompute(user_id)
+    return count
+
+
+async def aunread_count(user_id):
+    """unread_count() 의 async 버전"""
+    count = await cache.aget(_key(user_id))
+    if count is None or count < 0:
+        count = await arecompute(user_id)
+    return count
+
+
+def increment(user_id):
+    # 캐시에 값이 없으면 그대로 둡니다. (다음에 읽을 때 DB에서 새 쪽지까지 포함해 계산)
+    try:
+        cache.incr(_key(user_id))
+    except ValueError:
+        pass
+
+
+def decrement(user_id):
+    try:
+        count = cache.decr(_key(user_id))
+    except ValueError:
+        return
+    if count < 0:
+        # 어긋난 값 -> 버리고 다음에 DB에서 다시 계산
+        cache.delete(_key(user_id))
@@ -1,8 +1,13 @@
+from django.conf import settings
 from django.urls import path
 from django.contrib.auth import views as auth_views # Django가 제공하는 로그인/로그아웃 뷰
 from . import views
+from . import async_views # 쪽지함의 async(ASGI) 버전
 from .forms import CustomAuthenticationForm
 
+# ASYNC_READ_VIEWS=True 면 쪽지함 목록을 async 뷰로 연결합니다. (ASGI 서버로 실행할 때)
+read_views = async_views if settings.ASYNC_READ_VIEWS else views
+
 app_name = 'accounts'
 
 urlpatterns = [
@@ -27,7 +32,9 @@ urlpatterns = [
     path('profile/edit/', views.profile_edit, name='profile_edit'),
 
     # 쪽지 관련 URL
-    path('messages/', views.message_list, name='message_list'),     # 쪽지함 (받은/보낸)
+    path('messages/', read_views.message_list, name='message_list'),     # 쪽지함 (기본: 받은 쪽지)
+    path('messages/inbox/', read_views.message_list, {'box': 'received'}, name='message_inbox'),   # 받은 쪽지함
+    path('messages/outbox/', read_views.message_list, {'box': 'sent'}, name='message_outbox'),    # 보낸 쪽지함
     path('messages/<int:message_pk>/', views.message_detail, name='message_detail'),    # 쪽지 상세
     path('messages/send/<int:receiver_pk>/', views.message_send, name='message_send'),   # 쪽지 보내기
 ]
\ No newline at end of file
@@ -4,6 +4,10 @@ from .forms import CustomUserCreationForm, CustomUserChangeForm, MessageForm
 from django.contrib.auth import get_user_model  # User 모델 가져오기
 from django.utils import timezone   # 시간 기록용
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
+from boards.pagination import cursor_paginate
+from config.db_router import replica_reads # 쪽지함 목록은 복제 DB에서 조회
+from . import unread
 from .models import Message # Message 모델 import
 
 def signup(request):
@@ -48,21 +52,42 @@ def profile_edit(request):
 
 
 # MESSAGE #
+# 쪽지함 한 페이지에 보여줄 쪽지 수
+MESSAGES_PER_PAGE = 20
+
+# 쪽지함 종류: (내가 어느 쪽인지, 화면에 보여줄 상대방)
+MESSAGE_BOXES = {
+    'received': ('receiver', 'sender'),     # 받은 쪽지함: 보낸 사람을 보여줌
+    'sent': ('sender', 'receiver'),         # 보낸 쪽지함: 받는 사람을 보여줌
+}
+
+
+def message_box_queryset(user, box):
+    # 상대방 정보(이름, 사진)를 JOIN 으로 함께 가져옵니다. (쪽지마다 사용자 조회 쿼리가 나가지 않도록)
+    owner, counterpart = MESSAGE_BOXES[box]
+    return Message.objects.filter(**{owner: user}).select_related(counterpart)
+
+
 # 1. 쪽지함 (목록)
+# 쪽지가 수천 개 쌓인 사용자도 있으므로 전부 그리지 않고 (created_at, id) 커서로 MESSAGES_PER_PAGE 개씩 보여줍니다.
+# /messages/ 와 /messages/inbox/ 는 받은 쪽지함, /messages/outbox/ 는 보낸 쪽지함
+@replica_reads
 @login_required
-def message_list(request):
-    # 받은 쪽지 (나에게 온 것)
-    received_messages = Message.objects.filter(receiver=request.user)
-    # 보낸 쪽지(내가 보낸 것)
-    sent_messages = Message.objects.filter(sender=request.user)
+def message_list(request, box='received'):
+    message_page = cursor_paginate(
+        message_box_queryset(request.user, box),
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+        per_page=MESSAGES_PER_PAGE,
+    )
 
-    # 안읽은 쪽지 개수 계산 (read_at이 null인 것만 카운트)
-    unread_count = received_messages.filter(read_at__isnull=True).count()
+    # 안읽은 쪽지 개수 (캐시된 카운터, accounts/unread.py)
+    unread_count = unread.unread_count(request.user.pk)
 
     context = {
-        'received_messages': received_messages,
+        'box': box,
+        'message_page': message_page,
         'unread_count': unread_count,
-        'sent_messages': sent_messages,
     }
 
     return render(request, 'accounts/message_list.html', context)
@@ -81,7 +106,10 @@ def message_detail(request, message_pk):
     # [읽음 처리] 받는 사람이 처음 열어본 경우에만 기록
     if request.user == message.receiver and not message.read_at:
         message.read_at = timezone.now()  # 현재 시간 기록
-        message.save()
+        # 같은 쪽지를 동시에 두 번 열어도 한 번만 읽음 처리되도록 '아직 안 읽은 경우'에만 UPDATE
+        marked = Message.objects.filter(pk=message.pk, read_at__isnull=True).update(read_at=message.read_at)
+        if marked:
+            unread.decrement(message.receiver_id)
 
     return render(request, 'accounts/message_detail.html', {'message': message})
 
@@ -103,6 +131,8 @@ def message_send(request, receiver_pk):
             message.sender = request.user   # 보낸 사람 : 나
             message.receiver = receiver # 받는 사람: 지정된 유저
             message.save()
+            # 저장이 확정된 뒤 받는 사람의 안 읽은 쪽지 개수 +1
+            transaction.on_commit(lambda: unread.increment(receiver.pk))
             return redirect('accounts:message_list')
     else:
         form = MessageForm()
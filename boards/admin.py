@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db.models import Q
+from config.admin_perf import DateDrillDownFilter, FastChangelistMixin # 큰 테이블용 목록 설정
 from .models import Board, Post, Comment
+from .search import search_posts
 
 # 게시판(Board) 관리
 @admin.register(Board)
@@ -7,31 +10,106 @@ class BoardAdmin(admin.ModelAdmin):
     list_display = ('code', 'title', 'description')  # 목록에 보여줄 컬럼
     list_display_links = ('code', 'title')           # 클릭해서 수정할 수 있는 컬럼
 
+# 좋아요 수 / 댓글 수 구간 필터 (저장된 카운터 컬럼으로 거르므로 COUNT 쿼리 없음)
+class CountRangeFilter(admin.SimpleListFilter):
+    field_name = None   # 하위 클래스에서 지정 ('like_count', 'comment_count')
+
+    # (URL 값, 화면 표시, 최소값, 최대값)
+    ranges = (
+        ('0', '없음', 0, 0),
+        ('1-9', '1 ~ 9', 1, 9),
+        ('10-99', '10 ~ 99', 10, 99),
+        ('100+', '100 이상', 100, None),
+    )
+
+    def lookups(self, request, model_admin):
+        return [(value, label) for value, label, _, _ in self.ranges]
+
+    def queryset(self, request, queryset):
+        for value, _, low, high in self.ranges:
+            if self.value() == value:
+                queryset = queryset.filter(**{f'{self.field_name}__gte': low})
+                if high is not None:
+                    queryset = queryset.filter(**{f'{self.field_name}__lte': high})
+                return queryset
+        return queryset
+
+
+class LikeCountFilter(CountRangeFilter):
+    title = '좋아요 수'
+    parameter_name = 'likes'
+    field_name = 'like_count'
+
+
+class CommentCountFilter(CountRangeFilter):
+    title = '댓글 수'
+    parameter_name = 'comments'
+    field_name = 'comment_count'
+
+# 작성일 연도 -> 월 필터 (post_created_idx 색인 사용)
+class CreatedDrillDownFilter(DateDrillDownFilter):
+    title = '작성일'
+    parameter_name = 'created'
+    field_name = 'created_at'
+
 # 게시글(Post) 관리 - 여기가 제일 중요!
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
-    # 목록에 보일 항목들 (제목, 작성자, 게시판, 조회수, 작성일)
-    list_display = ('title', 'author', 'board', 'views', 'created_at')
+class PostAdmin(FastChangelistMixin, admin.ModelAdmin):
+    # 목록에 보일 항목들 (제목, 작성자, 게시판, 조회수, 좋아요 수, 댓글 수, 작성일)
+    # 좋아요 수/댓글 수는 저장된 카운터 컬럼이라 클릭해서 정렬해도 가볍습니다.
+    list_display = ('title', 'author', 'board', 'views', 'like_count', 'comment_count', 'created_at')
+
+    # 작성자/게시판을 JOIN 으로 함께 가져옴 (줄마다 쿼리 N+1 방지), 목록에서는 본문을 읽지 않음
+    list_select_related = ('author', 'board')
+    changelist_defer = ('content',)
+
+    # 작성자/수정자/좋아요 누른 사람: 전체 사용자 <select> 대신 검색형 입력란
+    autocomplete_fields = ('author', 'update_author', 'likes')
+
+    # 우측 필터 사이드바 (게시판별, 작성일별, 좋아요/댓글 수 구간별 필터링)
+    # 작성일은 date_hierarchy(연도 목록을 구하려고 테이블 전체를 읽음) 대신 색인을 쓰는 연도 -> 월 필터
+    list_filter = ('board', CreatedDrillDownFilter, LikeCountFilter, CommentCountFilter)
 
-    # 우측 필터 사이드바 (게시판별, 작성일별 필터링)
-    list_filter = ('board', 'created_at')
+    # 카운터는 뷰와 reconcile_counts 명령으로만 관리하므로 직접 수정하지 않도록 읽기 전용
+    readonly_fields = ('like_count', 'comment_count')
 
     # 상단 검색창(제목, 내용, 작성자 닉네임으로 검색)
     # author__nickname: author(User) 모델의 nickname 필드를 검색하겠다는 뜻
     search_fields = ('title', 'content', 'author__nickname', 'author__username')
 
     # 날짜 계층 구조 (상단에 연도-월-일 네비게이션 생김)
-    date_hierarchy = 'created_at'
+    # -> 큰 테이블에서 느려서 CreatedDrillDownFilter 로 대체
+    #date_hierarchy = 'created_at'
+
+    # 기본 정렬: 최신 글 먼저 (기본키 색인, 목록/자동완성 검색 페이지가 매번 같은 순서)
+    ordering = ('-pk',)
 
     # 페이지당 보여줄 개수
     list_per_page = 20
 
+    # 제목/내용 검색은 LIKE 대신 전문 검색 색인(boards/search.py)을 사용
+    # 작성자 검색(author__nickname, author__username)만 기존 방식으로 처리합니다.
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        matched = search_posts(queryset, search_term).values('pk')
+        by_author = Q(author__nickname__icontains=search_term) | Q(author__username__icontains=search_term)
+        return queryset.filter(Q(pk__in=matched) | by_author), False
+
 # 댓글(comment) 관리
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(FastChangelistMixin, admin.ModelAdmin):
     list_display = ('content_summary', 'post', 'author', 'created_at')
     search_fields = ('content', 'author__username')
 
+    # 'post' 컬럼은 글의 __str__ ([게시판 이름] 제목) 이므로 글과 게시판까지 JOIN (2단계 N+1 방지)
+    # 함께 가져오는 글의 본문은 목록에 필요 없으므로 읽지 않음
+    list_select_related = ('post__board', 'author')
+    changelist_defer = ('post__content',)
+
+    # 글/작성자: 전체 목록 <select> 대신 검색형 입력란
+    autocomplete_fields = ('post', 'author')
+
     # 댓글 내용이 길 수 있으니 앞부분만 잘라서 보여주는 함수
     def content_summary(self, obj):
         return obj.content[:20] + "..." if len(obj.content) > 20 else obj.content
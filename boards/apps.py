@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BoardsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'boards'
+
+    def ready(self):
+        # 시그널(저장/삭제 후처리) 등록
+        from . import signals  # noqa: F401
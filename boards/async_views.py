@@ -0,0 +1,114 @@
+# 읽기 위주 화면의 async(ASGI 전용) 버전
+# ASGI 서버(uvicorn, daphne 등)에서 동기 뷰를 실행하면 요청마다 sync_to_async 스레드 전환이 일어납니다.
+# 여기 있는 뷰들은 Django async ORM(aget, acount, async for)을 사용해 이벤트 루프에서 바로 실행됩니다.
+# settings.ASYNC_READ_VIEWS = True 일 때 urls.py 에서 기존 뷰 대신 연결됩니다.
+#
+# [주의] async 뷰 안에서는 템플릿을 그리는 도중 DB 쿼리가 나가면 안 됩니다. (SynchronousOnlyOperation)
+# 그래서 템플릿에서 쓰는 관계(author, board 등)는 모두 select_related/prefetch 로 미리 가져오고,
+# queryset 은 list 로 평가한 뒤 넘깁니다.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import aget_object_or_404, render
+
+from accounts import unread
+from config.db_router import replica_reads
+
+from . import conditional, pagecache, registry, viewcount
+from .dashboard import abuild_home_context
+from .forms import CommentForm
+from .pagination import CachedCountPaginator, acached_count, acursor_paginate, count_cache_key, page_window
+from .views import board_list_queryset, count_view, post_detail_queryset
+
+
+async def _load_user(request):
+    # request.user 는 처음 접근할 때 DB를 조회하는 지연 객체라 async 뷰에서는 쓸 수 없습니다.
+    # auser() 로 미리 불러와서 request.user 를 바꿔두면 템플릿(base.html)에서도 안전하게 사용 가능
+    request.user = await request.auser()
+    # 상단 메뉴의 안 읽은 쪽지 배지도 같은 이유로 미리 구해 둡니다. (accounts/context_processors.py)
+    if request.user.is_authenticated:
+        request.unread_message_count = await unread.aunread_count(request.user.pk)
+    return request.user
+
+
+# 메인 페이지 (5개 구역을 동시에 가져옴)
+@replica_reads
+@login_required
+async def home(request):
+    user = await _load_user(request)
+    context = await abuild_home_context(user)
+    return render(request, 'home.html', context)
+
+
+# 게시판 목록
+@replica_reads
+@conditional.conditional_page(conditional.board_list_validators)
+@pagecache.cache_anonymous_page(lambda board_code: [pagecache.board_tag(board_code)])
+async def board_list(request, board_code):
+    await _load_user(request)
+    board = await registry.aget_or_404(board_code)
+
+    q = request.GET.get('q', '')
+    posts, sort = board_list_queryset(board, q, request.GET.get('sort', ''))
+    count_key = count_cache_key(board, q, scope='hot' if sort == 'hot' else '')
+
+    mode = request.GET.get('mode', getattr(settings, 'BOARD_LIST_PAGINATION', 'page'))
+    if mode == 'cursor' and not sort:
+        page_obj = await acursor_paginate(
+            posts,
+            after=request.GET.get('after'),
+            before=request.GET.get('before'),
+            per_page=10,
+        )
+        context = {
+            'board': board,
+            'posts': page_obj,
+            'q': q,
+            'sort': sort,
+            'cursor_mode': True,
+            'total_count': await acached_count(posts, count_key),
+        }
+        return render(request, 'boards/board_list.html', context)
+
+    # 전체 개수를 먼저 async 로 구해서 넣어두면 Paginator 가 COUNT 쿼리를 따로 실행하지 않습니다.
+    paginator = CachedCountPaginator(posts, 10, count_key=count_key)
+    paginator.count = await acached_count(posts, count_key)
+    page_obj = paginator.get_page(request.GET.get('page', 1))
+    # 잘린 queryset 을 여기서 평가 (템플릿에서 DB 조회가 일어나지 않도록)
+    page_obj.object_list = [post async for post in page_obj.object_list]
+
+    context = {
+        'board': board,
+        'posts': page_obj,
+        'q': q,
+        'sort': sort,
+        'page_range': page_window(page_obj, size=5),
+        'total_count': paginator.count,
+    }
+    return render(request, 'boards/board_list.html', context)
+
+
+# 게시글 상세
+@replica_reads
+@conditional.conditional_page(conditional.board_detail_validators, on_not_modified=count_view)
+@pagecache.cache_anonymous_page(
+    lambda board_code, pk: [pagecache.post_tag(pk)], on_hit=count_view,
+)
+async def board_detail(request, board_code, pk):
+    user = await _load_user(request)
+    # 게시판은 프로세스 캐시(boards/registry.py)에서 찾고, 글은 댓글 prefetch 까지 포함해서 한 번에 가져옵니다.
+    board = await registry.aget_or_404(board_code)
+    post = await aget_object_or_404(post_detail_queryset(user), pk=pk, board_id=board.pk)
+    post.board = board
+
+    post.views += viewcount.pending(post.pk)
+    response = render(request, 'boards/board_detail.html', {
+        'board': board,
+        'post': post,
+        'comments': post.comment_list,
+        'comment_form': CommentForm(),
+    })
+
+    # 버퍼링을 끈 설정(VIEW_COUNT_FLUSH_INTERVAL=0)에서는 바로 DB에 쓰므로 스레드에서 실행
+    await sync_to_async(count_view)(request, response, board_code, pk)
+    return response
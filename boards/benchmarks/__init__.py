@@ -0,0 +1,125 @@
+# 성능 측정 묶음 (python manage.py run_benchmarks <묶음> [옵션])
+# 측정마다 따로 있던 benchmark_* / loadtest_* 관리 명령을 묶음(suite) 하나당 모듈 하나로 모았습니다.
+#  - HELP               : 한 줄 설명 (python manage.py run_benchmarks --help 에 표시)
+#  - add_arguments(parser): 묶음 전용 옵션
+#  - run(out, options)  : 측정 결과를 out 에 출력하고 {시나리오 이름: {지표: 값}} 을 돌려줌
+# run_benchmarks 가 결과를 기준값 JSON(묶음별)에 저장하거나 비교합니다. (비교 규칙은 run_benchmarks 참고)
+# 통과/실패가 분명한 검사(쿼리 수, 색인 사용, 동시 요청 정확성 등)는 여기가 아니라
+# 각 앱의 tests.py 에 있습니다. (python manage.py test)
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+
+from boards.models import Board, Comment, HotPost, Post
+from boards.perf import percentile
+from boards.search import get_backend
+
+# run_benchmarks 에 등록되는 묶음 (이 패키지 안의 모듈 이름)
+SUITES = (
+    'pages', 'read_views', 'post_like', 'view_filter', 'db_connections',
+    'list_projection', 'trending', 'export', 'messages', 'tasks', 'viewcount',
+    'pagination', 'search', 'dashboard',
+)
+
+
+def latency_summary(latencies):
+    """지연 시간 목록(ms) -> {'p50_ms', 'p95_ms', 'p99_ms'}"""
+    return {f'p{pct}_ms': round(percentile(latencies, pct), 2) for pct in (50, 95, 99)}
+
+
+def measure(run, iterations, warmup=True):
+    """run() 을 iterations 번 실행한 지연 시간 목록(ms) - warmup 이면 첫 실행(캐시 채우기 등)은 제외"""
+    if warmup:
+        run()
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def peak_memory_kb(func):
+    """func() 실행 중 늘어난 최대 메모리(KB) - tracemalloc 기준 (느려지므로 시간 측정과 따로 실행)"""
+    tracemalloc.start()
+    try:
+        func()
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+class QueryCounter:
+    """with QueryCounter() as counter: ... -> counter.count (실행된 쿼리 수)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._wrapper = connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._wrapper.__exit__(*exc)
+
+
+def current_rss_mb():
+    """현재 프로세스의 메모리 사용량(RSS, MB) - Linux 는 /proc, 그 밖에는 지금까지의 최대값
+
+    Linux 에서는 파일과 공유하는 페이지를 뺀 값입니다. (SQLite mmap_size 로 DB 파일을 매핑하면
+    읽은 만큼 RSS 에 잡히지만, 이는 OS 페이지 캐시라서 프로세스가 붙잡고 있는 메모리가 아님)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident, shared = (int(value) for value in f.read().split()[1:3])
+        return (resident - shared) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+        except ImportError:     # Windows
+            return 0.0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@contextmanager
+def bench_board(name, title, users=1):
+    """측정용 게시판 + 사용자({name}_user_0 ...)를 만들고, 끝나면 그 안의 글/댓글/좋아요와 함께 지웁니다.
+
+    with bench_board('bench_trending', '인기글 벤치마크') as (board, users): ...
+    """
+    User = get_user_model()
+    members = [
+        User.objects.get_or_create(username=f'{name}_user_{i}', defaults={'nickname': f'{name}_user_{i}'})[0]
+        for i in range(users)
+    ]
+    board, _ = Board.objects.get_or_create(code=name, defaults={'title': title})
+    try:
+        yield board, members
+    finally:
+        delete_board_rows(board)
+        board.delete()
+        User.objects.filter(username__startswith=f'{name}_user_').delete()
+
+
+def delete_board_rows(board):
+    # 측정용 글/댓글은 대부분 bulk_create 로 시그널(검색 색인, 화면 캐시) 없이 넣었으므로 지울 때도 한 번에 지움
+    # (board.delete() 는 댓글/글마다 삭제 시그널을 보내서 글 100만 개면 수십 분이 걸림)
+    # 검색 색인도 글을 지우기 전에 뺍니다. (측정 중 화면/ORM 으로 쓴 글, index_many() 로 넣은 글)
+    posts = f'SELECT id FROM {Post._meta.db_table} WHERE board_id = %s'
+    HotPost.objects.filter(post__board=board).delete()
+    backend = get_backend()
+    with transaction.atomic(), connection.cursor() as cursor:
+        for post_id in Post.objects.filter(board=board).values_list('pk', flat=True).iterator():
+            backend.remove(post_id)
+        cursor.execute(f'DELETE FROM {Post.likes.through._meta.db_table} WHERE post_id IN ({posts})', [board.pk])
+        cursor.execute(f'DELETE FROM {Comment._meta.db_table} WHERE post_id IN ({posts})', [board.pk])
+        cursor.execute(f'DELETE FROM {Post._meta.db_table} WHERE board_id = %s', [board.pk])
@@ -0,0 +1,72 @@
+# 메인(home) 대시보드 지연 시간 (boards/dashboard.py)
+#   python manage.py run_benchmarks dashboard --iterations 200
+# 글/댓글/좋아요가 있는 임시 사용자로 로그인해서 home 을 요청하고 p50/p95/p99 와 쿼리 수를 비교합니다.
+#  - no_cache       : 구역 캐시 없이 매번 다섯 구역을 모두 조회 (예전 home)
+#  - cold           : 요청마다 전체 구역과 이 사용자 구역을 무효화 (글 작성 직후와 같음)
+#  - after_like     : 요청마다 사용자 구역만 무효화 (좋아요/댓글 직후와 같음)
+#  - warm           : 모든 구역이 캐시에 있음
+from unittest import mock
+
+from django.test import Client
+from django.urls import reverse
+
+from boards import dashboard
+from boards.models import Comment, Post
+
+from . import QueryCounter, bench_board, latency_summary, measure
+
+HELP = '메인 대시보드(home)의 캐시 상태별 p50/p95/p99 지연 시간과 쿼리 수를 비교합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--posts', type=int, default=50, help='임시 사용자가 쓴 글 수 (댓글/좋아요도 같은 수)')
+
+
+def run(out, options):
+    results = {}
+    with bench_board('bench_home', '메인 벤치마크') as (board, (user,)):
+        posts = Post.objects.bulk_create([
+            Post(board=board, author=user, title=f'메인 {i}', content='-') for i in range(options['posts'])
+        ])
+        Comment.objects.bulk_create([Comment(post=post, author=user, content='댓글') for post in posts])
+        user.like_posts.add(*posts)
+
+        client = Client()
+        client.force_login(user)
+        url = reverse('home')
+
+        def cold():
+            dashboard.invalidate_global()
+            dashboard.bump_user_version(user.pk)
+            return client.get(url)
+
+        def after_like():
+            dashboard.bump_user_version(user.pk)
+            return client.get(url)
+
+        def no_cache():
+            # 캐시를 비운 것처럼 항상 없음으로 읽고 저장도 하지 않음
+            with mock.patch.object(dashboard.cache, 'get_many', return_value={}), \
+                    mock.patch.object(dashboard.cache, 'set_many'):
+                return client.get(url)
+
+        scenarios = [
+            ('no_cache', no_cache),
+            ('cold', cold),
+            ('after_like', after_like),
+            ('warm', lambda: client.get(url)),
+        ]
+        for name, request in scenarios:
+            request()   # 세션/안 읽은 쪽지 수 등 첫 요청 비용 제외
+            with QueryCounter() as counter:
+                latencies = measure(request, options['iterations'], warmup=False)
+            results[name] = result = {
+                **latency_summary(latencies), 'queries': round(counter.count / options['iterations'], 1),
+            }
+            out.write(
+                f"{name:<12} p50 {result['p50_ms']:7.2f}ms  p95 {result['p95_ms']:7.2f}ms  "
+                f"p99 {result['p99_ms']:7.2f}ms  쿼리 {result['queries']:.1f}"
+            )
+        dashboard.invalidate_global()
+    return results
@@ -0,0 +1,98 @@
+# 게시판 내보내기(boards/export.py) 속도와 메모리
+#   python manage.py run_benchmarks export --sizes 10000 100000 1000000
+# 벤치마크 게시판의 글 수를 단계별로 늘리면서
+#  - jsonl / csv / jsonl.gz : BoardExport (묶음 단위 스트리밍), 결과는 버리고 크기만 셈
+#  - naive                  : 글과 댓글을 한 번에 읽어서 JSON 으로 만드는 경우 (--naive-limit 이하에서만)
+# 의 초당 행 수(글 + 댓글), 출력 크기, 실행 중 최대 RSS(파일 매핑 제외) 와 시작 시점 대비 증가량을 출력합니다.
+# 스트리밍은 게시판 크기가 커져도 RSS 증가량이 거의 그대로여야 합니다.
+# 글마다 댓글을 0 ~ --max-comments 개 붙입니다.
+import json
+import random
+import time
+
+from django.db.models import Prefetch
+
+from boards.export import BoardExport
+from boards.models import Comment, Post
+
+from . import bench_board, current_rss_mb
+
+HELP = '게시판 크기에 따른 내보내기 속도(초당 행 수)와 최대 메모리를 확인합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000], help='단계별 글 수')
+    parser.add_argument('--max-comments', type=int, default=2, help='글 하나에 붙일 최대 댓글 수')
+    parser.add_argument('--naive-limit', type=int, default=100000, help='이 글 수까지만 naive 방식도 측정')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def run(out, options):
+    rng = random.Random(options['seed'])
+    results = {}
+    with bench_board('bench_export', '내보내기 벤치마크') as (board, (user,)):
+        created = 0
+        for size in sorted(options['sizes']):
+            create_posts(rng, board, user, size - created, options['max_comments'])
+            created = size
+
+            out.write(f'[글 {size}개]')
+            scenarios = [
+                ('jsonl', lambda: stream(BoardExport(board, 'jsonl'))),
+                ('csv', lambda: stream(BoardExport(board, 'csv'))),
+                ('jsonl.gz', lambda: stream(BoardExport(board, 'jsonl', compress=True))),
+            ]
+            if size <= options['naive_limit']:
+                scenarios.append(('naive', lambda: naive(board)))
+            for name, export in scenarios:
+                before = current_rss_mb()
+                started = time.perf_counter()
+                rows, size_bytes, peak = export()
+                elapsed = time.perf_counter() - started
+                result = {
+                    'rows_per_s': round(rows / elapsed), 'output_mb': round(size_bytes / 1024 / 1024, 1),
+                    'rss_mb': round(peak, 1), 'rss_growth_mb': round(max(0.0, peak - before), 1),
+                }
+                results[f'{size} {name}'] = result
+                out.write(
+                    f"  {name:<9} {result['rows_per_s']:>10,} 행/초  {elapsed:7.1f}초  "
+                    f"출력 {result['output_mb']:8.1f}MB  최대 RSS {peak:7.1f}MB (+{result['rss_growth_mb']:.1f}MB)"
+                )
+    return results
+
+
+def stream(export):
+    size_bytes, peak = 0, current_rss_mb()
+    for chunk in export:
+        size_bytes += len(chunk)
+        peak = max(peak, current_rss_mb())
+    return export.posts + export.comments, size_bytes, peak
+
+
+def naive(board):
+    # 전체를 메모리에 올려서 한 번에 직렬화
+    posts = list(
+        Post.objects.filter(board=board).select_related('author')
+        .prefetch_related(Prefetch('comments', queryset=Comment.objects.select_related('author')))
+    )
+    body = json.dumps([
+        {'id': post.pk, 'author': post.author.username, 'title': post.title, 'content': post.content,
+         'comments': [{'id': c.pk, 'author': c.author.username, 'content': c.content} for c in post.comments.all()]}
+        for post in posts
+    ], ensure_ascii=False).encode('utf-8')
+    rows = len(posts) + sum(len(post.comments.all()) for post in posts)
+    return rows, len(body), current_rss_mb()
+
+
+def create_posts(rng, board, user, count, max_comments):
+    content = '내보내기 벤치마크 본문입니다. ' * 10
+    for start in range(0, count, 5000):
+        posts = Post.objects.bulk_create([
+            Post(board=board, author=user, title=f'내보내기 {start + i}', content=content)
+            for i in range(min(5000, count - start))
+        ])
+        Comment.objects.bulk_create([
+            Comment(post=post, author=user, content='댓글입니다.')
+            for post in posts
+            for _ in range(rng.randint(0, max_comments))
+        ])
@@ -0,0 +1,90 @@
+# 목록 queryset 의 컬럼 제한(only + excerpt) 전후 비교
+# 본문이 큰 글로 게시판을 채운 뒤, 목록/메인 화면의 글 목록 queryset 을
+#  - full     : 기존 방식 - 글 전체 컬럼(본문 content, 이미지 경로) + 작성자 전체 컬럼
+#  - projected: 지금 방식 - 보여주는 컬럼만 (only) + 미리보기(excerpt)
+# 으로 실행해서 DB에서 읽는 바이트 수, 최대 메모리, 시간을 비교합니다.
+# 마지막으로 실제 board_list 화면 요청 한 번의 최대 메모리와 시간도 출력합니다.
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from boards import dashboard
+from boards.models import Post, make_excerpt
+from boards.views import board_list_queryset
+
+from . import bench_board, latency_summary, measure, peak_memory_kb
+
+HELP = '목록 queryset 의 컬럼 제한(only + excerpt) 전후 읽는 바이트/메모리/시간을 비교합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--posts', type=int, default=200)
+    parser.add_argument('--body-kb', type=int, default=20, help='글 본문 크기(KB)')
+    parser.add_argument('--iterations', type=int, default=30)
+
+
+def bytes_read(queryset):
+    """queryset 의 SQL 을 직접 실행해서 DB에서 받아 온 값의 크기(바이트)를 더합니다."""
+    sql, params = queryset.query.sql_with_params()
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for row in cursor.fetchall():
+            for value in row:
+                if isinstance(value, str):
+                    total += len(value.encode('utf-8'))
+                elif isinstance(value, bytes):
+                    total += len(value)
+                elif value is not None:
+                    total += 8
+    return total
+
+
+def run(out, options):
+    results = {}
+    with override_settings(PAGE_CACHE_ENABLED=False), \
+            bench_board('bench_projection', '목록 컬럼 벤치마크') as (board, (user,)):
+        body = ('긴 본문 ' * 1024)[:options['body_kb'] * 1024 // 3]   # 한글은 UTF-8 3바이트
+        Post.objects.bulk_create([
+            Post(board=board, author=user, title=f'긴 글 {i}', content=body, excerpt=make_excerpt(body))
+            for i in range(options['posts'])
+        ])
+
+        # (이름, 기존 queryset, 지금 queryset) - 지금 queryset 은 views.LIST_FIELDS / dashboard.POST_LINK_FIELDS 와 같은 모양
+        scenarios = [
+            ('board_list(10)',
+             lambda: Post.objects.filter(board=board).select_related('author').order_by('-created_at', '-id')[:10],
+             lambda: board_list_queryset(board, '', '')[0][:10]),
+            ('home.my_posts(5)',
+             lambda: Post.objects.filter(author=user).select_related('board').order_by('-created_at')[:5],
+             lambda: (Post.objects.filter(author=user).select_related('board')
+                      .only(*dashboard.POST_LINK_FIELDS, 'views').order_by('-created_at')[:5])),
+        ]
+        out.write(f"{'':<28} {'읽은 바이트':>10} {'최대 메모리':>10} {'p50':>9} {'p95':>9}")
+        for name, full, projected in scenarios:
+            for label, build in (('full', full), ('projected', projected)):
+                result = {
+                    **latency_summary(measure(lambda: list(build()), options['iterations'])),
+                    'read_kb': round(bytes_read(build()) / 1024, 1),
+                    'peak_kb': peak_memory_kb(lambda: list(build())),
+                }
+                results[f'{name} {label}'] = result
+                out.write(
+                    f"{name + ' ' + label:<28} {result['read_kb']:>9.1f}KB {result['peak_kb']:>9.1f}KB "
+                    f"{result['p50_ms']:>7.2f}ms {result['p95_ms']:>7.2f}ms"
+                )
+
+        client = Client()
+        client.force_login(user)
+        url = reverse('boards:board_list', args=[board.code])
+        result = {
+            **latency_summary(measure(lambda: client.get(url), options['iterations'])),
+            'peak_kb': peak_memory_kb(lambda: client.get(url)),
+        }
+        results['board_list request'] = result
+        out.write(
+            f"board_list 요청      최대 메모리 {result['peak_kb']:.1f}KB  "
+            f"p50 {result['p50_ms']:.2f}ms  p95 {result['p95_ms']:.2f}ms"
+        )
+    return results
@@ -0,0 +1,62 @@
+# 쪽지함 조회 비용 (accounts/views.py message_list)
+# 쪽지를 많이 가진 사용자(임시로 만들고 끝나면 삭제)로 쪽지함을 열어서
+# 예전 방식(전체 목록 + 쪽지마다 상대방 조회)과 커서 페이징 방식의 쿼리 수와 시간을 비교합니다.
+from django.contrib.auth import get_user_model
+from django.test import Client
+
+from accounts.models import Message
+from boards.pagination import encode_cursor
+
+from . import QueryCounter, latency_summary, measure
+
+HELP = '쪽지가 많은 사용자의 쪽지함 조회 비용(쿼리 수, 시간)을 측정합니다.'
+
+BENCH_USERNAMES = ('bench_msg_sender', 'bench_msg_receiver')
+
+
+def add_arguments(parser):
+    parser.add_argument('--messages', type=int, default=10000, help='받은 쪽지 수')
+    parser.add_argument('--iterations', type=int, default=5, help='측정 반복 횟수')
+
+
+def run(out, options):
+    User = get_user_model()
+    User.objects.filter(username__in=BENCH_USERNAMES).delete()
+    sender = User.objects.create_user(BENCH_USERNAMES[0])
+    receiver = User.objects.create_user(BENCH_USERNAMES[1])
+    try:
+        Message.objects.bulk_create(
+            [Message(sender=sender, receiver=receiver, title=f'제목 {i}', content='내용') for i in range(options['messages'])],
+            batch_size=1000,
+        )
+        return measure_inbox(out, receiver, options['iterations'])
+    finally:
+        User.objects.filter(pk__in=[sender.pk, receiver.pk]).delete()
+
+
+def measure_inbox(out, user, iterations):
+    def legacy():
+        # 예전 message_list: 받은 쪽지 전체를 그리면서 쪽지마다 보낸 사람을 따로 조회
+        for msg in Message.objects.filter(receiver=user):
+            msg.sender.nickname
+
+    client = Client()
+    client.force_login(user)
+    # 중간쯤 쪽지 이후 페이지 (OFFSET 방식이면 뒤로 갈수록 느려지는 위치)
+    received = Message.objects.filter(receiver=user).order_by('-created_at', '-id')
+    middle = received[received.count() // 2]
+
+    scenarios = [
+        ('legacy_all_n_plus_1', legacy),
+        ('inbox_first_page', lambda: client.get('/accounts/messages/inbox/')),
+        ('inbox_middle_page', lambda: client.get(f'/accounts/messages/inbox/?after={encode_cursor(middle)}')),
+        ('outbox_first_page', lambda: client.get('/accounts/messages/outbox/')),
+    ]
+    results = {}
+    for name, request in scenarios:
+        request()   # 첫 요청은 제외
+        with QueryCounter() as counter:
+            latencies = measure(request, iterations, warmup=False)
+        results[name] = result = {**latency_summary(latencies), 'queries': round(counter.count / iterations, 1)}
+        out.write(f"{name:<22} 쿼리 {result['queries']:>8.1f}개  p50 {result['p50_ms']:9.2f}ms  p95 {result['p95_ms']:9.2f}ms")
+    return results
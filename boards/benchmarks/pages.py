@@ -0,0 +1,93 @@
+# 주요 화면 시나리오 (seed_data 로 만든 대량 데이터 사용)
+# 화면을 테스트 클라이언트로 반복 호출해서 시나리오별
+#  - 지연 시간 p50/p95/p99 (ms)
+#  - 요청당 쿼리 수
+#  - 최대 메모리 사용량 (tracemalloc, 요청 한 번 기준)
+# 을 기록합니다.
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from django.test import Client
+from django.urls import reverse
+
+from boards.models import Board, Post
+from boards.pagination import encode_cursor
+
+from . import QueryCounter, latency_summary, measure, peak_memory_kb
+
+HELP = '시드 데이터로 주요 화면(home, 목록, 상세, 좋아요, 쪽지함)의 지연 시간/쿼리 수/메모리를 측정합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--prefix', default='seed', help='seed_data 에서 사용한 prefix')
+    parser.add_argument('--iterations', type=int, default=30, help='시나리오별 반복 횟수')
+    parser.add_argument('--scenarios', nargs='+', help='실행할 시나리오 이름 (기본: 전부)')
+
+
+def run(out, options):
+    scenarios = build_scenarios(options['prefix'])
+    if options['scenarios']:
+        unknown = set(options['scenarios']) - {name for name, _ in scenarios}
+        if unknown:
+            raise CommandError(f"없는 시나리오: {', '.join(sorted(unknown))}")
+        scenarios = [(name, request) for name, request in scenarios if name in options['scenarios']]
+
+    results = {}
+    for name, request in scenarios:
+        results[name] = result = measure_scenario(name, request, options['iterations'])
+        out.write(
+            f"{name:<24} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+            f"p99 {result['p99_ms']:8.2f}ms  쿼리 {result['queries']:5.1f}  메모리 {result['peak_kb']:9.1f}KB"
+        )
+    return results
+
+
+def build_scenarios(prefix):
+    User = get_user_model()
+    board = Board.objects.filter(code__startswith=prefix).order_by('pk').first()
+    user = User.objects.filter(username__startswith=f'{prefix}_user_').order_by('pk').first()
+    if board is None or user is None:
+        raise CommandError(f"'{prefix}' 시드 데이터가 없습니다. 먼저 python manage.py seed_data 를 실행하세요.")
+
+    client = Client()
+    client.force_login(user)
+
+    posts = Post.objects.filter(board=board).order_by('-created_at', '-id')
+    total = posts.count()
+    if total == 0:
+        raise CommandError('시드 게시판에 글이 없습니다.')
+    middle = posts[total // 2]
+    latest = posts.first()
+
+    list_url = reverse('boards:board_list', args=[board.code])
+    detail_url = reverse('boards:board_detail', args=[board.code, latest.pk])
+    like_url = reverse('boards:post_like_toggle', args=[board.code, latest.pk])
+    deep_page = max(1, (total // 2) // 10)
+
+    # (시나리오 이름, 요청을 보내는 함수)
+    return [
+        ('home', lambda: client.get(reverse('home'))),
+        ('board_list', lambda: client.get(list_url)),
+        ('board_list_deep_page', lambda: client.get(f'{list_url}?page={deep_page}')),
+        ('board_list_deep_cursor', lambda: client.get(f'{list_url}?mode=cursor&after={encode_cursor(middle)}')),
+        ('board_list_search', lambda: client.get(f'{list_url}?q=성능')),
+        ('board_detail', lambda: client.get(detail_url)),
+        # 좋아요는 누를 때마다 상태가 바뀌므로 두 번(누르기 + 취소)을 한 번으로 측정합니다.
+        ('post_like', lambda: (client.post(like_url), client.post(like_url))[-1]),
+        ('message_list', lambda: client.get(reverse('accounts:message_list'))),
+    ]
+
+
+def measure_scenario(name, request, iterations):
+    def checked():
+        response = request()
+        if response.status_code != 200:
+            raise CommandError(f'{name}: 응답 코드 {response.status_code}')
+
+    checked()   # 첫 요청(캐시 채우기 등)은 측정에서 제외
+    with QueryCounter() as counter:
+        latencies = measure(checked, iterations, warmup=False)
+    return {
+        **latency_summary(latencies),
+        'queries': round(counter.count / iterations, 1),
+        'peak_kb': peak_memory_kb(checked),
+    }
@@ -0,0 +1,62 @@
+# 게시판 목록 뒤쪽 페이지 지연 시간 (boards/pagination.py)
+#   python manage.py run_benchmarks pagination --sizes 1000 10000 100000
+# 벤치마크 게시판의 글 수를 단계별로 늘리면서 목록 화면(화면 캐시 끔)을
+#  - first_page  : ?page=1
+#  - deep_offset : ?page=<마지막 페이지> (OFFSET 스캔, 글 수에 비례해서 느려짐)
+#  - deep_cursor : ?mode=cursor&after=<마지막 페이지 직전 글> (keyset, 글 수와 관계없이 비슷해야 함)
+# 으로 요청해서 p50/p95 와 쿼리 수를 비교합니다.
+import random
+
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from boards.models import Post
+from boards.pagination import CURSOR_ORDERING, encode_cursor
+
+from . import QueryCounter, bench_board, latency_summary, measure
+from .trending import create_posts
+
+HELP = '글 수에 따른 게시판 목록 뒤쪽 페이지 지연 시간(OFFSET / 커서)을 비교합니다.'
+
+PER_PAGE = 10
+
+
+def add_arguments(parser):
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='단계별 글 수')
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def run(out, options):
+    rng = random.Random(options['seed'])
+    client = Client()
+    results = {}
+    with override_settings(PAGE_CACHE_ENABLED=False), \
+            bench_board('bench_pagination', '페이징 벤치마크') as (board, (user,)):
+        url = reverse('boards:board_list', args=[board.code])
+        created = 0
+        for size in sorted(options['sizes']):
+            create_posts(rng, board, user, size - created)
+            created = size
+
+            last_page = (size + PER_PAGE - 1) // PER_PAGE
+            posts = Post.objects.filter(board=board).order_by(*CURSOR_ORDERING)
+            cursor = encode_cursor(posts[(last_page - 1) * PER_PAGE - 1])
+            scenarios = [
+                ('first_page', f'{url}?page=1'),
+                ('deep_offset', f'{url}?page={last_page}'),
+                ('deep_cursor', f'{url}?mode=cursor&after={cursor}'),
+            ]
+            out.write(f'[글 {size}개, 마지막 {last_page} 페이지]')
+            for name, path in scenarios:
+                client.get(path)    # 개수 캐시 채우기
+                with QueryCounter() as counter:
+                    latencies = measure(lambda: client.get(path), options['iterations'], warmup=False)
+                result = {**latency_summary(latencies), 'queries': round(counter.count / options['iterations'], 1)}
+                results[f'{size} {name}'] = result
+                out.write(
+                    f"  {name:<12} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+                    f"쿼리 {result['queries']:.1f}"
+                )
+    return results
@@ -0,0 +1,53 @@
+# 좋아요 토글 처리량
+# 임시 사용자 여러 명이 한 글의 좋아요를 동시에 계속 누르게 해서
+# 기존 방식(링크 -> 상세 페이지로 이동 후 다시 그리기)과 API(JSON) 방식의 처리량(req/s)을 비교합니다.
+# (동시 토글 뒤 like_count 가 실제 좋아요 수와 같은지는 boards/tests.py 에서 확인합니다.)
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import CommandError
+from django.test import Client
+from django.urls import reverse
+
+from boards.models import Post
+
+from . import bench_board
+
+HELP = '여러 사용자가 동시에 좋아요를 누를 때의 처리량(링크 방식 / JSON API)을 비교합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--users', type=int, default=20, help='동시에 누를 사용자 수')
+    parser.add_argument('--clicks', type=int, default=50, help='사용자별 누르는 횟수')
+
+
+def run(out, options):
+    results = {}
+    with bench_board('bench_like', '좋아요 벤치마크', users=options['users']) as (board, users):
+        post = Post.objects.create(board=board, author=users[0], title='좋아요', content='-')
+        redirect_url = reverse('boards:post_like', args=[board.code, post.pk])
+        api_url = reverse('boards:post_like_toggle', args=[board.code, post.pk])
+        scenarios = [
+            ('link_redirect', lambda client: client.get(redirect_url, follow=True)),
+            ('json_api', lambda client: client.post(api_url)),
+        ]
+        for name, click in scenarios:
+            total, elapsed = click_all(users, options['clicks'], click)
+            results[name] = {'rps': round(total / elapsed, 1)}
+            out.write(f"{name:<14} {total}회  {results[name]['rps']:8.1f} req/s")
+    return results
+
+
+def click_all(users, clicks, click):
+    def worker(user):
+        client = Client()
+        client.force_login(user)
+        for _ in range(clicks):
+            response = click(client)
+            if response.status_code != 200:
+                raise CommandError(f'응답 코드 {response.status_code}')
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(users)) as pool:
+        list(pool.map(worker, users))
+    return len(users) * clicks, time.perf_counter() - started
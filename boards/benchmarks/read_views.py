@@ -0,0 +1,114 @@
+# 읽기 화면(home, board_list, board_detail, message_list)을 세 가지 실행 방식으로 부하 테스트
+#  wsgi-sync : 기존 동기 뷰를 WSGI 핸들러로 실행 (지금 운영 방식)
+#  asgi-sync : 기존 동기 뷰를 ASGI 핸들러로 실행 (요청마다 sync_to_async 스레드 전환)
+#  asgi-async: async 뷰(boards/async_views.py)를 ASGI 핸들러로 실행
+# 처리량(req/s)과 지연 시간(p50/p95/p99)을 비교합니다.
+# 테스트 클라이언트로 프로세스 안에서 직접 호출하므로 네트워크 비용은 빠진 '핸들러 + 뷰' 비용입니다.
+import asyncio
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from django.test import AsyncClient, Client
+from django.urls import clear_url_caches
+
+from boards.models import Post
+
+from . import latency_summary
+
+HELP = '읽기 화면을 WSGI 동기 / ASGI 동기 / ASGI async 방식으로 부하 테스트합니다.'
+
+MODES = ('wsgi-sync', 'asgi-sync', 'asgi-async')
+
+
+def add_arguments(parser):
+    parser.add_argument('--username', required=True, help='로그인해서 요청할 사용자 아이디')
+    parser.add_argument('--board', default='free', help='목록/상세를 요청할 게시판 코드')
+    parser.add_argument('--requests', type=int, default=200, help='방식별, 화면별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=10, help='동시 요청 수')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+
+
+def use_async_views(enabled):
+    # urls.py 들은 import 시점에 ASYNC_READ_VIEWS 를 보고 뷰를 고르므로, 설정을 바꾼 뒤 다시 불러옵니다.
+    settings.ASYNC_READ_VIEWS = enabled
+    for module in ('boards.urls', 'accounts.urls', settings.ROOT_URLCONF):
+        importlib.reload(importlib.import_module(module))
+    clear_url_caches()
+
+
+def run(out, options):
+    User = get_user_model()
+    try:
+        user = User.objects.get(username=options['username'])
+    except User.DoesNotExist:
+        raise CommandError(f"사용자가 없습니다: {options['username']}")
+
+    board_code = options['board']
+    post = Post.objects.filter(board__code=board_code).order_by('-pk').first()
+    paths = ['/', f'/board/{board_code}/', '/accounts/messages/']
+    if post is not None:
+        paths.append(f'/board/{board_code}/{post.pk}')
+
+    results = {}
+    original = settings.ASYNC_READ_VIEWS
+    try:
+        for mode in options['modes']:
+            use_async_views(mode == 'asgi-async')
+            for path in paths:
+                if mode == 'wsgi-sync':
+                    latencies, elapsed = run_wsgi(user, path, options['requests'], options['concurrency'])
+                else:
+                    latencies, elapsed = asyncio.run(run_asgi(user, path, options['requests'], options['concurrency']))
+                result = {'rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0, **latency_summary(latencies)}
+                results[f'{mode} {path}'] = result
+                out.write(
+                    f"{mode:<11} {path:<28} {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.2f}ms  "
+                    f"p95 {result['p95_ms']:7.2f}ms  p99 {result['p99_ms']:7.2f}ms"
+                )
+    finally:
+        use_async_views(original)
+    return results
+
+
+def ensure_ok(response, path):
+    if response.status_code != 200:
+        raise CommandError(f'{path} 응답 코드 {response.status_code}')
+
+
+def run_wsgi(user, path, total, concurrency):
+    def worker(count):
+        client = Client()
+        client.force_login(user)
+        latencies = []
+        for _ in range(count):
+            started = time.perf_counter()
+            ensure_ok(client.get(path), path)
+            latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
+
+    counts = [total // concurrency + (1 if i < total % concurrency else 0) for i in range(concurrency)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(worker, counts))
+    return [lat for chunk in results for lat in chunk], time.perf_counter() - started
+
+
+async def run_asgi(user, path, total, concurrency):
+    client = AsyncClient()
+    await client.aforce_login(user)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            ensure_ok(await client.get(path), path)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(total)])
+    return latencies, time.perf_counter() - started
@@ -0,0 +1,84 @@
+# 게시글 검색 시간 (boards/search.py)
+#   python manage.py run_benchmarks search --sizes 1000 10000 100000
+# 벤치마크 게시판의 글 수를 단계별로 늘리면서, 게시판 목록 검색과 같은 일(첫 페이지 10개 + 전체 개수)을
+#  - icontains: 기존 방식 LIKE '%q%' (IcontainsBackend)
+#  - fts      : 현재 검색 백엔드 (SQLite FTS5 / PostgreSQL tsvector, 색인 테이블 JOIN)
+# 로 실행해서 검색어 종류(흔한 단어 / 드문 단어 / 두 단어 / 1글자)별 p50/p95 를 비교합니다.
+# 측정용 글은 bulk_create 로 넣으므로 검색 색인은 index_many() 로 따로 채웁니다. (지우는 것은 bench_board)
+import random
+
+from boards.models import Post
+from boards.search import IcontainsBackend, get_backend
+
+from . import bench_board, latency_summary, measure
+
+HELP = '글 수에 따른 게시글 검색 시간(기존 icontains / 전문 검색 색인)을 비교합니다.'
+
+# 흔한 단어일수록 앞쪽 (글마다 앞쪽 단어가 더 자주 뽑힘)
+WORDS = [
+    '게시판', '테스트', '검색', '성능', '데이터베이스', '캐시', '템플릿', '파이썬', '장고', '서버',
+    '배포', '프로필', '이미지', '댓글', '쪽지', '좋아요', '색인', '쿼리', '페이지', '공지',
+]
+QUERIES = [
+    ('common', '게시판'),
+    ('rare', '공지'),
+    ('two_words', '데이터베이스 성능'),
+    ('one_char', '지'),
+    ('no_match', '블록체인'),
+]
+
+
+def add_arguments(parser):
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='단계별 글 수')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def run(out, options):
+    rng = random.Random(options['seed'])
+    backends = [('icontains', IcontainsBackend()), ('fts', get_backend())]
+    out.write(f'검색 백엔드: {type(backends[1][1]).__name__}')
+    results = {}
+    with bench_board('bench_search', '검색 벤치마크') as (board, (user,)):
+        created = 0
+        for size in sorted(options['sizes']):
+            create_posts(rng, board, user, size - created)
+            created = size
+
+            out.write(f'[글 {size}개]')
+            posts = Post.objects.filter(board=board)
+            for label, q in QUERIES:
+                line = [f'  {label:<10} {q:<10}']
+                for name, backend in backends:
+                    result = latency_summary(measure(lambda: search_page(backend, posts, q), options['iterations']))
+                    results[f'{size} {label} {name}'] = result
+                    line.append(f"{name} p50 {result['p50_ms']:8.2f}ms p95 {result['p95_ms']:8.2f}ms")
+                out.write('  '.join(line))
+    return results
+
+
+def search_page(backend, posts, q):
+    # 게시판 목록 검색과 같은 일: 관련도(또는 최신) 순 첫 페이지 + 전체 개수
+    qs = backend.search(posts, q)
+    if 'search_rank' in qs.query.annotations:
+        qs = qs.order_by('-search_rank', '-created_at', '-id')
+    else:
+        qs = qs.order_by('-created_at', '-id')
+    list(qs[:10])
+    return qs.count()
+
+
+def create_posts(rng, board, user, count):
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+    backend = get_backend()
+    for start in range(0, count, 5000):
+        posts = Post.objects.bulk_create([
+            Post(
+                board=board, author=user,
+                title=' '.join(rng.choices(WORDS, weights, k=3)),
+                content=' '.join(rng.choices(WORDS, weights, k=40)),
+            )
+            for _ in range(min(5000, count - start))
+        ])
+        backend.index_many(Post.objects.filter(pk__in=[post.pk for post in posts]))
+
@@ -0,0 +1,120 @@
+# DB 작업 큐(tasks/queue.py)
+#   python manage.py run_benchmarks tasks --tasks 5000 --concurrency 4 --mode thread
+# 1) 워커 처리량: 빈 작업을 N개 넣고 워커가 모두 처리하는 속도 (작업마다 호출 / 묶음 처리)
+# 2) 요청 지연 시간: 부가 작업을 요청 안에서 할 때와 큐에 넘길 때의 p50/p95 비교
+#    - post_write_image : 이미지 첨부 글쓰기 (축소본 만들기)
+#    - board_detail_view: 조회수 반영 (VIEW_COUNT_FLUSH_INTERVAL=0, 매 조회마다 반영)
+import tempfile
+import time
+from io import BytesIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from PIL import Image
+
+from boards.models import Post
+from tasks import queue
+from tasks.management.commands.run_task_worker import run_workers
+from tasks.models import Task
+
+from . import bench_board, latency_summary, measure
+
+HELP = 'DB 작업 큐의 워커 처리량과, 작업을 큐로 넘겼을 때의 요청 지연 시간을 측정합니다.'
+
+# 처리량 측정용 빈 작업 - 이 모듈을 불러온 프로세스에만 등록됩니다.
+# (--mode process 의 자식 프로세스에서도 등록되도록 run_workers(imports=...) 로 넘김)
+WORKER_IMPORTS = (__name__,)
+
+
+@queue.task('benchmarks.noop')
+def noop(**payload):
+    pass
+
+
+@queue.task('benchmarks.noop_batch', batch=True)
+def noop_batch(payloads):
+    pass
+
+
+def add_arguments(parser):
+    parser.add_argument('--tasks', type=int, default=5000, help='처리량 측정에 넣을 작업 수')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--mode', choices=['thread', 'process'], default='thread')
+    parser.add_argument('--iterations', type=int, default=20, help='요청 지연 시간 측정 반복 횟수')
+
+
+def sample_image():
+    # 휴대폰 사진 정도 크기의 JPEG (축소본 만들기 비용을 재기 위함)
+    buffer = BytesIO()
+    Image.new('RGB', (2400, 1800), (120, 160, 200)).save(buffer, 'JPEG', quality=90)
+    return buffer.getvalue()
+
+
+def run(out, options):
+    # 다른 작업이 섞이지 않도록 비어 있는 큐에서만 측정
+    if Task.objects.filter(status__in=[Task.PENDING, Task.RUNNING]).exists():
+        raise CommandError('대기/실행 중인 작업이 있습니다. 먼저 run_task_worker --once 로 비우세요.')
+
+    results = {}
+    out.write('[워커 처리량]')
+    for name in ('benchmarks.noop', 'benchmarks.noop_batch'):
+        results[name] = measure_throughput(out, name, options['tasks'], options['concurrency'], options['mode'])
+
+    out.write('[요청 지연 시간: 요청 안에서 처리 vs 큐로 넘김]')
+    with tempfile.TemporaryDirectory() as media_root, \
+            override_settings(MEDIA_ROOT=media_root, PAGE_CACHE_ENABLED=False), \
+            bench_board('bench_tasks', '작업 큐 벤치마크') as (board, (user,)):
+        try:
+            results.update(measure_requests(out, board, user, options['iterations']))
+        finally:
+            Task.objects.filter(name__startswith='boards.').delete()
+    return results
+
+
+def measure_throughput(out, name, total, concurrency, mode):
+    started = time.perf_counter()
+    for i in range(total):
+        queue.enqueue(name, {'i': i})
+    enqueued = time.perf_counter() - started
+
+    started = time.perf_counter()
+    processed = run_workers(concurrency, mode, imports=WORKER_IMPORTS, once=True)
+    elapsed = time.perf_counter() - started
+    result = {'enqueue_per_s': round(total / enqueued), 'rps': round(processed / elapsed)}
+    out.write(
+        f"{name:<18} 넣기 {result['enqueue_per_s']:8}개/초  "
+        f"처리 {result['rps']:8}개/초  ({processed}개, 워커 {concurrency}개 {mode})"
+    )
+    return result
+
+
+def measure_requests(out, board, user, iterations):
+    client = Client()
+    client.force_login(user)
+    image = sample_image()
+    write_url = reverse('boards:board_write', args=[board.code])
+    post = Post.objects.create(board=board, author=user, title='조회수', content='-')
+    detail_url = reverse('boards:board_detail', args=[board.code, post.pk])
+
+    def write():
+        upload = SimpleUploadedFile('photo.jpg', image, content_type='image/jpeg')
+        return client.post(write_url, {'title': '사진', 'content': '-', 'image': upload})
+
+    def view():
+        # 쿠키가 없는 새 방문자 -> 매번 조회수 증가
+        return Client().get(detail_url)
+
+    results = {}
+    for name, request in (('post_write_image', write), ('board_detail_view', view)):
+        for label, queued in (('inline', False), ('queued', True)):
+            with override_settings(TASK_QUEUE_ENABLED=queued, THUMBNAIL_ASYNC=False, VIEW_COUNT_FLUSH_INTERVAL=0):
+                results[f'{name} {label}'] = result = latency_summary(measure(request, iterations))
+                out.write(f"{name:<18} {label:<7} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms")
+                if queued:
+                    started = time.perf_counter()
+                    drained = run_workers(1, once=True)
+                    out.write(f"{'':<18} 워커가 넘겨받은 작업 {drained}개 처리 {(time.perf_counter() - started) * 1000:.0f}ms")
+    return results
@@ -0,0 +1,75 @@
+# 인기글 조회 시간 (boards/trending.py)
+# 벤치마크 게시판의 글 수를 단계별로 늘리면서 인기글 조회 시간을 비교합니다.
+#  - views_sort   : 기존 방식 - Post.objects.order_by('-views')[:5] (누적 조회수, 시간 감쇠 없음)
+#  - decay_query  : 시간 감쇠 점수를 요청마다 계산하는 경우 (trending.compute(), 최근 글 전체를 읽음)
+#  - hot_top      : 미리 계산해 둔 순위 읽기 - 메인 (trending.top(limit=5))
+#  - hot_board    : 미리 계산해 둔 순위 읽기 - 게시판 인기순 탭 (trending.top(board, limit=10))
+# 그리고 순위 다시 계산(trending.refresh()) 한 번에 걸리는 시간을 출력합니다.
+# 글은 최근 1년에 고르게 퍼뜨리고, 조회수/좋아요/댓글 수는 무작위로 넣습니다.
+import random
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+
+from boards import trending
+from boards.management.commands.seed_data import SPREAD_DAYS, explicit_timestamps
+from boards.models import Post
+
+from . import bench_board, latency_summary, measure
+
+HELP = '글 수에 따른 인기글 조회 시간(기존 정렬 / 매번 계산 / 미리 계산한 순위)을 비교합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='단계별 글 수')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def run(out, options):
+    rng = random.Random(options['seed'])
+    results = {}
+    try:
+        with bench_board('bench_trending', '인기글 벤치마크') as (board, (user,)):
+            created = 0
+            for size in sorted(options['sizes']):
+                create_posts(rng, board, user, size - created)
+                created = size
+
+                started = time.perf_counter()
+                trending.refresh()
+                refresh_ms = (time.perf_counter() - started) * 1000
+
+                out.write(f'[글 {size}개] 순위 다시 계산 {refresh_ms:.1f}ms')
+                scenarios = [
+                    ('views_sort', lambda: list(Post.objects.select_related('board').order_by('-views')[:5])),
+                    ('decay_query', lambda: trending.compute()),
+                    ('hot_top', lambda: trending.top(limit=5)),
+                    ('hot_board', lambda: trending.top(board, limit=10)),
+                ]
+                for name, query in scenarios:
+                    result = latency_summary(measure(query, options['iterations']))
+                    results[f'{size} {name}'] = result
+                    out.write(f"  {name:<12} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms")
+    finally:
+        # 측정용 글이 빠진 순위로 되돌림
+        trending.refresh()
+    return results
+
+
+def create_posts(rng, board, user, count):
+    now = timezone.now()
+    fields = [Post._meta.get_field(name) for name in ('created_at', 'updated_at')]
+    with explicit_timestamps(*fields):
+        for start in range(0, count, 5000):
+            posts = []
+            for _ in range(min(5000, count - start)):
+                created_at = now - timedelta(seconds=rng.randrange(SPREAD_DAYS * 24 * 3600))
+                posts.append(Post(
+                    board=board, author=user, title='인기글 벤치마크', content='-',
+                    created_at=created_at, updated_at=created_at,
+                    views=rng.randrange(1000), like_count=rng.randrange(20),
+                    comment_count=rng.randrange(10),
+                ))
+            Post.objects.bulk_create(posts)
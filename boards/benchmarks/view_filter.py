@@ -0,0 +1,69 @@
+# 조회수 중복 방지 쿠키(boards/viewfilter.py, Bloom filter)
+# 하루에 읽은 글 수(n)별로
+#  - 거짓 양성 비율: 읽지 않은 글을 '읽음'으로 판단한 비율 (실측 / 이론값 (1 - e^(-k*n/m))^k)
+#  - Cookie 헤더 크기: 기존(글마다 hitboard_ 쿠키) / 변경(viewed 쿠키 하나)
+#  - 쿠키 파싱 시간: 요청마다 Django가 Cookie 헤더를 해석하는 시간 (parse_cookie)
+# 을 출력합니다. (거짓 음성 없음 / 문서의 거짓 양성 한도는 boards/tests.py 에서 확인합니다.)
+import math
+import random
+import time
+from datetime import date
+
+from django.http.cookie import parse_cookie
+
+from boards.viewfilter import COOKIE_NAME, ViewedFilter, _bits, _hashes
+
+HELP = '오늘 읽은 글 쿠키(Bloom filter)의 거짓 양성 비율과 요청 헤더 크기를 측정합니다.'
+
+# 로그인 사용자라면 항상 함께 실려 가는 쿠키 (헤더 크기 비교의 기준)
+BASE_COOKIES = {'sessionid': 'x' * 32, 'csrftoken': 'x' * 32}
+
+
+def add_arguments(parser):
+    parser.add_argument('--reads', type=int, nargs='+', default=[10, 50, 100, 200, 500], help='하루에 읽은 글 수')
+    parser.add_argument('--probes', type=int, default=100000, help='거짓 양성 확인에 쓸 읽지 않은 글 수')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def cookie_header(cookies):
+    return '; '.join(f'{name}={value}' for name, value in cookies.items())
+
+
+def parse_time_us(header, repeat=2000):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse_cookie(header)
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+
+def run(out, options):
+    rng = random.Random(options['seed'])
+    m, k = _bits(), _hashes()
+    out.write(f'Bloom filter: {m}비트, 해시 {k}개')
+    out.write(
+        f"{'읽은 글':>6} {'거짓양성(실측)':>14} {'(이론)':>8} {'헤더 기존':>10} {'헤더 변경':>10} "
+        f"{'파싱 기존':>10} {'파싱 변경':>10}"
+    )
+
+    results = {}
+    for n in options['reads']:
+        post_ids = rng.sample(range(1, 10_000_000), n + options['probes'])
+        read, unread = post_ids[:n], post_ids[n:]
+
+        viewed = ViewedFilter.from_cookie(None, date.today())
+        for pk in read:
+            viewed.add(pk)
+        rate = sum(pk in viewed for pk in unread) / len(unread)
+        expected = (1 - math.exp(-k * n / m)) ** k
+
+        old_header = cookie_header({**BASE_COOKIES, **{f'hitboard_free_{pk}': 'true' for pk in read}})
+        new_header = cookie_header({**BASE_COOKIES, COOKIE_NAME: viewed.to_cookie()})
+        old_us, new_us = parse_time_us(old_header), parse_time_us(new_header)
+        results[f'reads_{n}'] = {
+            'false_positive_rate': round(rate, 5), 'header_bytes': len(new_header), 'parse_us': round(new_us, 1),
+        }
+        out.write(
+            f'{n:>6} {rate:>14.4%} {expected:>8.4%} {len(old_header):>9}B {len(new_header):>9}B '
+            f'{old_us:>8.1f}us {new_us:>8.1f}us'
+        )
+    return results
@@ -0,0 +1,95 @@
+# 조회수 반영 처리량 (boards/viewcount.py)
+#   python manage.py run_benchmarks viewcount --threads 8 --hits 500
+# 여러 스레드가 한 글을 동시에 조회할 때
+#  - legacy_save  : 예전 방식 post.views += 1; post.save() (읽은 값을 다시 쓰므로 동시 요청끼리 덮어씀)
+#  - immediate    : 조회마다 UPDATE views = views + 1 (VIEW_COUNT_FLUSH_INTERVAL=0)
+#  - buffered     : 프로세스 메모리에 모았다가 한 번에 반영 (기본값)
+#  - buffered_shared: 공유 캐시(CACHES['default'])에 모았다가 반영 (VIEW_COUNT_SHARED_CACHE=True)
+# 의 초당 조회 수와 유실된 조회 수(기대값 - 실제 반영값)를 비교하고,
+# 상세 화면 요청(쿠키 없는 새 방문자)의 초당 요청 수를 immediate / buffered 로 비교합니다.
+import threading
+import time
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from boards import viewcount
+from boards.models import Post
+
+from . import bench_board
+
+HELP = '한 글을 동시에 조회할 때의 조회수 반영 처리량(초당 조회/요청 수)과 유실 수를 비교합니다.'
+
+
+def add_arguments(parser):
+    parser.add_argument('--threads', type=int, default=8, help='동시에 조회하는 스레드 수')
+    parser.add_argument('--hits', type=int, default=500, help='스레드별 조회 수')
+    parser.add_argument('--requests', type=int, default=50, help='상세 화면 측정의 스레드별 요청 수')
+
+
+def legacy_save(post_id):
+    # 읽은 값 + 1 을 다시 쓰는 부분만 재현 (save() 의 시그널 - 검색 색인, 화면 캐시 무효화 - 은 빼고 잼)
+    post = Post.objects.get(pk=post_id)
+    Post.objects.filter(pk=post_id).update(views=post.views + 1)
+
+
+SCENARIOS = [
+    ('legacy_save', legacy_save, {'VIEW_COUNT_FLUSH_INTERVAL': 0}),
+    ('immediate', viewcount.record_hit, {'VIEW_COUNT_FLUSH_INTERVAL': 0}),
+    ('buffered', viewcount.record_hit, {'VIEW_COUNT_FLUSH_INTERVAL': 10}),
+    ('buffered_shared', viewcount.record_hit, {'VIEW_COUNT_FLUSH_INTERVAL': 10, 'VIEW_COUNT_SHARED_CACHE': True}),
+]
+
+
+def run(out, options):
+    threads, hits = options['threads'], options['hits']
+    results = {}
+    with override_settings(PAGE_CACHE_ENABLED=False, TASK_QUEUE_ENABLED=False), \
+            bench_board('bench_views', '조회수 벤치마크') as (board, (user,)):
+        post = Post.objects.create(board=board, author=user, title='조회수', content='-')
+
+        out.write(f'[조회 기록: 스레드 {threads}개 x {hits}회]')
+        for name, hit, overrides in SCENARIOS:
+            with override_settings(**overrides):
+                Post.objects.filter(pk=post.pk).update(views=0)
+                elapsed = run_threads(threads, lambda: [hit(post.pk) for _ in range(hits)])
+                elapsed += _timed(viewcount.stop_flusher)   # 버퍼에 남은 조회수를 DB에 반영하는 시간까지 포함
+            post.refresh_from_db(fields=['views'])
+            total = threads * hits
+            results[name] = {'rps': round(total / elapsed), 'lost': total - post.views}
+            out.write(f"  {name:<16} 초당 {results[name]['rps']:>9,}회  유실 {results[name]['lost']}회")
+
+        detail_url = reverse('boards:board_detail', args=[board.code, post.pk])
+        out.write(f"[상세 화면 요청: 스레드 {threads}개 x {options['requests']}회]")
+        for name, interval in (('board_detail immediate', 0), ('board_detail buffered', 10)):
+            with override_settings(VIEW_COUNT_FLUSH_INTERVAL=interval):
+                # 쿠키가 없는 새 방문자 -> 매번 조회수 증가
+                elapsed = run_threads(threads, lambda: [Client().get(detail_url) for _ in range(options['requests'])])
+                viewcount.stop_flusher()
+            results[name] = {'rps': round(threads * options['requests'] / elapsed, 1)}
+            out.write(f"  {name:<24} 초당 {results[name]['rps']:8.1f}요청")
+    return results
+
+
+def run_threads(count, work):
+    def worker():
+        try:
+            work()
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def _timed(func):
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
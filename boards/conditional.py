@@ -0,0 +1,168 @@
+# 조건부 요청(Conditional GET) 처리 (board_list, board_detail)
+# 브라우저가 예전에 받은 화면의 ETag / Last-Modified 를 If-None-Match / If-Modified-Since 로 보내면,
+# 그 사이 바뀐 것이 없을 때 화면을 다시 그리지 않고 본문 없는 304 응답만 돌려줍니다.
+# 바뀌었는지는 템플릿을 그리기 전에 판단합니다.
+# 화면 캐시 태그 버전(boards/pagecache.py)은 워커끼리 공유되어야 하므로 화면 캐시를 켠 경우(공유 캐시)에만 씁니다.
+#  - 게시판 목록
+#    공유 캐시: 그 게시판 글들의 MAX(updated_at) (post_board_updated_idx 색인 끝 한 줄) + 게시판 태그 버전
+#              (시각이 남지 않는 변경 - 글 삭제, 좋아요 수, 댓글 수, 인기 순위 - 은 태그 버전으로 구분)
+#    그 밖(locmem 등): 태그 버전은 워커마다 따로라서 믿을 수 없으므로 DB 집계 한 번으로 대신합니다.
+#              MAX(updated_at), COUNT(*)(삭제), SUM(like_count), SUM(comment_count)
+#              (?sort=hot 이면 그 게시판 인기 순위의 MAX(computed_at) 도)
+#  - 게시글 상세
+#    공유 캐시: 글 태그 버전만 사용 - 쿼리 없음
+#              (글 수정/삭제, 댓글, 좋아요는 모두 글 태그 버전을 올리므로 DB 시각을 따로 볼 필요가 없습니다.)
+#    그 밖: 글 한 줄 + 댓글 MAX(updated_at) 를 읽어 updated_at, 댓글 수정 시각, like_count, comment_count 로 계산
+#           (글이 없으면 검증 없이 뷰에서 404)
+#  - 조회수는 어느 쪽으로도 ETag 를 바꾸지 않습니다. (화면 캐시와 마찬가지로 조회수 표시는 늦게 반영될 수 있음)
+#  - 로그인 사용자는 상단 메뉴(닉네임, 프로필 사진, 안 읽은 쪽지 배지)가 사람마다 다르므로 ETag 에 함께 넣습니다.
+#    (이 부분은 시각으로 표현할 수 없어서 로그인 사용자에게는 Last-Modified 를 보내지 않습니다.)
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.models import Count, Max, Sum
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from accounts import unread
+
+from . import pagecache, registry
+from .models import HotPost, Post
+
+
+def _etag_version():
+    # 템플릿을 바꿔서 배포할 때 값을 바꾸면 브라우저에 남은 예전 화면을 모두 다시 받게 됩니다.
+    return getattr(settings, 'PAGE_ETAG_VERSION', '1')
+
+
+def _user_part(request):
+    user = request.user
+    if not user.is_authenticated:
+        return 'anon'
+    avatar = user.avatar.name if user.avatar else ''
+    return f'{user.pk}:{user.nickname}:{avatar}:{unread.unread_count(user.pk)}'
+
+
+def _shared_versions():
+    # 태그 버전을 워커끼리 공유하는지 (화면 캐시를 켰으면 공유 캐시 - config/settings.py)
+    return getattr(settings, 'PAGE_CACHE_ENABLED', False)
+
+
+def _validators(request, db_modified, tags, counts=()):
+    """(ETag, Last-Modified 초) 계산
+
+    db_modified 는 DB에서 구한 마지막 수정 시각 (태그 버전만 쓰면 None),
+    counts 는 시각이 남지 않는 변경을 구분하기 위해 ETag 에 함께 넣을 DB 값들 (글 수, 좋아요 수 등)
+    """
+    versions = pagecache.tag_versions(tags)
+    modified = pagecache.changed_at(versions)
+    if db_modified is not None:
+        modified = max(modified or 0, db_modified.timestamp())
+
+    source = '|'.join([
+        _etag_version(), _user_part(request), *tags, *map(str, versions), str(db_modified), *map(str, counts),
+    ])
+    # 같은 내용이어도 CSRF 토큰 등으로 바이트가 달라질 수 있으므로 약한(W/) ETag
+    etag = f'W/"{hashlib.md5(source.encode("utf-8")).hexdigest()}"'
+    last_modified = int(modified) if modified is not None and not request.user.is_authenticated else None
+    return etag, last_modified
+
+
+def board_list_validators(request, board_code):
+    board = registry.get(board_code)
+    if board is None:
+        # 게시판이 없음 -> 검증 없이 뷰에서 404 처리
+        return None, None
+    posts = Post.objects.filter(board_id=board.pk)
+    if _shared_versions():
+        # MAX() 대신 ORDER BY ... LIMIT 1 로 가져와야 색인 끝 한 줄만 읽습니다.
+        db_modified = posts.order_by('-updated_at').values_list('updated_at', flat=True).first()
+        return _validators(request, db_modified, [pagecache.board_tag(board_code)])
+
+    stats = posts.aggregate(
+        modified=Max('updated_at'), count=Count('pk'), likes=Sum('like_count'), comments=Sum('comment_count'),
+    )
+    counts = [stats['count'], stats['likes'], stats['comments']]
+    if request.GET.get('sort') == 'hot':
+        # refresh_trending 이 순위를 바꾸면 그 게시판 HotPost 줄을 새로 씀 (computed_at)
+        counts.append(HotPost.objects.filter(board_id=board.pk).aggregate(at=Max('computed_at'))['at'])
+    return _validators(request, stats['modified'], [], counts)
+
+
+def board_detail_validators(request, board_code, pk):
+    board = registry.get(board_code)
+    if board is None:
+        # 게시판이 없음 -> 검증 없이 뷰에서 404 처리
+        return None, None
+    if _shared_versions():
+        # 글이 지워졌으면 글 태그 버전이 바뀌어 ETag 가 맞지 않으므로 뷰에서 404
+        return _validators(request, None, [pagecache.post_tag(pk)])
+
+    row = (
+        Post.objects.filter(pk=pk, board_id=board.pk)
+        .annotate(last_comment=Max('comments__updated_at'))
+        .values_list('updated_at', 'last_comment', 'like_count', 'comment_count')
+        .first()
+    )
+    if row is None:
+        # 글이 없음 -> 뷰에서 404
+        return None, None
+    updated_at, last_comment, like_count, comment_count = row
+    db_modified = max(filter(None, (updated_at, last_comment)))
+    return _validators(request, db_modified, [], [like_count, comment_count])
+
+
+def _finish(request, response, etag, last_modified):
+    if response.status_code not in (200, 304):
+        return response
+    if etag is not None:
+        response.headers.setdefault('ETag', etag)
+    if last_modified is not None and not response.has_header('Last-Modified'):
+        response.headers['Last-Modified'] = http_date(last_modified)
+    # no-cache: 브라우저가 저장해 둔 화면을 쓰기 전에 매번 확인(재검증)하도록
+    # private: 로그인 사용자 화면은 중간 프록시가 저장하지 않도록
+    if request.user.is_authenticated:
+        patch_cache_control(response, no_cache=True, private=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def conditional_page(validators, on_not_modified=None):
+    """ETag / Last-Modified 를 붙이고 바뀐 것이 없으면 304 를 돌려주는 뷰 데코레이터 (sync/async 뷰 모두 사용 가능)
+
+    validators     : (request, **kwargs) -> (ETag, Last-Modified 초) 를 돌려주는 함수
+    on_not_modified: 304 를 돌려줄 때 실행할 함수 (request, response, **kwargs) - 조회수 등
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view(request, *args, **kwargs)
+                etag, last_modified = await sync_to_async(validators)(request, **kwargs)
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                elif response.status_code == 304 and on_not_modified is not None:
+                    await sync_to_async(on_not_modified)(request, response, **kwargs)
+                return await sync_to_async(_finish)(request, response, etag, last_modified)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            etag, last_modified = validators(request, **kwargs)
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            elif response.status_code == 304 and on_not_modified is not None:
+                on_not_modified(request, response, **kwargs)
+            return _finish(request, response, etag, last_modified)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,54 @@
+# Post.like_count / Post.comment_count (역정규화 카운터) 보정 도구
+# 뷰에서는 F() 식으로 +1/-1 하지만, 관리자 페이지에서 지우거나 회원 탈퇴로 댓글이 함께
+# 삭제되는 경우 등에는 카운터가 실제 값과 어긋날 수 있습니다.
+# reconcile_counts()는 실제 COUNT와 다른 글만 골라 한 번에 UPDATE 합니다.
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def like_count_subquery(post_model):
+    # SELECT COUNT(*) FROM boards_post_likes WHERE post_id = boards_post.id
+    through = post_model.likes.through
+    counts = through.objects.filter(post=OuterRef('pk')).values('post').annotate(c=Count('pk')).values('c')
+    return Coalesce(Subquery(counts), 0)
+
+
+def comment_count_subquery(comment_model):
+    # SELECT COUNT(*) FROM boards_comment WHERE post_id = boards_post.id
+    counts = comment_model.objects.filter(post=OuterRef('pk')).values('post').annotate(c=Count('pk')).values('c')
+    return Coalesce(Subquery(counts), 0)
+
+
+def reconcile_counts(post_model=None, comment_model=None, chunk_size=5000):
+    """카운터가 어긋난 글을 찾아 실제 값으로 고치고, 고친 글 개수를 반환합니다.
+
+    글 번호(pk) 순으로 chunk_size개씩 나눠 처리하므로 글이 많아도 한 번에 잠그지 않습니다.
+    (마이그레이션에서는 과거 버전 모델을 넘겨서 사용합니다.)
+    """
+    if post_model is None:
+        from .models import Comment, Post
+        post_model, comment_model = Post, Comment
+
+    repaired = 0
+    last_pk = 0
+    while True:
+        # 글 번호 순으로 chunk_size개씩 (OFFSET 없이 pk > 마지막 번호 로 이어서 읽음)
+        pks = list(
+            post_model.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:chunk_size]
+        )
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        drifted = list(
+            post_model.objects.filter(pk__in=pks)
+            .annotate(real_likes=like_count_subquery(post_model), real_comments=comment_count_subquery(comment_model))
+            .filter(~Q(like_count=F('real_likes')) | ~Q(comment_count=F('real_comments')))
+            .values_list('pk', flat=True)
+        )
+        if drifted:
+            repaired += post_model.objects.filter(pk__in=drifted).update(
+                like_count=like_count_subquery(post_model),
+                comment_count=comment_count_subquery(comment_model),
+            )
+    return repaired
@@ -0,0 +1,228 @@
+# 메인(home) 대시보드 구역(section)별 데이터 제공 + 캐시
+# 기존 home 뷰는 요청마다 5개의 쿼리를 모두 실행했습니다.
+# 여기서는 화면을 구역 단위로 나누고 각 구역의 결과(리스트)를 캐시에 저장합니다.
+#  - 전체 공통 구역 (hot_posts, free_posts) : 모든 사용자가 같은 키를 공유
+#      -> 글 작성/수정/삭제 시 invalidate_global() 로 바로 삭제
+#  - 사용자별 구역 (my_posts, my_comments, like_posts) : 사용자마다 버전 번호가 붙은 키
+#      -> 그 사용자가 글/댓글/좋아요를 바꾸면 bump_user_version() 으로 버전을 올려
+#         예전 키를 더 이상 읽지 않게 함 (지울 키를 일일이 찾을 필요 없음)
+import asyncio
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.core.cache import cache
+
+from .models import Comment, Post
+
+CACHE_KEY_PREFIX = 'home'
+
+
+# ----------------------------------------------------------------------------
+# 구역별 데이터 제공 함수
+# 캐시에는 queryset이 아니라 평가된 list가 들어가므로, 템플릿에서 쓰는 관계(board, author, post)를
+# select_related 로 함께 가져와야 화면을 그릴 때 추가 쿼리가 나가지 않습니다.
+# 또 only() 로 home.html 에서 쓰는 컬럼만 읽습니다. (본문 content 등은 읽지도, 캐시에 넣지도 않음)
+# ----------------------------------------------------------------------------
+
+# 구역 공통: 글 링크(게시판 코드 + 글 번호)와 제목
+POST_LINK_FIELDS = ('title', 'board__code', 'board__title')
+
+def hot_posts():
+    # 전체 게시판 통합 인기글 TOP 5
+    # 기존: 누적 조회수 순 (Post.objects.order_by('-views')[:5]) -> 오래된 글이 계속 상위
+    # 변경: 조회수/좋아요/댓글 + 시간 감쇠 점수로 미리 계산해 둔 순위 (boards/trending.py)
+    #       (refresh_trending 을 아직 돌리지 않아 순위가 없으면 조회수 순)
+    from . import trending
+
+    return trending.top(limit=5)
+
+
+def free_posts():
+    # 자유게시판(free) 최신글 Top 5 (게시판이 없으면 빈 리스트)
+    return list(
+        Post.objects.filter(board__code='free').select_related('board', 'author')
+        .only(*POST_LINK_FIELDS, 'created_at', 'author__username').order_by('-created_at')[:5]
+    )
+
+
+def my_posts(user):
+    # 내가 쓴 글(최신순 5개)
+    return list(
+        Post.objects.filter(author=user).select_related('board')
+        .only(*POST_LINK_FIELDS, 'views').order_by('-created_at')[:5]
+    )
+
+
+def my_comments(user):
+    # 내가 쓴 댓글 (최신순 5개) - 댓글이 달린 글과 그 글의 게시판까지 함께
+    return list(
+        Comment.objects.filter(author=user).select_related('post__board')
+        .only('content', 'post__title', 'post__board__code').order_by('-created_at')[:5]
+    )
+
+
+def like_posts(user):
+    # 내가 좋아요 한 글(최신순 5개)
+    return list(
+        user.like_posts.select_related('board', 'author')
+        .only(*POST_LINK_FIELDS, 'author__username').order_by('-id')[:5]
+    )
+
+
+GLOBAL_SECTIONS = {
+    'hot_posts': hot_posts,
+    'free_posts': free_posts,
+}
+
+USER_SECTIONS = {
+    'my_posts': my_posts,
+    'my_comments': my_comments,
+    'like_posts': like_posts,
+}
+
+
+# ----------------------------------------------------------------------------
+# 캐시 키 / 무효화
+# ----------------------------------------------------------------------------
+
+def _global_timeout():
+    return getattr(settings, 'HOME_GLOBAL_CACHE_TIMEOUT', 60)
+
+
+def _user_timeout():
+    return getattr(settings, 'HOME_USER_CACHE_TIMEOUT', 300)
+
+
+def global_key(section):
+    return f'{CACHE_KEY_PREFIX}:global:{section}'
+
+
+def _user_version_key(user_id):
+    return f'{CACHE_KEY_PREFIX}:user:{user_id}:version'
+
+
+def _new_version():
+    # 버전 키가 캐시에서 사라졌을 때 예전 번호(1, 2, ...)로 돌아가 오래된 캐시를 다시 읽지 않도록
+    # 현재 시각(밀리초)을 시작 번호로 사용합니다.
+    return int(time.time() * 1000)
+
+
+def user_version(user_id):
+    version = cache.get(_user_version_key(user_id))
+    if version is None:
+        version = _new_version()
+        if not cache.add(_user_version_key(user_id), version, timeout=None):
+            version = cache.get(_user_version_key(user_id), version)
+    return version
+
+
+def user_key(user_id, version, section):
+    return f'{CACHE_KEY_PREFIX}:user:{user_id}:v{version}:{section}'
+
+
+def invalidate_global():
+    """전체 공통 구역 캐시 삭제 (글 작성/수정/삭제 시)"""
+    cache.delete_many([global_key(section) for section in GLOBAL_SECTIONS])
+
+
+def bump_user_version(user_id):
+    """사용자별 구역 캐시 무효화: 버전 번호를 올려서 예전 캐시를 버립니다."""
+    if user_id is None:
+        return
+    key = _user_version_key(user_id)
+    if not cache.add(key, _new_version(), timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_version(), timeout=None)
+
+
+# ----------------------------------------------------------------------------
+# 대시보드 조립
+# ----------------------------------------------------------------------------
+
+def build_home_context(user):
+    """home.html 에 넘길 구역별 데이터를 캐시에서 꺼내고, 없는 구역만 새로 계산합니다."""
+    version = user_version(user.pk)
+    keys = {global_key(section): (section, provider, ()) for section, provider in GLOBAL_SECTIONS.items()}
+    keys.update({
+        user_key(user.pk, version, section): (section, provider, (user,))
+        for section, provider in USER_SECTIONS.items()
+    })
+
+    # 캐시 왕복을 한 번으로 줄이기 위해 get_many 사용
+    cached = cache.get_many(list(keys))
+
+    context = {}
+    missing_global, missing_user = {}, {}
+    for key, (section, provider, args) in keys.items():
+        if key in cached:
+            context[section] = cached[key]
+            continue
+        context[section] = provider(*args)
+        if args:
+            missing_user[key] = context[section]
+        else:
+            missing_global[key] = context[section]
+
+    if missing_global:
+        cache.set_many(missing_global, _global_timeout())
+    if missing_user:
+        cache.set_many(missing_user, _user_timeout())
+    return context
+
+
+# ----------------------------------------------------------------------------
+# 대시보드 조립 (async 버전, boards/async_views.py 의 home 에서 사용)
+# ----------------------------------------------------------------------------
+
+def _run_in_own_thread(provider, *args):
+    # 구역마다 별도 스레드(=별도 DB 연결)에서 실행하므로, 끝나면 그 스레드의 연결을 정리합니다.
+    try:
+        return provider(*args)
+    finally:
+        close_old_connections()
+
+
+async def abuild_home_context(user):
+    """build_home_context() 의 async 버전
+
+    캐시에 없는 구역들을 순서대로가 아니라 동시에(asyncio.gather) 가져옵니다.
+    Django의 async ORM 호출은 내부적으로 한 스레드에서 차례로 실행되므로,
+    구역별 쿼리를 실제로 동시에 돌리기 위해 thread_sensitive=False 로 각각 다른 스레드에서 실행합니다.
+    """
+    version = await sync_to_async(user_version)(user.pk)
+    keys = {global_key(section): (section, provider, ()) for section, provider in GLOBAL_SECTIONS.items()}
+    keys.update({
+        user_key(user.pk, version, section): (section, provider, (user,))
+        for section, provider in USER_SECTIONS.items()
+    })
+
+    cached = await cache.aget_many(list(keys))
+
+    missing = [key for key in keys if key not in cached]
+    results = await asyncio.gather(*[
+        sync_to_async(_run_in_own_thread, thread_sensitive=False)(keys[key][1], *keys[key][2])
+        for key in missing
+    ])
+    fetched = dict(zip(missing, results))
+
+    context = {}
+    missing_global, missing_user = {}, {}
+    for key, (section, provider, args) in keys.items():
+        if key in cached:
+            context[section] = cached[key]
+            continue
+        context[section] = fetched[key]
+        if args:
+            missing_user[key] = fetched[key]
+        else:
+            missing_global[key] = fetched[key]
+
+    if missing_global:
+        await cache.aset_many(missing_global, _global_timeout())
+    if missing_user:
+        await cache.aset_many(missing_user, _user_timeout())
+    return context
@@ -0,0 +1,182 @@
+# 게시판 데이터 내보내기 (분석/백업용, JSONL 또는 CSV, 선택적으로 gzip)
+# 관리자 페이지 말고는 데이터를 꺼낼 방법이 없었고, list(Post.objects.all()) 처럼 한 번에 읽으면
+# 글 수만큼 메모리를 씁니다. 여기서는 글을 글 번호(pk) 순으로 EXPORT_BATCH_SIZE 개씩 나눠 읽고
+# (OFFSET 없이 pk > 마지막 번호 로 이어서 읽는 keyset 방식), 그 글들의 댓글은 iterator() 로 흘려 읽으면서
+# 묶음마다 바로 문자열(bytes)로 바꿔 내보냅니다. -> 메모리 사용량은 게시판 크기와 관계없이 묶음 하나만큼
+#
+# 사용처
+#  - python manage.py export_board <게시판 코드> --format csv --gzip -o free.csv.gz
+#  - 관리자 전용 URL /board/<게시판 코드>/export/?format=jsonl&gzip=1 (StreamingHttpResponse)
+#  - python manage.py run_benchmarks export 로 초당 행 수 / 최대 메모리를 확인할 수 있습니다.
+#
+# 형식
+#  - jsonl: 글 하나당 한 줄, 댓글은 그 줄의 "comments" 배열
+#  - csv  : 글 한 줄 다음에 그 글의 댓글 줄들 (record 컬럼이 post / comment, 댓글 줄의 post_id 로 연결)
+# 좋아요 수/댓글 수는 Post 의 카운터 컬럼 값입니다. (어긋났다면 먼저 python manage.py reconcile_counts)
+# 묶음마다 따로 읽으므로 내보내는 도중에 쓰인 글/댓글은 포함될 수도, 안 될 수도 있습니다. (전체 스냅숏 아님)
+import csv
+import json
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Comment, Post
+
+FORMATS = ('jsonl', 'csv')
+
+POST_COLUMNS = (
+    'pk', 'board__code', 'author__username', 'title', 'content', 'created_at', 'updated_at',
+    'views', 'like_count', 'comment_count',
+)
+COMMENT_COLUMNS = ('pk', 'post_id', 'author__username', 'content', 'created_at', 'updated_at')
+
+CSV_HEADER = (
+    'record', 'id', 'post_id', 'board', 'author', 'title', 'content', 'created_at', 'updated_at',
+    'views', 'like_count', 'comment_count',
+)
+
+CONTENT_TYPES = {
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def _batch_size():
+    return getattr(settings, 'EXPORT_BATCH_SIZE', 2000)
+
+
+class _Echo:
+    # csv.writer 가 쓴 한 줄을 그대로 돌려받기 위한 파일 흉내 (writerow() 의 반환값 = 쓴 문자열)
+    def write(self, value):
+        return value
+
+
+class BoardExport:
+    """게시판(board=None 이면 전체) 글/댓글을 bytes 조각으로 내보내는 iterable
+
+    for chunk in BoardExport(board, 'csv', compress=True): out.write(chunk)
+    다 돌고 나면 posts / comments 에 내보낸 개수가 남습니다.
+    """
+
+    def __init__(self, board=None, fmt='jsonl', compress=False, batch_size=None, using='default'):
+        if fmt not in FORMATS:
+            raise ValueError(f'지원하지 않는 형식입니다: {fmt} ({", ".join(FORMATS)})')
+        self.board = board
+        self.fmt = fmt
+        self.compress = compress
+        self.batch_size = batch_size or _batch_size()
+        self.using = using
+        self.posts = 0
+        self.comments = 0
+
+    @property
+    def content_type(self):
+        return 'application/gzip' if self.compress else CONTENT_TYPES[self.fmt]
+
+    @property
+    def filename(self):
+        name = f"{self.board.code if self.board else 'all'}-{timezone.localdate():%Y%m%d}.{self.fmt}"
+        return name + '.gz' if self.compress else name
+
+    def __iter__(self):
+        chunks = self._text_chunks()
+        return _gzip(chunks) if self.compress else chunks
+
+    def __aiter__(self):
+        """ASGI 용: 묶음 하나씩 스레드에서 만들어서 넘겨줍니다.
+
+        (StreamingHttpResponse 는 ASGI 에서 일반 iterator 를 받으면 전부 list() 로 읽은 뒤 보내므로)
+        DB 연결이 스레드마다 따로라서, 같은 iterator 는 항상 같은 스레드(thread_sensitive)에서 진행합니다.
+        """
+        return _async_chunks(iter(self))
+
+    # ------------------------------------------------------------------------
+
+    def _batches(self):
+        """[(글 값 tuple, [댓글 값 tuple, ...]), ...] 을 글 번호 순으로 batch_size 개씩"""
+        posts = Post.objects.using(self.using)
+        if self.board is not None:
+            posts = posts.filter(board=self.board)
+        posts = posts.order_by('pk').values_list(*POST_COLUMNS)
+
+        last_pk = 0
+        while True:
+            batch = list(posts.filter(pk__gt=last_pk)[:self.batch_size])
+            if not batch:
+                return
+            last_pk = batch[-1][0]
+
+            by_post = {row[0]: [] for row in batch}
+            comments = (
+                Comment.objects.using(self.using).filter(post_id__in=list(by_post))
+                .order_by('post_id', 'pk').values_list(*COMMENT_COLUMNS)
+                .iterator(chunk_size=self.batch_size)
+            )
+            for comment in comments:
+                by_post[comment[1]].append(comment)
+            yield [(row, by_post[row[0]]) for row in batch]
+
+    def _text_chunks(self):
+        writer = csv.writer(_Echo()) if self.fmt == 'csv' else None
+        if writer is not None:
+            yield writer.writerow(CSV_HEADER).encode('utf-8')
+
+        for batch in self._batches():
+            lines = []
+            for post, comments in batch:
+                if writer is None:
+                    lines.append(json.dumps(_post_record(post, comments), ensure_ascii=False) + '\n')
+                else:
+                    lines.append(writer.writerow(_post_row(post)))
+                    lines.extend(writer.writerow(_comment_row(comment)) for comment in comments)
+                self.posts += 1
+                self.comments += len(comments)
+            yield ''.join(lines).encode('utf-8')
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def _post_record(post, comments):
+    pk, board, author, title, content, created_at, updated_at, views, like_count, comment_count = post
+    return {
+        'id': pk, 'board': board, 'author': author, 'title': title, 'content': content,
+        'created_at': _iso(created_at), 'updated_at': _iso(updated_at),
+        'views': views, 'like_count': like_count, 'comment_count': comment_count,
+        'comments': [
+            {'id': c_pk, 'author': c_author, 'content': c_content,
+             'created_at': _iso(c_created), 'updated_at': _iso(c_updated)}
+            for c_pk, _, c_author, c_content, c_created, c_updated in comments
+        ],
+    }
+
+
+def _post_row(post):
+    pk, board, author, title, content, created_at, updated_at, views, like_count, comment_count = post
+    return ('post', pk, '', board, author, title, content, _iso(created_at), _iso(updated_at),
+            views, like_count, comment_count)
+
+
+def _comment_row(comment):
+    pk, post_id, author, content, created_at, updated_at = comment
+    return ('comment', pk, post_id, '', author, '', content, _iso(created_at), _iso(updated_at), '', '', '')
+
+
+def _gzip(chunks, level=6):
+    # gzip 헤더를 붙이는 zlib 압축기로 조각마다 압축 (파일 전체를 메모리에 모으지 않음)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def _async_chunks(iterator):
+    done = object()
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(iterator, done)) is not done:
+        yield chunk
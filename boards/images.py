@@ -0,0 +1,186 @@
+# 업로드 이미지 썸네일/WebP 변환 모듈
+# 게시글 이미지(Post.image)와 프로필 사진(User.avatar)은 올린 원본 그대로 저장되고,
+# 화면에서는 20~32px 아바타로 보여주면서도 브라우저는 매번 원본 전체를 내려받았습니다.
+# 여기서는 업로드 후 크기별(THUMBNAIL_SIZES) 축소본을 WebP + 원본 형식(JPEG/PNG)으로 만들어 둡니다.
+#  - 변환은 요청 처리와 분리된 작업 스레드(큐)에서 실행됩니다. (업로드 응답이 느려지지 않음)
+#  - 축소본 경로에는 원본 경로/크기/형식으로 만든 해시가 들어가므로, 이미지를 바꾸면 URL도 바뀝니다.
+#    (브라우저/CDN 캐시를 오래 유지해도 예전 그림이 보이지 않음)
+#  - 템플릿에서는 {% load image_tags %} 의 {% picture %}, {% thumbnail_url %} 로 알맞은 축소본을 고릅니다.
+import hashlib
+import logging
+import os
+import queue
+import threading
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = 'thumbs'
+CACHE_KEY_PREFIX = 'imgvariant'
+
+# 형식별 저장 옵션
+WEBP = 'webp'
+SAVE_OPTIONS = {
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 4},
+    'jpg': {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True},
+    'png': {'format': 'PNG', 'optimize': True},
+}
+
+
+def sizes():
+    # 만들어 둘 축소본 가로 크기(px) 목록 (작은 것부터)
+    return sorted(getattr(settings, 'THUMBNAIL_SIZES', (64, 320, 960)))
+
+
+def fallback_format(name):
+    # WebP 를 못 쓰는 브라우저용 형식: PNG/GIF(투명 배경 가능)는 png, 나머지는 jpg
+    ext = os.path.splitext(name)[1].lower()
+    return 'png' if ext in ('.png', '.gif') else 'jpg'
+
+
+def pick_size(width):
+    """요청한 표시 크기(width)를 고화질(2배) 화면까지 덮는 가장 작은 축소본 크기"""
+    wanted = width * 2
+    for size in sizes():
+        if size >= wanted:
+            return size
+    return sizes()[-1]
+
+
+def variant_name(name, size, fmt):
+    """원본 경로 + 크기 + 형식으로 결정되는 축소본 저장 경로
+
+    예) board/images/2025/12/01/cat.jpg, 320, webp
+        -> thumbs/board/images/2025/12/01/cat.320w.1a2b3c4d.webp
+    """
+    digest = hashlib.sha1(f'{name}:{size}:{fmt}'.encode('utf-8')).hexdigest()[:8]
+    base = os.path.splitext(name)[0]
+    return f'{THUMBNAIL_DIR}/{base}.{size}w.{digest}.{fmt}'
+
+
+def _ready_key(path):
+    return f'{CACHE_KEY_PREFIX}:{hashlib.sha1(path.encode("utf-8")).hexdigest()}'
+
+
+def variant_ready(path):
+    """축소본 파일이 만들어졌는지 (캐시에 기록해 두고, 없으면 저장소를 한 번 확인)"""
+    key = _ready_key(path)
+    ready = cache.get(key)
+    if ready is None:
+        ready = default_storage.exists(path)
+        # 아직 안 만들어졌으면 잠깐만 기억 (작업 스레드가 곧 만들 수 있으므로)
+        cache.set(key, ready, None if ready else 60)
+    return ready
+
+
+def variant_url(field, width, fmt=WEBP):
+    """템플릿용: 표시 크기에 맞는 축소본 URL. 아직 없으면 원본 URL"""
+    if not field:
+        return ''
+    if not getattr(settings, 'THUMBNAIL_ENABLED', True):
+        return field.url
+    name = field.name
+    if fmt != WEBP:
+        fmt = fallback_format(name)
+    path = variant_name(name, pick_size(width), fmt)
+    if variant_ready(path):
+        return default_storage.url(path)
+    return field.url
+
+
+def needs_processing(name):
+    # 가장 큰 WebP 축소본은 마지막에 만들어지므로, 그것이 있으면 처리가 끝난 원본입니다.
+    return bool(name) and not variant_ready(variant_name(name, sizes()[-1], WEBP))
+
+
+def process(name, force=False):
+    """원본(name)으로 모든 크기/형식의 축소본을 만들고 {경로: 바이트 수}를 반환합니다."""
+    created = {}
+    with default_storage.open(name, 'rb') as source:
+        original = Image.open(source)
+        original.load()
+    # 휴대폰 사진의 회전 정보(EXIF)를 실제 픽셀에 반영
+    original = ImageOps.exif_transpose(original)
+
+    fallback = fallback_format(name)
+    for size in sizes():
+        image = original.copy()
+        # 원본보다 크게 늘리지는 않음 (작은 원본이면 원본 크기 그대로 형식만 변환)
+        image.thumbnail((size, size * 10), Image.Resampling.LANCZOS)
+        for fmt in (fallback, WEBP):
+            path = variant_name(name, size, fmt)
+            if not force and default_storage.exists(path):
+                continue
+            converted = image
+            if fmt == 'jpg' and image.mode not in ('RGB', 'L'):
+                converted = image.convert('RGB')
+            elif fmt in ('png', 'webp') and image.mode == 'P':
+                converted = image.convert('RGBA')
+            buffer = BytesIO()
+            converted.save(buffer, **SAVE_OPTIONS[fmt])
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            default_storage.save(path, ContentFile(buffer.getvalue()))
+            cache.set(_ready_key(path), True, None)
+            created[path] = buffer.tell()
+    return created
+
+
+# ----------------------------------------------------------------------------
+# 작업 큐 (요청 처리 스레드와 분리)
+# ----------------------------------------------------------------------------
+
+_queue = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _run_worker():
+    while True:
+        name = _queue.get()
+        try:
+            process(name)
+        except Exception:
+            # 깨진 이미지 등: 원본은 그대로 보이므로 기록만 남기고 다음 작업으로
+            logger.exception('썸네일 생성 실패: %s', name)
+        finally:
+            _queue.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_worker, name='thumbnail-worker', daemon=True)
+            _worker.start()
+
+
+def enqueue(name):
+    """축소본 만들기를 작업 큐에 넣고 바로 돌아갑니다."""
+    if not name:
+        return
+    from tasks import queue as task_queue
+
+    if task_queue.enabled():
+        # DB 작업 큐 사용: 워커(run_task_worker)가 처리, 같은 이미지가 이미 대기 중이면 한 번만
+        task_queue.enqueue('boards.make_thumbnails', {'name': name}, dedup_key=f'thumbnail:{name}')
+        return
+    if not getattr(settings, 'THUMBNAIL_ASYNC', True):
+        # 설정으로 끈 경우(테스트 등): 그 자리에서 바로 처리
+        process(name)
+        return
+    _ensure_worker()
+    _queue.put(name)
+
+
+def wait_for_queue():
+    """큐에 들어간 작업이 모두 끝날 때까지 기다립니다. (관리 명령/테스트용)"""
+    _queue.join()
@@ -0,0 +1,55 @@
+# 좋아요 토글 (post_like, post_like_toggle 뷰에서 사용)
+# 기존에는 '눌렀는지 확인(SELECT) -> 추가/삭제 -> like_count 갱신' 을 따로 실행해서
+# 같은 사용자가 동시에 두 번 누르면 둘 다 '안 눌렀음'으로 보고 처리가 꼬일 수 있었습니다.
+# 여기서는 한 트랜잭션 안에서
+#  1) 먼저 DELETE 해 보고, 지워진 줄이 있으면 '취소'
+#  2) 없으면 INSERT ... ON CONFLICT DO NOTHING 으로 추가 (동시에 들어온 INSERT 는 하나만 성공)
+#  3) 실제로 지워졌거나 추가된 경우에만 like_count 를 ±1
+# 하므로 몇 번을 동시에 눌러도 중간 테이블과 like_count 가 어긋나지 않습니다.
+from django.db import connection, transaction
+from django.db.models import F
+
+from .models import Post
+
+Like = Post.likes.through
+
+# INSERT ... ON CONFLICT DO NOTHING 을 지원하는 DB (SQLite 3.24+, PostgreSQL 9.5+)
+ON_CONFLICT_VENDORS = ('sqlite', 'postgresql')
+
+
+def _insert_like(post_id, user_id):
+    """좋아요 줄을 추가하고, 실제로 추가되었으면 True (이미 있으면 False)"""
+    if connection.vendor not in ON_CONFLICT_VENDORS:
+        _, created = Like.objects.get_or_create(post_id=post_id, user_id=user_id)
+        return created
+
+    table = connection.ops.quote_name(Like._meta.db_table)
+    post_column = connection.ops.quote_name(Like._meta.get_field('post').column)
+    user_column = connection.ops.quote_name(Like._meta.get_field('user').column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} ({post_column}, {user_column}) VALUES (%s, %s) ON CONFLICT DO NOTHING',
+            [post_id, user_id],
+        )
+        return cursor.rowcount == 1
+
+
+def toggle_like(post_id, user_id):
+    """좋아요를 누르거나 취소하고 (좋아요 상태, 새 좋아요 수)를 반환합니다.
+
+    글이 없으면 Post.DoesNotExist 를 발생시킵니다.
+    """
+    with transaction.atomic():
+        deleted, _ = Like.objects.filter(post_id=post_id, user_id=user_id).delete()
+        if deleted:
+            liked = False
+            Post.objects.filter(pk=post_id, like_count__gt=0).update(like_count=F('like_count') - 1)
+        else:
+            liked = True
+            if _insert_like(post_id, user_id):
+                Post.objects.filter(pk=post_id).update(like_count=F('like_count') + 1)
+
+        # 글이 없으면 여기서 DoesNotExist -> 트랜잭션 전체 취소
+        # (Django가 만드는 외래 키는 커밋 시점에 검사하므로 위의 INSERT 는 아직 오류가 나지 않습니다.)
+        like_count = Post.objects.filter(pk=post_id).values_list('like_count', flat=True).get()
+    return liked, like_count
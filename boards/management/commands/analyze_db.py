@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from config.admin_perf import estimated_row_count
+from accounts.models import User
+from boards.models import Comment, Post
+
+
+# 사용법: python manage.py analyze_db --sample 1000
+# DB 통계(테이블 행 수, 색인 분포)를 갱신합니다. (cron 등으로 하루 한 번 정도)
+#  - SQLite    : PRAGMA analysis_limit = N; ANALYZE  (색인마다 N줄 표본만 읽어서 빠름) -> sqlite_stat1
+#  - PostgreSQL: ANALYZE (autovacuum 이 평소에도 갱신하므로 대량 입력 직후에만 필요) -> pg_class.reltuples
+# 관리자 목록 화면의 추정 개수(config/admin_perf.py)와 쿼리 실행 계획이 이 통계를 사용합니다.
+class Command(BaseCommand):
+    help = 'DB 통계를 갱신하고 주요 테이블의 추정 행 수를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sample', type=int, default=1000, help='(SQLite) 색인마다 읽을 표본 줄 수 (0 = 전부)')
+
+    def handle(self, *args, **options):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f"PRAGMA analysis_limit = {int(options['sample'])}")
+                cursor.execute('ANALYZE')
+            elif connection.vendor == 'postgresql':
+                cursor.execute('ANALYZE')
+            else:
+                raise CommandError(f'지원하지 않는 DB 입니다: {connection.vendor}')
+
+        for model in (Post, Comment, User):
+            estimate = estimated_row_count(model)
+            self.stdout.write(f'{model._meta.db_table:<16} 추정 {estimate if estimate is not None else "-":>10}  실제 {model.objects.count():>10}')
+        self.stdout.write(self.style.SUCCESS('통계 갱신 완료'))
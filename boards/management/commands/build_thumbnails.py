@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from boards import images
+from boards.models import Post
+
+
+def uploaded_images():
+    # 축소본을 만들 원본 파일 경로 (게시글 첨부 이미지 + 프로필 사진)
+    User = get_user_model()
+    yield from Post.objects.exclude(image='').exclude(image__isnull=True).values_list('image', flat=True).iterator()
+    yield from User.objects.exclude(avatar='').exclude(avatar__isnull=True).values_list('avatar', flat=True).iterator()
+
+
+# 사용법: python manage.py build_thumbnails [--force]
+# 이미 올라와 있는 이미지들의 축소본(썸네일/WebP)을 만듭니다.
+# 축소본 기능을 처음 켰을 때, THUMBNAIL_SIZES 를 바꿨을 때 실행합니다.
+# (작업 큐를 거치지 않고 이 명령 안에서 바로 변환합니다.)
+class Command(BaseCommand):
+    help = '업로드된 이미지들의 썸네일/WebP 축소본을 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='이미 있는 축소본도 다시 만듭니다.')
+
+    def handle(self, *args, **options):
+        done = failed = 0
+        original_bytes = variant_bytes = 0
+        for name in uploaded_images():
+            if not default_storage.exists(name):
+                self.stderr.write(f'원본 파일 없음: {name}')
+                failed += 1
+                continue
+            try:
+                created = images.process(name, force=options['force'])
+            except Exception as exc:
+                self.stderr.write(f'변환 실패: {name} ({exc})')
+                failed += 1
+                continue
+            done += 1
+            if created:
+                original_bytes += default_storage.size(name)
+                variant_bytes += sum(created.values())
+                self.stdout.write(f'{name}: 축소본 {len(created)}개')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: {done}건 (실패 {failed}건), 새로 만든 축소본 {variant_bytes:,} bytes / 원본 {original_bytes:,} bytes'
+        ))
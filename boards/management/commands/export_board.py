@@ -0,0 +1,53 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from boards import registry
+from boards.export import FORMATS, BoardExport
+
+
+# 사용법: python manage.py export_board free --format csv --gzip -o free.csv.gz
+#         python manage.py export_board --format jsonl > all.jsonl   (게시판 코드를 생략하면 전체 게시판)
+# 게시판의 글과 댓글(좋아요 수/댓글 수 포함)을 JSONL 또는 CSV 로 내보냅니다. (boards/export.py)
+# 글 번호 순으로 묶음씩 읽어서 바로 쓰므로 게시판 크기와 관계없이 메모리 사용량이 일정합니다.
+# --database replica_1 처럼 복제 DB에서 읽으면 원본 DB에 부담을 주지 않습니다.
+class Command(BaseCommand):
+    help = '게시판 글/댓글을 JSONL 또는 CSV 로 내보냅니다. (분석/백업용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board', nargs='?', help='게시판 코드 (생략하면 전체 게시판)')
+        parser.add_argument('--format', choices=FORMATS, default='jsonl')
+        parser.add_argument('--gzip', action='store_true', help='gzip 으로 압축')
+        parser.add_argument('-o', '--output', default='-', help="저장할 파일 경로 (기본 '-' = 표준 출력)")
+        parser.add_argument('--batch-size', type=int, default=None, help='한 번에 읽을 글 수 (기본 EXPORT_BATCH_SIZE)')
+        parser.add_argument('--database', default='default', help='읽을 DB 별칭')
+
+    def handle(self, *args, **options):
+        board = None
+        if options['board']:
+            board = registry.get(options['board'])
+            if board is None:
+                raise CommandError(f"게시판이 없습니다: {options['board']}")
+
+        export = BoardExport(
+            board, options['format'], compress=options['gzip'],
+            batch_size=options['batch_size'], using=options['database'],
+        )
+        started = time.perf_counter()
+        if options['output'] == '-':
+            self.write(export, sys.stdout.buffer)
+        else:
+            with open(options['output'], 'wb') as out:
+                self.write(export, out)
+        elapsed = time.perf_counter() - started
+
+        # 진행 결과는 stderr 로 (표준 출력으로 내보내는 경우 데이터와 섞이지 않도록)
+        self.stderr.write(self.style.SUCCESS(
+            f'내보내기 완료: 글 {export.posts}개, 댓글 {export.comments}개, {elapsed:.1f}초'
+        ))
+
+    def write(self, export, out):
+        for chunk in export:
+            out.write(chunk)
+        out.flush()
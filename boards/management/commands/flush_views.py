@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from boards import viewcount
+
+
+# 사용법: python manage.py flush_views
+# 버퍼(공유 캐시 포함)에 쌓여 있는 조회수를 즉시 DB에 반영합니다.
+# (배포 직전이나 조회수 통계를 바로 확인하고 싶을 때 사용)
+class Command(BaseCommand):
+    help = '버퍼에 쌓인 게시글 조회수를 즉시 DB에 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='공유 캐시를 훑을 때 한 번에 읽을 글 개수')
+
+    def handle(self, *args, **options):
+        updated = viewcount.flush_all(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'조회수 반영 완료: 게시글 {updated}건'))
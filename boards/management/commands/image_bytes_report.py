@@ -0,0 +1,83 @@
+import re
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from boards.models import Post
+
+# <picture> 안에서는 브라우저가 <source>(WebP) 하나만 받고, 그 외에는 <img src> 를 받습니다.
+PICTURE_PATTERN = re.compile(r'<picture>.*?</picture>', re.S)
+SOURCE_PATTERN = re.compile(r'<source[^>]*\bsrcset="([^"]+)"')
+IMG_PATTERN = re.compile(r'<img[^>]*\bsrc="([^"]+)"')
+
+
+def downloaded_images(html):
+    """브라우저(WebP 지원)가 이 화면에서 내려받을 이미지 URL 목록 (같은 URL은 한 번만)"""
+    urls = []
+    for block in PICTURE_PATTERN.findall(html):
+        urls.extend(SOURCE_PATTERN.findall(block)[:1] or IMG_PATTERN.findall(block)[:1])
+    urls.extend(IMG_PATTERN.findall(PICTURE_PATTERN.sub('', html)))
+    return list(dict.fromkeys(urls))
+
+
+def media_bytes(urls):
+    # 업로드 파일(MEDIA_URL 아래)만 셉니다. (정적 파일, 외부 CDN 제외)
+    total = 0
+    for url in urls:
+        if url.startswith(settings.MEDIA_URL):
+            total += default_storage.size(url[len(settings.MEDIA_URL):])
+    return total
+
+
+# 사용법: python manage.py image_bytes_report --username admin
+# 주요 화면을 원본 이미지(THUMBNAIL_ENABLED=False)와 축소본으로 각각 그려서
+# 화면 하나를 열 때 내려받는 업로드 이미지 용량을 비교합니다.
+# (먼저 python manage.py build_thumbnails 로 축소본을 만들어 두어야 합니다.)
+class Command(BaseCommand):
+    help = '화면별로 내려받는 이미지 용량을 원본/축소본 기준으로 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', required=True, help='로그인해서 요청할 사용자 아이디')
+        parser.add_argument('--board', default='free', help='상세 화면을 볼 게시판 코드')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"사용자가 없습니다: {options['username']}")
+
+        board_code = options['board']
+        paths = ['/', f'/board/{board_code}/', '/accounts/messages/']
+        # 첨부 이미지가 있는 최신 글 (없으면 그냥 최신 글)
+        posts = Post.objects.filter(board__code=board_code).order_by('-pk')
+        post = posts.exclude(image='').exclude(image__isnull=True).first() or posts.first()
+        if post is not None:
+            paths.append(f'/board/{board_code}/{post.pk}')
+
+        client = Client()
+        client.force_login(user)
+        total_before = total_after = 0
+        with override_settings(ALLOWED_HOSTS=['testserver', *settings.ALLOWED_HOSTS]):
+            for path in paths:
+                with override_settings(THUMBNAIL_ENABLED=False):
+                    before = media_bytes(downloaded_images(self.render(client, path)))
+                after = media_bytes(downloaded_images(self.render(client, path)))
+                total_before += before
+                total_after += after
+                self.stdout.write(f'{path:<28} 원본 {before:>12,} bytes  ->  축소본 {after:>12,} bytes')
+
+        saved = 100 - (total_after * 100 / total_before) if total_before else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'합계 원본 {total_before:,} bytes -> 축소본 {total_after:,} bytes ({saved:.1f}% 감소)'
+        ))
+
+    def render(self, client, path):
+        response = client.get(path)
+        if response.status_code != 200:
+            raise CommandError(f'{path} 응답 코드 {response.status_code}')
+        return response.content.decode('utf-8')
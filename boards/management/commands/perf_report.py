@@ -0,0 +1,39 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from boards import perf
+
+
+# 사용법: python manage.py perf_report [--json] [--reset]
+# PerfMiddleware(boards/perf.py)가 공유 캐시에 올린 화면별 측정 결과를 표로 출력합니다.
+# (CACHE_BACKEND 가 locmem 이면 웹 서버 프로세스의 값이 보이지 않습니다. redis/memcached/db 캐시에서 사용)
+class Command(BaseCommand):
+    help = '화면별 성능 측정 결과(p50/p95/p99, 쿼리 수, 템플릿 시간, 캐시 적중률)를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='JSON 으로 출력')
+        parser.add_argument('--reset', action='store_true', help='출력한 뒤 측정 기록을 지웁니다.')
+
+    def handle(self, *args, **options):
+        report = perf.summarize()
+        if options['json']:
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+        elif not report:
+            self.stdout.write('측정 기록이 없습니다. (PERF_INSTRUMENTATION, 공유 캐시 설정을 확인하세요)')
+        else:
+            self.stdout.write(
+                f"{'view':<32} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} "
+                f"{'queries':>8} {'db p95':>8} {'tpl p95':>8} {'cache':>6}"
+            )
+            for row in report:
+                ratio = '-' if row['cache_hit_ratio'] is None else f"{row['cache_hit_ratio']:.0%}"
+                self.stdout.write(
+                    f"{row['view']:<32} {row['count']:>6} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+                    f"{row['p99_ms']:>8.1f} {row['db_count_avg']:>8.1f} {row['db_p95_ms']:>8.1f} "
+                    f"{row['template_p95_ms']:>8.1f} {ratio:>6}"
+                )
+
+        if options['reset']:
+            perf.reset()
+            self.stdout.write(self.style.SUCCESS('측정 기록을 지웠습니다.'))
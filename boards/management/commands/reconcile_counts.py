@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from boards.counters import reconcile_counts
+
+
+# 사용법: python manage.py reconcile_counts
+# Post.like_count / Post.comment_count 가 실제 좋아요/댓글 수와 다른 글을 찾아 바로잡습니다.
+# (관리자 페이지에서 직접 삭제했거나 회원 탈퇴 등으로 카운터가 어긋났을 때, 또는 주기적으로 실행)
+class Command(BaseCommand):
+    help = '게시글의 좋아요 수/댓글 수 카운터를 실제 값과 맞춥니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=5000, help='한 번에 검사할 글 개수')
+
+    def handle(self, *args, **options):
+        repaired = reconcile_counts(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'카운터 보정 완료: 게시글 {repaired}건 수정'))
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from boards import trending
+
+
+# 사용법:
+#   python manage.py refresh_trending                 (한 번 계산)
+#   python manage.py refresh_trending --interval 60   (60초마다 계속 계산 - cron/작업 큐 대신 직접 돌릴 때)
+#   python manage.py refresh_trending --schedule      (작업 큐에 주기 계산 등록, run_task_worker 가 실행)
+# 최근 글의 인기 점수(조회수/좋아요/댓글 + 시간 감쇠)를 계산해서 전체 / 게시판별 TOP N 순위를 저장합니다.
+class Command(BaseCommand):
+    help = '인기글 순위(전체 / 게시판별 TOP N)를 다시 계산해서 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='이 간격(초)마다 계속 계산')
+        parser.add_argument('--schedule', action='store_true',
+                            help='지금 계산하지 않고 작업 큐에 주기 계산을 등록 (TASK_QUEUE_ENABLED 와 워커 필요)')
+
+    def handle(self, *args, **options):
+        if options['schedule']:
+            if options['interval']:
+                raise CommandError('--schedule 과 --interval 은 함께 쓸 수 없습니다.')
+            trending.schedule(delay=0)
+            self.stdout.write(self.style.SUCCESS(
+                f'작업 큐에 등록했습니다. 워커가 {trending.refresh_interval()}초마다 다시 계산합니다.'
+            ))
+            return
+
+        while True:
+            started = time.perf_counter()
+            changed = trending.refresh()
+            elapsed = (time.perf_counter() - started) * 1000
+            scopes = ', '.join('전체' if board_id is None else f'게시판 {board_id}' for board_id in changed)
+            self.stdout.write(f"{time.strftime('%H:%M:%S')} 인기글 순위 계산 {elapsed:.0f}ms - 바뀐 순위: {scopes or '없음'}")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
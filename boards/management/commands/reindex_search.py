@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from boards.models import Post
+from boards.search import get_backend
+
+
+# 사용법: python manage.py reindex_search
+# 검색 색인을 전부 지우고 모든 글로 다시 만듭니다.
+# (SEARCH_NGRAM 설정을 바꿨거나, bulk_create 등 시그널 없이 넣은 글이 있을 때 사용)
+class Command(BaseCommand):
+    help = '게시글 검색 색인을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 읽어서 색인할 글 개수')
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        backend.install()   # 색인 테이블이 없으면 생성
+        count = backend.reindex(Post.objects.all(), chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'검색 색인 완료 ({type(backend).__name__}): 게시글 {count}건'))
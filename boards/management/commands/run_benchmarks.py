@@ -0,0 +1,84 @@
+import json
+from importlib import import_module
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from boards.benchmarks import SUITES
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmark_baseline.json'
+
+# 기준값과 비교하는 지표 (그 밖의 지표는 출력/저장만)
+#  - 작을수록 좋은 값: threshold 비율까지 늘어나는 것 허용
+#  - 클수록 좋은 값  : threshold 비율까지 줄어드는 것 허용
+#  - queries        : 환경에 따라 흔들리지 않는 값이므로 늘어나면 바로 실패
+LOWER_IS_BETTER = ('p95_ms', 'peak_kb')
+HIGHER_IS_BETTER = ('rps', 'rows_per_s')
+
+
+# 사용법:
+#   python manage.py seed_data                                        (먼저 대량 데이터 생성)
+#   python manage.py run_benchmarks pages --save-baseline             (기준값 저장)
+#   python manage.py run_benchmarks pages --threshold 0.2             (기준값보다 20% 넘게 나빠지면 실패)
+#   python manage.py run_benchmarks trending --sizes 1000 100000      (묶음마다 전용 옵션: run_benchmarks <묶음> --help)
+# 성능 측정 묶음(boards/benchmarks/)을 실행하고, 결과를 묶음별 기준값(JSON)과 비교합니다.
+# 측정용 게시판/사용자가 필요한 묶음은 직접 만들고 끝나면 지웁니다.
+class Command(BaseCommand):
+    help = '성능 측정 묶음을 실행하고 기준값과 비교합니다.'
+
+    def add_arguments(self, parser):
+        suites = parser.add_subparsers(dest='suite', required=True, metavar='묶음', title='측정 묶음')
+        for name in SUITES:
+            module = import_module(f'boards.benchmarks.{name}')
+            sub = suites.add_parser(name, help=module.HELP, description=module.HELP)
+            module.add_arguments(sub)
+            sub.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='기준값 JSON 파일 경로')
+            sub.add_argument('--save-baseline', action='store_true', help='이번 결과를 이 묶음의 기준값으로 저장')
+            sub.add_argument('--threshold', type=float, default=0.2,
+                             help='허용할 변화 비율 (0.2 = 기준보다 20%% 넘게 나빠지면 실패)')
+
+    def handle(self, *args, **options):
+        suite = options['suite']
+        module = import_module(f'boards.benchmarks.{suite}')
+        with override_settings(ALLOWED_HOSTS=['testserver', *settings.ALLOWED_HOSTS]):
+            results = module.run(self.stdout, options)
+
+        baseline_path = Path(options['baseline'])
+        baselines = self.load(baseline_path)
+        if options['save_baseline']:
+            baselines[suite] = results
+            baseline_path.write_text(json.dumps(baselines, ensure_ascii=False, indent=2), encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(f'기준값 저장: {baseline_path} [{suite}]'))
+            return
+
+        if suite not in baselines:
+            self.stdout.write(f'{baseline_path} 에 [{suite}] 기준값이 없습니다. (--save-baseline 으로 만드세요)')
+            return
+
+        regressions = self.compare(results, baselines[suite], options['threshold'])
+        if regressions:
+            raise CommandError('성능이 기준보다 나빠졌습니다.\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS('모든 시나리오가 기준값 이내입니다.'))
+
+    def load(self, path):
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def compare(self, results, baseline, threshold):
+        regressions = []
+        for name, result in results.items():
+            base = baseline.get(name)
+            if base is None:
+                continue
+            for metric in LOWER_IS_BETTER:
+                if metric in result and metric in base and result[metric] > base[metric] * (1 + threshold):
+                    regressions.append(f'{name}: {metric} {base[metric]} -> {result[metric]}')
+            for metric in HIGHER_IS_BETTER:
+                if metric in result and metric in base and result[metric] < base[metric] * (1 - threshold):
+                    regressions.append(f'{name}: {metric} {base[metric]} -> {result[metric]}')
+            if 'queries' in result and 'queries' in base and result['queries'] > base['queries']:
+                regressions.append(f"{name}: 쿼리 {base['queries']} -> {result['queries']}")
+        return regressions
@@ -0,0 +1,193 @@
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import Message
+from boards import dashboard, trending
+from boards.models import Board, Comment, Post, make_excerpt
+from boards.pagination import count_cache_key
+
+# 제목/본문을 만들 단어 (검색 시나리오에서 이 단어들로 검색합니다.)
+WORDS = (
+    '장고', '파이썬', '게시판', '검색', '성능', '캐시', '데이터베이스', '서버', '배포', '테스트',
+    '색인', '쿼리', '템플릿', '페이지', '댓글', '좋아요', '쪽지', '프로필', '이미지', '공지',
+)
+
+# 만들어지는 데이터가 퍼져 있을 기간 (최근 N일)
+SPREAD_DAYS = 365
+
+
+def sentence(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    # auto_now_add / auto_now 필드는 bulk_create 에서도 현재 시각으로 덮어쓰므로,
+    # 시드 데이터를 과거 날짜에 퍼뜨리기 위해 잠시 끕니다.
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+# 사용법: python manage.py seed_data --posts 200000 --messages 50000
+# 성능 측정(run_benchmarks)용 대량 데이터를 bulk_create 로 빠르게 만듭니다.
+#  - 사용자 : {prefix}_user_0 ... (비밀번호 없음, 벤치마크에서는 force_login 으로 로그인)
+#  - 게시판 : {prefix}0, {prefix}1 ... (글은 게시판에 고르게 나뉨)
+#  - 글/댓글/좋아요/쪽지 : 최근 1년에 고르게 퍼진 시간으로 생성, like_count/comment_count 도 맞춰서 저장
+# --clear 로 같은 prefix 의 예전 시드 데이터를 지우고 다시 만들 수 있습니다.
+class Command(BaseCommand):
+    help = '성능 측정용 대량 데이터(게시판, 글, 댓글, 좋아요, 쪽지)를 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='seed', help='시드 사용자/게시판 이름 앞부분')
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--boards', type=int, default=5)
+        parser.add_argument('--posts', type=int, default=200000)
+        parser.add_argument('--comments-per-post', type=int, default=3, help='글당 평균 댓글 수')
+        parser.add_argument('--likes-per-post', type=int, default=2, help='글당 평균 좋아요 수')
+        parser.add_argument('--messages', type=int, default=50000)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드 (같은 값이면 같은 데이터)')
+        parser.add_argument('--clear', action='store_true', help='같은 prefix 의 시드 데이터를 먼저 지웁니다.')
+        parser.add_argument('--skip-search-index', action='store_true', help='검색 색인 재구성을 건너뜁니다.')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        prefix = options['prefix']
+
+        User = get_user_model()
+        if options['clear']:
+            self.clear(prefix)
+        elif Board.objects.filter(code__startswith=prefix).exists():
+            raise CommandError(f"'{prefix}' 시드 데이터가 이미 있습니다. --clear 로 지우고 다시 만드세요.")
+
+        started = time.perf_counter()
+        users = self.create_users(User, prefix, options['users'])
+        boards = Board.objects.bulk_create([
+            Board(title=f'시드 게시판 {i}', code=f'{prefix}{i}', description='성능 측정용')
+            for i in range(options['boards'])
+        ])
+        self.create_posts(boards, users, options['posts'], options['comments_per_post'], options['likes_per_post'])
+        self.create_messages(users, options['messages'])
+
+        # bulk_create 는 save() 시그널을 보내지 않으므로 색인/캐시를 직접 맞춥니다.
+        if not options['skip_search_index']:
+            call_command('reindex_search', stdout=self.stdout)
+        dashboard.invalidate_global()
+        cache.delete_many([count_cache_key(board) for board in boards])
+        trending.refresh()
+
+        self.stdout.write(self.style.SUCCESS(f'시드 데이터 생성 완료 ({time.perf_counter() - started:.1f}초)'))
+
+    def clear(self, prefix):
+        User = get_user_model()
+        # 게시판을 지우면 글/댓글/좋아요가, 사용자를 지우면 쪽지가 함께 지워집니다. (CASCADE)
+        Board.objects.filter(code__startswith=prefix).delete()
+        User.objects.filter(username__startswith=f'{prefix}_user_').delete()
+        self.stdout.write(f"'{prefix}' 시드 데이터를 지웠습니다.")
+
+    def random_time(self):
+        return self.now - timedelta(seconds=self.rng.randrange(SPREAD_DAYS * 24 * 3600))
+
+    def create_users(self, User, prefix, count):
+        password = make_password(None)   # 로그인 불가 비밀번호 (해시 계산을 사용자마다 하지 않도록 한 번만)
+        users = User.objects.bulk_create([
+            User(username=f'{prefix}_user_{i}', nickname=f'{prefix}_user_{i}', password=password)
+            for i in range(count)
+        ], batch_size=self.batch_size)
+        self.stdout.write(f'사용자 {len(users)}명')
+        return [user.pk for user in users]
+
+    def create_posts(self, boards, user_ids, total, comments_per_post, likes_per_post):
+        Like = Post.likes.through
+        created = 0
+        post_fields = [Post._meta.get_field(name) for name in ('created_at', 'updated_at')]
+        comment_fields = [Comment._meta.get_field(name) for name in ('created_at', 'updated_at')]
+
+        with explicit_timestamps(*post_fields, *comment_fields):
+            while created < total:
+                size = min(self.batch_size, total - created)
+                # 글마다 미리 댓글 수/좋아요 누른 사람을 정해서 카운터와 실제 데이터가 같도록 만듭니다.
+                plans = [
+                    (
+                        self.rng.randint(0, comments_per_post * 2),
+                        self.rng.sample(user_ids, min(len(user_ids), self.rng.randint(0, likes_per_post * 2))),
+                    )
+                    for _ in range(size)
+                ]
+                posts = []
+                for comment_total, likers in plans:
+                    created_at = self.random_time()
+                    content = sentence(self.rng, 40)
+                    posts.append(Post(
+                        board=self.rng.choice(boards),
+                        author_id=self.rng.choice(user_ids),
+                        title=sentence(self.rng, 4),
+                        content=content,
+                        excerpt=make_excerpt(content),   # bulk_create 는 save() 를 거치지 않으므로 직접
+                        created_at=created_at,
+                        updated_at=created_at,
+                        views=int(self.rng.paretovariate(1.2) * 10),
+                        like_count=len(likers),
+                        comment_count=comment_total,
+                    ))
+
+                with transaction.atomic():
+                    Post.objects.bulk_create(posts)
+                    comments, likes = [], []
+                    for post, (comment_total, likers) in zip(posts, plans):
+                        for _ in range(comment_total):
+                            created_at = post.created_at + timedelta(minutes=self.rng.randrange(1, 7 * 24 * 60))
+                            comments.append(Comment(
+                                post_id=post.pk,
+                                author_id=self.rng.choice(user_ids),
+                                content=sentence(self.rng, 8),
+                                created_at=created_at,
+                                updated_at=created_at,
+                            ))
+                        likes.extend(Like(post_id=post.pk, user_id=user_id) for user_id in likers)
+                    Comment.objects.bulk_create(comments, batch_size=self.batch_size)
+                    Like.objects.bulk_create(likes, batch_size=self.batch_size)
+
+                created += size
+                self.stdout.write(f'글 {created}/{total} (댓글 {len(comments)}, 좋아요 {len(likes)} 추가)')
+
+    def create_messages(self, user_ids, total):
+        if len(user_ids) < 2:
+            return
+        created_at_field = Message._meta.get_field('created_at')
+        created = 0
+        with explicit_timestamps(created_at_field):
+            while created < total:
+                size = min(self.batch_size, total - created)
+                messages = []
+                for _ in range(size):
+                    sender, receiver = self.rng.sample(user_ids, 2)
+                    created_at = self.random_time()
+                    # 70% 는 읽은 쪽지
+                    read_at = created_at + timedelta(hours=1) if self.rng.random() < 0.7 else None
+                    messages.append(Message(
+                        sender_id=sender, receiver_id=receiver,
+                        title=sentence(self.rng, 3), content=sentence(self.rng, 20),
+                        created_at=created_at, read_at=read_at,
+                    ))
+                Message.objects.bulk_create(messages)
+                created += size
+                self.stdout.write(f'쪽지 {created}/{total}')
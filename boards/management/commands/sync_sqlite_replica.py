@@ -0,0 +1,53 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def sync_replicas():
+    """원본 SQLite 파일을 복제 DB(SQLite) 파일로 통째로 복사하고, 복사한 복제 DB 이름 목록을 돌려줍니다."""
+    source_settings = settings.DATABASES['default']
+    if source_settings['ENGINE'] != 'django.db.backends.sqlite3':
+        raise CommandError('원본 DB가 SQLite 일 때만 사용할 수 있습니다.')
+    synced = []
+    source = sqlite3.connect(str(source_settings['NAME']))
+    try:
+        for alias in settings.DATABASE_REPLICAS:
+            target_settings = settings.DATABASES[alias]
+            if target_settings['ENGINE'] != 'django.db.backends.sqlite3':
+                continue
+            # 이 프로세스가 열어 둔 복제 DB 연결은 닫고 복사 (다음 쿼리 때 새 내용으로 다시 연결)
+            connections[alias].close()
+            target = sqlite3.connect(str(target_settings['NAME']))
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+            synced.append(alias)
+    finally:
+        source.close()
+    return synced
+
+
+# 사용법:
+#   DATABASE_REPLICA_URLS=sqlite:////tmp/replica.sqlite3 python manage.py sync_sqlite_replica
+#   ... python manage.py sync_sqlite_replica --interval 5      (5초마다 복사 -> 복제 지연 흉내)
+# 로컬에서 SQLite 파일 두 개로 원본/복제 DB 구성을 확인하기 위한 명령입니다. (config/db_router.py)
+# 실제 복제(PostgreSQL streaming replication 등) 대신 원본 파일을 복제 DB 파일로 복사합니다.
+class Command(BaseCommand):
+    help = '원본 SQLite DB를 복제 DB(SQLite) 파일로 복사합니다. (로컬 복제 확인용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='이 간격(초)마다 계속 복사')
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError('DATABASE_REPLICA_URLS 에 복제 DB가 없습니다.')
+        while True:
+            synced = sync_replicas()
+            self.stdout.write(f"{time.strftime('%H:%M:%S')} 복사 완료: {', '.join(synced) or '(SQLite 복제 DB 없음)'}")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
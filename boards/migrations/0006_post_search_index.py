@@ -0,0 +1,97 @@
+# 검색 색인 테이블 생성 (boards/search.py)
+# SQLite 는 FTS5 가상 테이블, PostgreSQL 은 tsvector + GIN 색인 테이블을 만들고
+# 이미 있는 글들을 색인에 채워 넣습니다.
+# 마이그레이션은 나중에 코드/설정이 바뀌어도 같은 결과를 내야 하므로 boards.search 를 불러오지 않고
+# 이 시점의 DDL 과 색인 규칙(2글자 n-gram, SEARCH_NGRAM 기본값)을 여기에 그대로 둡니다.
+# (SEARCH_NGRAM=False 로 운영한다면 migrate 후 python manage.py reindex_search 로 다시 채우세요.)
+import re
+
+from django.db import migrations
+
+SQLITE_TABLE = 'boards_post_fts'
+POSTGRES_TABLE = 'boards_post_search'
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _index_text(text):
+    # '안녕하세요' -> '안녕 녕하 하세 세요' (2글자 이하 단어는 그대로)
+    grams = []
+    for word in _WORD_RE.findall((text or '').lower()):
+        if len(word) <= 2:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return ' '.join(grams)
+
+
+SQL = {
+    'sqlite': {
+        'install': [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} "
+            f"USING fts5(title, content, tokenize='unicode61')",
+        ],
+        'clear': f"DELETE FROM {SQLITE_TABLE}",
+        'insert': f"INSERT INTO {SQLITE_TABLE} (rowid, title, content) VALUES (%s, %s, %s)",
+        'uninstall': f"DROP TABLE IF EXISTS {SQLITE_TABLE}",
+    },
+    'postgresql': {
+        'install': [
+            f"CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ("
+            f"post_id bigint PRIMARY KEY REFERENCES boards_post(id) ON DELETE CASCADE, "
+            f"document tsvector NOT NULL)",
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_TABLE}_document_gin "
+            f"ON {POSTGRES_TABLE} USING GIN (document)",
+        ],
+        'clear': f"TRUNCATE {POSTGRES_TABLE}",
+        # 제목(A)에 걸린 단어가 내용(B)보다 높은 점수
+        'insert': (
+            f"INSERT INTO {POSTGRES_TABLE} (post_id, document) VALUES "
+            f"(%s, setweight(to_tsvector('simple', %s), 'A') || "
+            f"setweight(to_tsvector('simple', %s), 'B')) "
+            f"ON CONFLICT (post_id) DO UPDATE SET document = EXCLUDED.document"
+        ),
+        'uninstall': f"DROP TABLE IF EXISTS {POSTGRES_TABLE}",
+    },
+}
+
+CHUNK_SIZE = 1000
+
+
+def install_search_index(apps, schema_editor):
+    # 그 외 DB 는 색인 없이 icontains 검색
+    sql = SQL.get(schema_editor.connection.vendor)
+    if sql is None:
+        return
+    Post = apps.get_model('boards', 'Post')
+    with schema_editor.connection.cursor() as cursor:
+        for statement in sql['install']:
+            cursor.execute(statement)
+        cursor.execute(sql['clear'])
+
+        batch = []
+        rows = Post.objects.using(schema_editor.connection.alias).order_by('pk').values_list('pk', 'title', 'content')
+        for pk, title, content in rows.iterator(chunk_size=CHUNK_SIZE):
+            batch.append((pk, _index_text(title), _index_text(content)))
+            if len(batch) >= CHUNK_SIZE:
+                cursor.executemany(sql['insert'], batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql['insert'], batch)
+
+
+def uninstall_search_index(apps, schema_editor):
+    sql = SQL.get(schema_editor.connection.vendor)
+    if sql is not None:
+        schema_editor.execute(sql['uninstall'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_post_likes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:20
+
+from django.db import migrations, models
+
+
+# 이미 있는 글들의 좋아요 수/댓글 수를 실제 값으로 채워 넣습니다.
+def fill_counts(apps, schema_editor):
+    from boards.counters import reconcile_counts
+
+    reconcile_counts(apps.get_model('boards', 'Post'), apps.get_model('boards', 'Comment'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_post_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, verbose_name='댓글 수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, verbose_name='좋아요 수'),
+        ),
+        migrations.RunPython(fill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0009_post_updated_at_auto_now'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HotPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveIntegerField(verbose_name='순위')),
+                ('score', models.FloatField(verbose_name='점수')),
+                ('computed_at', models.DateTimeField(verbose_name='계산 시각')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_at'], name='post_created_idx'),
+        ),
+        migrations.AddField(
+            model_name='hotpost',
+            name='board',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='boards.board', verbose_name='게시판'),
+        ),
+        migrations.AddField(
+            model_name='hotpost',
+            name='post',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hot_entries', to='boards.post', verbose_name='게시글'),
+        ),
+        migrations.AddIndex(
+            model_name='hotpost',
+            index=models.Index(fields=['board', 'rank'], name='hotpost_board_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+
+# 이미 있는 글들의 미리보기를 본문에서 만들어 채워 넣습니다. (본문이 큰 글이 많을 수 있으므로 나눠서)
+def fill_excerpts(apps, schema_editor):
+    from boards.models import make_excerpt
+
+    Post = apps.get_model('boards', 'Post')
+    batch = []
+    for post in Post.objects.only('pk', 'content').iterator(chunk_size=1000):
+        post.excerpt = make_excerpt(post.content)
+        batch.append(post)
+        if len(batch) >= 1000:
+            Post.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0010_hot_post'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=200, verbose_name='미리보기'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
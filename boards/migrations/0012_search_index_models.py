@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0011_post_excerpt'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostFTS',
+            fields=[
+                ('post', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', related_query_name='fts', serialize=False, to='boards.post')),
+                ('document', models.TextField(db_column='boards_post_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'boards_post_fts',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PostSearchDocument',
+            fields=[
+                ('post', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', related_query_name='search_document', serialize=False, to='boards.post')),
+                ('document', models.TextField()),
+            ],
+            options={
+                'db_table': 'boards_post_search',
+                'managed': False,
+            },
+        ),
+    ]
@@ -1,5 +1,18 @@
 from django.db import models
 from django.conf import settings # 설정 파일의 AUTH_USER_MODEL을 가져오기 위함
+from django.utils.html import strip_tags
+
+# 목록/메인 화면에서 본문 대신 보여줄 미리보기 글자 수 (Post.excerpt)
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    # 태그와 줄바꿈/연속 공백을 없앤 앞부분 (length 를 넘으면 말줄임표)
+    text = ' '.join(strip_tags(text or '').split())
+    if len(text) > length:
+        text = text[:length - 1].rstrip() + '…'
+    return text
+
 
 # 1. 게시판 설정 테이블 (예: 공지사항, 자유게시판 등 게시판 '종류'를 관리)
 class Board(models.Model):
@@ -36,13 +49,18 @@ class Post(models.Model):
     title = models.CharField(max_length=200, verbose_name="제목")
     content = models.TextField(verbose_name="내용") # 길이 제한 없는 문자열
 
+    # 본문 미리보기 (저장할 때 content 에서 자동으로 만듦)
+    # 목록/메인 화면은 길이 제한 없는 content 대신 이 컬럼만 읽습니다.
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False, verbose_name="미리보기")
+
     # 생성 시 시간 자동 저장
     # auto_now_add=True: 데이터가 처음 생성될 때 현재 시간 자동 저장
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록일")
 
     # 저장(수정) 될 때마다 시간 자동 갱신
     # auto_now=True: 데이터가 수정될 때 마다 현재 시간 갱신
-    updated_at = models.DateTimeField(auto_now_add=True, verbose_name="수정일")
+    # (예전에는 auto_now_add 로 되어 있어서 수정해도 바뀌지 않았습니다. -> 조건부 요청(boards/conditional.py)에 사용)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
     views = models.PositiveBigIntegerField(default=0, verbose_name="조회수")
 
@@ -57,8 +75,42 @@ class Post(models.Model):
     # (주의: related_name을 안 쓰면 author 필드와 충돌이 날 수 있습니다.)
     likes = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='like_posts', blank=True, verbose_name="좋아요")
 
+    # 좋아요 수 / 댓글 수 (역정규화 카운터)
+    # 매번 likes, comments 테이블을 COUNT 하지 않도록 값을 저장해둡니다.
+    # post_like, comment_create, comment_delete 뷰에서 F() 식으로 함께 갱신하며,
+    # 값이 어긋나면 python manage.py reconcile_counts 로 바로잡습니다.
+    # db_index=True: '좋아요 많은 순', '댓글 많은 순' 정렬을 색인으로 처리
+    like_count = models.PositiveIntegerField(default=0, db_index=True, verbose_name="좋아요 수")
+    comment_count = models.PositiveIntegerField(default=0, db_index=True, verbose_name="댓글 수")
+
     def __str__(self):
         return f"[{self.board.title}] {self.title}"
+
+    def save(self, *args, **kwargs):
+        # 본문을 저장할 때마다 미리보기도 함께 갱신
+        # (update_fields 로 본문 외의 컬럼만 저장할 때는 본문을 읽지 않음 - 본문이 지연 로딩일 수 있음)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.excerpt = make_excerpt(self.content)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'excerpt'}
+        super().save(*args, **kwargs)
+
+    class Meta:
+        # 자주 쓰는 조회 조건 + 정렬 조합에 맞춘 복합 색인
+        # (boards/tests.py, accounts/tests.py 의 *QueryPlanTests 가 실제로 색인을 타는지 확인합니다.)
+        indexes = [
+            # 게시판 목록: WHERE board_id = ? ORDER BY created_at DESC, id DESC
+            models.Index(fields=['board', '-created_at', '-id'], name='post_board_created_idx'),
+            # 게시판 최종 수정 시각: WHERE board_id = ? -> MAX(updated_at) (색인 끝 한 줄만 읽음)
+            models.Index(fields=['board', 'updated_at'], name='post_board_updated_idx'),
+            # 메인 인기글: ORDER BY views DESC
+            models.Index(fields=['-views'], name='post_views_idx'),
+            # 인기글 순위 계산 대상(최근 글): WHERE created_at >= ? (boards/trending.py)
+            models.Index(fields=['-created_at'], name='post_created_idx'),
+            # 메인 내가 쓴 글: WHERE author_id = ? ORDER BY created_at DESC
+            models.Index(fields=['author', '-created_at'], name='post_author_created_idx'),
+        ]
     
 class Comment(models.Model):
     # [FK] 어떤 게시글에 달린 댓글인지 (Post와 1:N 관계)
@@ -75,4 +127,69 @@ class Comment(models.Model):
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
     def __str__(self):
-        return f"[{self.post.title}] {self.content[:20]}..."
\ No newline at end of file
+        return f"[{self.post.title}] {self.content[:20]}..."
+
+    class Meta:
+        indexes = [
+            # 메인 내가 쓴 댓글: WHERE author_id = ? ORDER BY created_at DESC
+            models.Index(fields=['author', '-created_at'], name='comment_author_created_idx'),
+        ]
+
+
+# 4. 인기글 순위 (boards/trending.py 가 주기적으로 계산해서 저장하는 TOP N 목록)
+# 요청마다 전체 글을 점수로 정렬하지 않고, 미리 계산한 순위를 rank 순서로 N줄만 읽습니다.
+class HotPost(models.Model):
+    # 어느 게시판의 순위인지 (NULL = 전체 게시판 통합 순위)
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, null=True, blank=True, related_name='+', verbose_name="게시판")
+
+    # related_name='hot_entries': 게시판 목록의 '인기순' 정렬에서 Post 쪽에서 순위를 조인할 때 사용
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='hot_entries', verbose_name="게시글")
+
+    # 1부터 시작하는 순위
+    rank = models.PositiveIntegerField(verbose_name="순위")
+
+    # 조회수/좋아요/댓글 가중합에 글 나이에 따른 감쇠를 곱한 점수 (계산 시점 기준)
+    score = models.FloatField(verbose_name="점수")
+    computed_at = models.DateTimeField(verbose_name="계산 시각")
+
+    def __str__(self):
+        return f"{self.rank}위 {self.post_id} ({self.score:.1f})"
+
+    class Meta:
+        indexes = [
+            # WHERE board_id = ? (또는 IS NULL) ORDER BY rank LIMIT N
+            models.Index(fields=['board', 'rank'], name='hotpost_board_rank_idx'),
+        ]
+
+
+# 5. 전문 검색 색인 테이블 (boards/search.py 가 만들고 채움 -> managed=False, 마이그레이션이 테이블을 만들지 않음)
+# 검색할 때 글과 JOIN 해서 조건(MATCH)과 관련도를 한 번에 읽기 위한 모델입니다.
+# 글 번호로만 연결되므로 글을 지울 때 Django 는 이 테이블을 건드리지 않습니다. (색인 삭제는 시그널이 처리)
+
+# SQLite FTS5 가상 테이블 boards_post_fts (rowid = 글 번호)
+class PostFTS(models.Model):
+    post = models.OneToOneField(
+        Post, primary_key=True, db_column='rowid', on_delete=models.DO_NOTHING, db_constraint=False,
+        related_name='+', related_query_name='fts',
+    )
+    # 테이블 이름과 같은 숨은 컬럼: WHERE boards_post_fts = '검색식' 은 MATCH 와 같음
+    document = models.TextField(db_column='boards_post_fts')
+    # MATCH 한 행마다 FTS5 가 계산하는 bm25() 값 (작을수록 관련도 높음)
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'boards_post_fts'
+
+
+# PostgreSQL tsvector 테이블 boards_post_search
+class PostSearchDocument(models.Model):
+    post = models.OneToOneField(
+        Post, primary_key=True, on_delete=models.DO_NOTHING, db_constraint=False,
+        related_name='+', related_query_name='search_document',
+    )
+    document = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = 'boards_post_search'
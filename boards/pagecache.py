@@ -0,0 +1,267 @@
+# 비로그인(익명) 사용자용 게시판 화면 캐시 (board_list, board_detail)
+# 로그인하지 않은 사용자는 모두 같은 화면을 보므로, 그린 HTML 을 통째로 캐시에 저장해 두고 재사용합니다.
+#  - 캐시 키: 요청 주소 전체(게시판 코드, page, q, sort, after/before, 글 번호) + 태그 버전
+#  - 태그: 목록은 'board:<코드>', 상세는 'post:<번호>'
+#      글 작성/수정/삭제, 댓글, 좋아요가 바뀌면 해당 태그의 버전을 올려서 예전 캐시를 더 이상 읽지 않게 합니다.
+#      (dashboard.py 의 사용자별 버전과 같은 방식 - 지울 키를 일일이 찾을 필요 없음)
+#  - 몰림(stampede) 방지: 만료된 화면은 한 요청만 잠금(cache.add)을 잡고 다시 그리고,
+#      나머지 요청은 잠깐 동안 예전(stale) 화면을 받거나, 없으면 다시 그려질 때까지 잠시 기다립니다.
+# 조회수처럼 캐시된 화면을 보여줄 때도 실행해야 하는 일은 on_hit 함수로 넘깁니다.
+import asyncio
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from . import registry
+from .models import Post
+
+CACHE_KEY_PREFIX = 'pagecache'
+
+# 다시 그리는 중인 화면을 기다릴 때 확인 간격(초)
+WAIT_STEP = 0.05
+
+
+def _enabled():
+    return getattr(settings, 'PAGE_CACHE_ENABLED', False)
+
+
+def _timeout():
+    return getattr(settings, 'PAGE_CACHE_TIMEOUT', 60)
+
+
+def _stale_timeout():
+    # 만료 후에도 이 시간 동안은 '다시 그리는 중' 에 대신 보여줄 수 있도록 보관
+    return getattr(settings, 'PAGE_CACHE_STALE_TIMEOUT', 30)
+
+
+def _lock_timeout():
+    return getattr(settings, 'PAGE_CACHE_LOCK_TIMEOUT', 10)
+
+
+def _wait_timeout():
+    return getattr(settings, 'PAGE_CACHE_WAIT_TIMEOUT', 2)
+
+
+# ----------------------------------------------------------------------------
+# 태그 / 무효화
+# ----------------------------------------------------------------------------
+
+def board_tag(board_code):
+    return f'board:{board_code}'
+
+
+def post_tag(post_id):
+    return f'post:{post_id}'
+
+
+def _tag_key(tag):
+    return f'{CACHE_KEY_PREFIX}:tag:{tag}'
+
+
+def _new_version():
+    # dashboard._new_version 과 같은 이유로 현재 시각(밀리초)을 시작 번호로 사용
+    return int(time.time() * 1000)
+
+
+def bump(*tags):
+    """태그 버전을 올려서 그 태그가 붙은 캐시 화면을 모두 무효화합니다.
+
+    버전은 항상 '마지막으로 바뀐 시각(밀리초)' 이상이 되도록 올립니다. (changed_at() 에서 사용)
+    """
+    for tag in tags:
+        key = _tag_key(tag)
+        now = _new_version()
+        if cache.add(key, now, timeout=None):
+            continue
+        current = cache.get(key)
+        try:
+            # incr 는 원자적이므로 동시에 올려도 서로 다른 버전이 됩니다.
+            cache.incr(key, max(1, now - (current or 0)))
+        except ValueError:
+            cache.set(key, now, timeout=None)
+
+
+def invalidate_post(post_id, board_id=None):
+    """글 상세 화면 + 그 글이 속한 게시판 목록 화면 무효화
+
+    board_id 를 모르면 (댓글/좋아요 변경) 글 번호로 게시판을 찾습니다.
+    """
+    if board_id is None:
+        board_id = Post.objects.filter(pk=post_id).values_list('board_id', flat=True).first()
+    # 게시판 코드는 프로세스 캐시(boards/registry.py)에서 찾습니다.
+    board = registry.get_by_id(board_id) if board_id is not None else None
+    tags = [post_tag(post_id)]
+    if board is not None:
+        tags.append(board_tag(board.code))
+    bump(*tags)
+
+
+def _versions(tags, cached):
+    # 버전이 아직 없는 태그는 새로 만들어 둡니다. (다른 요청이 먼저 만들었으면 그 값 사용)
+    # 이때 버전은 지금 시각이므로 '마지막으로 바뀐 시각' 을 실제보다 늦게 보는 쪽으로만 틀립니다.
+    versions = []
+    for tag in tags:
+        version = cached.get(_tag_key(tag))
+        if version is None:
+            version = _new_version()
+            if not cache.add(_tag_key(tag), version, timeout=None):
+                version = cache.get(_tag_key(tag), version)
+        versions.append(str(version))
+    return versions
+
+
+def tag_versions(tags):
+    return [int(version) for version in _versions(tags, cache.get_many([_tag_key(tag) for tag in tags]))]
+
+
+def changed_at(versions):
+    """태그 버전들로 '마지막으로 바뀐 시각'(초) 계산 - 캐시에 버전이 없었으면 지금 시각"""
+    return max(versions) / 1000 if versions else None
+
+
+def page_key(request, tags):
+    versions = _versions(tags, cache.get_many([_tag_key(tag) for tag in tags]))
+    digest = hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:page:{digest}:{'.'.join(versions)}"
+
+
+async def apage_key(request, tags):
+    cached = await cache.aget_many([_tag_key(tag) for tag in tags])
+    versions = await sync_to_async(_versions)(tags, cached)
+    digest = hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:page:{digest}:{'.'.join(versions)}"
+
+
+# ----------------------------------------------------------------------------
+# 저장 / 꺼내기
+# ----------------------------------------------------------------------------
+
+def _cacheable_request(request):
+    if not _enabled() or request.method not in ('GET', 'HEAD'):
+        return False
+    # 세션이 있는 요청(로그인 사용자, 세션에 저장된 알림 메시지)과
+    # 다음 화면에 보여줄 알림 메시지(messages) 쿠키가 있는 요청은 그 사용자만의 화면이므로 제외
+    cookies = request.COOKIES
+    if cookies.get(settings.SESSION_COOKIE_NAME) or cookies.get(getattr(settings, 'MESSAGE_COOKIE_NAME', 'messages')):
+        return False
+    return True
+
+
+def _cacheable_response(request, response):
+    # 정상 응답만, 그리고 CSRF 토큰이 들어간 화면(폼)은 사용자마다 달라지므로 제외
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+
+def _entry(response):
+    # 쿠키(Set-Cookie)는 처음 그린 사용자의 것이므로 저장하지 않고 본문과 형식만 저장
+    return {
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'fresh_until': time.time() + _timeout(),
+    }
+
+
+def _response(entry, status):
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    response['X-Page-Cache'] = status
+    return response
+
+
+def _fresh(entry):
+    return entry is not None and entry['fresh_until'] > time.time()
+
+
+def cache_anonymous_page(tags, on_hit=None):
+    """익명 사용자 화면을 캐시하는 뷰 데코레이터 (sync/async 뷰 모두 사용 가능)
+
+    tags  : 뷰의 URL 인자(kwargs)를 받아 태그 목록을 돌려주는 함수
+    on_hit: 캐시된 화면을 보여줄 때 실행할 함수 (request, response, **kwargs) - 조회수 등
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if not _cacheable_request(request) or (await request.auser()).is_authenticated:
+                    return await view(request, *args, **kwargs)
+                key = await apage_key(request, tags(**kwargs))
+
+                async def hit(entry, status):
+                    response = _response(entry, status)
+                    if on_hit is not None:
+                        await sync_to_async(on_hit)(request, response, **kwargs)
+                    return response
+
+                entry = await cache.aget(key)
+                if _fresh(entry):
+                    return await hit(entry, 'hit')
+
+                if await cache.aadd(f'{key}:lock', 1, _lock_timeout()):
+                    try:
+                        response = await view(request, *args, **kwargs)
+                        if _cacheable_response(request, response):
+                            await cache.aset(key, _entry(response), _timeout() + _stale_timeout())
+                    finally:
+                        await cache.adelete(f'{key}:lock')
+                    return response
+
+                if entry is not None:
+                    return await hit(entry, 'stale')
+                deadline = time.monotonic() + _wait_timeout()
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(WAIT_STEP)
+                    entry = await cache.aget(key)
+                    if entry is not None:
+                        return await hit(entry, 'hit')
+                return await view(request, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not _cacheable_request(request) or request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+            key = page_key(request, tags(**kwargs))
+
+            def hit(entry, status):
+                response = _response(entry, status)
+                if on_hit is not None:
+                    on_hit(request, response, **kwargs)
+                return response
+
+            entry = cache.get(key)
+            if _fresh(entry):
+                return hit(entry, 'hit')
+
+            # 만료되었거나 없음 -> 잠금을 잡은 요청 하나만 다시 그림
+            if cache.add(f'{key}:lock', 1, _lock_timeout()):
+                try:
+                    response = view(request, *args, **kwargs)
+                    if _cacheable_response(request, response):
+                        cache.set(key, _entry(response), _timeout() + _stale_timeout())
+                finally:
+                    cache.delete(f'{key}:lock')
+                return response
+
+            # 다른 요청이 다시 그리는 중: 예전 화면이 있으면 그것을, 없으면 잠시 기다렸다가 사용
+            if entry is not None:
+                return hit(entry, 'stale')
+            deadline = time.monotonic() + _wait_timeout()
+            while time.monotonic() < deadline:
+                time.sleep(WAIT_STEP)
+                entry = cache.get(key)
+                if entry is not None:
+                    return hit(entry, 'hit')
+            # 오래 걸리면 직접 그림 (캐시에는 저장하지 않음)
+            return view(request, *args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,175 @@
+# 게시판 목록용 페이징 도구
+# 기본 Paginator는 페이지마다 COUNT(*) 와 OFFSET 스캔을 실행합니다.
+# 글이 수십만 개가 되면 뒤쪽 페이지일수록 느려지므로 아래 도구들을 제공합니다.
+#  1) CachedCountPaginator : 전체 개수(COUNT)를 캐시에 잠시 저장해 재사용
+#  2) page_window          : 전체 페이지 번호 대신 현재 페이지 주변 번호만 보여주기
+#  3) cursor_paginate      : (created_at, id) 기준 커서(keyset) 페이징 - OFFSET 없음
+import base64
+import hashlib
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+# 커서 페이징 정렬 기준 (최신글 먼저, 같은 시간이면 id 큰 순)
+CURSOR_ORDERING = ('-created_at', '-id')
+
+
+class CachedCountPaginator(Paginator):
+    """COUNT(*) 결과를 캐시에 저장해두는 Paginator
+
+    count_key: 캐시 키 (게시판 + 검색어 조합 등, 같은 목록이면 같은 키)
+    """
+
+    def __init__(self, object_list, per_page, count_key, count_timeout=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_key = count_key
+        if count_timeout is None:
+            count_timeout = getattr(settings, 'BOARD_LIST_COUNT_CACHE_TIMEOUT', 60)
+        self.count_timeout = count_timeout
+
+    @cached_property
+    def count(self):
+        return cached_count(self.object_list, self.count_key, self.count_timeout)
+
+
+def cached_count(queryset, key, timeout=None):
+    """queryset.count() 결과를 캐시에서 꺼내거나, 없으면 계산해서 저장합니다. (근사값)"""
+    if timeout is None:
+        timeout = getattr(settings, 'BOARD_LIST_COUNT_CACHE_TIMEOUT', 60)
+    total = cache.get(key)
+    if total is None:
+        total = queryset.count()
+        cache.set(key, total, timeout)
+    return total
+
+
+async def acached_count(queryset, key, timeout=None):
+    """cached_count() 의 async 버전"""
+    if timeout is None:
+        timeout = getattr(settings, 'BOARD_LIST_COUNT_CACHE_TIMEOUT', 60)
+    total = await cache.aget(key)
+    if total is None:
+        total = await queryset.acount()
+        await cache.aset(key, total, timeout)
+    return total
+
+
+def count_cache_key(board, q='', scope=''):
+    # 검색어는 길이/문자 제한이 없으므로 해시해서 키에 넣습니다.
+    # scope: 글 범위가 다른 목록(예: 'hot' = 인기 순위에 든 글만)은 개수도 따로 저장
+    digest = hashlib.md5(q.encode('utf-8')).hexdigest()
+    key = f'board_list:count:{board.pk}:{digest}'
+    return f'{key}:{scope}' if scope else key
+
+
+def page_window(page_obj, size=5):
+    """현재 페이지를 가운데 두고 앞뒤 size개씩의 페이지 번호 범위를 반환합니다.
+
+    예) 현재 50 페이지, size=5 -> 45 ~ 55
+    """
+    num_pages = page_obj.paginator.num_pages
+    start = max(page_obj.number - size, 1)
+    end = min(page_obj.number + size, num_pages)
+    return range(start, end + 1)
+
+
+# ----------------------------------------------------------------------------
+# 커서(keyset) 페이징
+# ----------------------------------------------------------------------------
+
+def encode_cursor(post):
+    """글의 (created_at, id)를 URL에 넣을 수 있는 토큰 문자열로 만듭니다."""
+    raw = f'{post.created_at.isoformat()}|{post.pk}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """토큰을 (created_at, id)로 되돌립니다. 잘못된 토큰이면 None"""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+        created_at, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, UnicodeError):
+        return None
+
+
+class CursorPage:
+    """커서 페이징 결과 (템플릿에서 Page 객체와 비슷하게 사용)"""
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        # 다음(더 오래된) 페이지: 현재 페이지의 마지막 글 이후부터
+        if self.has_next and self.object_list:
+            return encode_cursor(self.object_list[-1])
+        return ''
+
+    @property
+    def previous_cursor(self):
+        # 이전(더 최신) 페이지: 현재 페이지의 첫 글 이전부터
+        if self.has_previous and self.object_list:
+            return encode_cursor(self.object_list[0])
+        return ''
+
+
+def _cursor_query(queryset, after, before, per_page):
+    # 커서 조건을 붙인 queryset 과, 결과를 뒤집어야 하는지(이전 페이지) 여부를 반환합니다.
+    # (created_at, id) < (t, pk) 를 created_at <= t AND (created_at < t OR id < pk) 로 씁니다.
+    # OR 만 있으면 DB가 색인 범위를 정하지 못하고 게시판 색인을 처음부터 훑으므로(뒤쪽 페이지일수록 느려짐)
+    # 바깥의 created_at <= t 조건으로 색인 범위 검색을 하게 합니다.
+    after = decode_cursor(after)
+    before = decode_cursor(before) if after is None else None
+
+    if before is not None:
+        created_at, pk = before
+        qs = queryset.filter(created_at__gte=created_at).filter(Q(created_at__gt=created_at) | Q(id__gt=pk))
+        # 가까운 쪽부터 per_page+1개 가져온 뒤 다시 뒤집습니다. (+1개는 더 있는지 확인용)
+        return qs.order_by('created_at', 'id')[:per_page + 1], True, False
+
+    qs = queryset
+    if after is not None:
+        created_at, pk = after
+        qs = qs.filter(created_at__lte=created_at).filter(Q(created_at__lt=created_at) | Q(id__lt=pk))
+    return qs.order_by(*CURSOR_ORDERING)[:per_page + 1], False, after is not None
+
+
+def _cursor_page(rows, backwards, has_after, per_page):
+    more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backwards:
+        return CursorPage(rows[::-1], has_next=True, has_previous=more)
+    return CursorPage(rows, has_next=more, has_previous=has_after)
+
+
+def cursor_paginate(queryset, after=None, before=None, per_page=10):
+    """(created_at, id) 기준 커서 페이징
+
+    after : 이 토큰 글보다 오래된 글부터 (다음 페이지)
+    before: 이 토큰 글보다 최신인 글까지 (이전 페이지)
+    OFFSET 없이 WHERE (created_at, id) < (...) 로 찾기 때문에 몇 번째 페이지든 속도가 같습니다.
+    """
+    qs, backwards, has_after = _cursor_query(queryset, after, before, per_page)
+    return _cursor_page(list(qs), backwards, has_after, per_page)
+
+
+async def acursor_paginate(queryset, after=None, before=None, per_page=10):
+    """cursor_paginate() 의 async 버전"""
+    qs, backwards, has_after = _cursor_query(queryset, after, before, per_page)
+    return _cursor_page([row async for row in qs], backwards, has_after, per_page)
@@ -0,0 +1,351 @@
+# 요청 단위 성능 측정 (PERF_INSTRUMENTATION=True 일 때 PerfMiddleware 가 MIDDLEWARE 맨 앞에 추가됨)
+# 화면(view 이름)별로 아래 값을 기록해서 어디서 시간이 쓰이는지 봅니다.
+#  - DB 쿼리 수 / 쿼리 시간 (DB 연결의 execute_wrapper)
+#  - 템플릿 그리는 시간 (Template.render)
+#  - 캐시 적중(hit) / 실패(miss) 횟수 (캐시 get / get_many)
+#  - 전체 처리 시간
+# 결과는
+#  - 응답의 Server-Timing 헤더 (브라우저 개발자 도구 Network 탭의 Timing 에 표시)
+#  - 프로세스 메모리에 화면별 최근 PERF_RESERVOIR_SIZE 개씩 보관 -> p50/p95/p99 계산
+#  - PERF_PUBLISH_INTERVAL 초마다 공유 캐시에 올려서 여러 워커 프로세스의 값을 합쳐 봄
+#    (/perf/ 관리자 화면, python manage.py perf_report)
+# PERF_SAMPLE_RATE 비율의 요청만 측정하므로 운영 중에도 켜 둘 수 있습니다. (측정하지 않는 요청은 거의 비용 없음)
+import os
+import random
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.base import Template
+from django.utils.module_loading import import_string
+
+CACHE_KEY_PREFIX = 'perf'
+PROCESSES_KEY = f'{CACHE_KEY_PREFIX}:processes'
+PROCESS_ID = f'{socket.gethostname()}:{os.getpid()}'
+
+# 기록 항목 (샘플 하나 = 이 순서의 튜플)
+FIELDS = ('total_ms', 'db_ms', 'db_count', 'template_ms', 'cache_hits', 'cache_misses')
+
+# 지금 측정 중인 요청의 기록 (측정하지 않는 요청이면 None)
+# contextvar 이므로 async 뷰, sync_to_async 로 넘어간 스레드에서도 같은 기록을 봅니다.
+_current = ContextVar('perf_request_stats', default=None)
+
+
+def _sample_rate():
+    return getattr(settings, 'PERF_SAMPLE_RATE', 1.0)
+
+
+def _reservoir_size():
+    return getattr(settings, 'PERF_RESERVOIR_SIZE', 1000)
+
+
+def _publish_interval():
+    return getattr(settings, 'PERF_PUBLISH_INTERVAL', 30)
+
+
+class RequestStats:
+    """요청 하나의 측정값"""
+
+    __slots__ = (
+        'db_count', 'db_time', 'template_time', 'template_depth', 'cache_depth', 'cache_hits', 'cache_misses',
+    )
+
+    def __init__(self):
+        self.db_count = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+        self.cache_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+# ----------------------------------------------------------------------------
+# 측정 지점 연결 (처음 한 번만)
+# ----------------------------------------------------------------------------
+
+def _db_wrapper(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.db_time += time.perf_counter() - started
+        stats.db_count += 1
+
+
+def _add_db_wrapper(connection, **kwargs):
+    if _db_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _db_wrapper)
+
+
+def _wrap_template_render(render):
+    def timed_render(self, context):
+        stats = _current.get()
+        if stats is None:
+            return render(self, context)
+        # {% include %} 처럼 안쪽에서 다시 render 되는 템플릿은 바깥 템플릿 시간에 이미 포함됨
+        stats.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            stats.template_depth -= 1
+            if stats.template_depth == 0:
+                stats.template_time += time.perf_counter() - started
+
+    timed_render.perf_wrapped = True
+    return timed_render
+
+
+# 기본 get_many 는 안에서 get 을 키마다 다시 부르므로, 바깥 호출에서만 셉니다. (cache_depth)
+def _wrap_cache_get(get):
+    def counted_get(self, key, default=None, version=None):
+        stats = _current.get()
+        if stats is None:
+            return get(self, key, default, version)
+        stats.cache_depth += 1
+        try:
+            value = get(self, key, default, version)
+        finally:
+            stats.cache_depth -= 1
+        if stats.cache_depth == 0:
+            if value is default:
+                stats.cache_misses += 1
+            else:
+                stats.cache_hits += 1
+        return value
+
+    counted_get.perf_wrapped = True
+    return counted_get
+
+
+def _wrap_cache_get_many(get_many):
+    def counted_get_many(self, keys, version=None):
+        stats = _current.get()
+        if stats is None:
+            return get_many(self, keys, version)
+        keys = list(keys)
+        stats.cache_depth += 1
+        try:
+            values = get_many(self, keys, version)
+        finally:
+            stats.cache_depth -= 1
+        if stats.cache_depth == 0:
+            stats.cache_hits += len(values)
+            stats.cache_misses += len(keys) - len(values)
+        return values
+
+    counted_get_many.perf_wrapped = True
+    return counted_get_many
+
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def install():
+    """DB 연결 / 템플릿 / 캐시 백엔드에 측정 코드를 연결합니다. (여러 번 불러도 한 번만 실행)"""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        # DB: 새로 만들어지는 연결 + 이미 열려 있는 연결
+        connection_created.connect(_add_db_wrapper, dispatch_uid='boards.perf')
+        for connection in connections.all(initialized_only=True):
+            _add_db_wrapper(connection)
+
+        if not getattr(Template.render, 'perf_wrapped', False):
+            Template.render = _wrap_template_render(Template.render)
+
+        # 설정된 캐시 백엔드 클래스마다 get / get_many 를 감쌉니다.
+        for alias in settings.CACHES:
+            backend = import_string(settings.CACHES[alias]['BACKEND'])
+            if not getattr(backend.get, 'perf_wrapped', False):
+                backend.get = _wrap_cache_get(backend.get)
+            if not getattr(backend.get_many, 'perf_wrapped', False):
+                backend.get_many = _wrap_cache_get_many(backend.get_many)
+        _installed = True
+
+
+# ----------------------------------------------------------------------------
+# 집계 (프로세스 메모리)
+# ----------------------------------------------------------------------------
+
+_samples = defaultdict(lambda: deque(maxlen=_reservoir_size()))
+_samples_lock = threading.Lock()
+_last_publish = time.monotonic()
+
+
+def record(view_name, total, stats):
+    sample = (
+        round(total * 1000, 2),
+        round(stats.db_time * 1000, 2),
+        stats.db_count,
+        round(stats.template_time * 1000, 2),
+        stats.cache_hits,
+        stats.cache_misses,
+    )
+    with _samples_lock:
+        _samples[view_name].append(sample)
+
+
+def local_samples():
+    with _samples_lock:
+        return {view: list(samples) for view, samples in _samples.items()}
+
+
+def _process_key(process_id):
+    return f'{CACHE_KEY_PREFIX}:samples:{process_id}'
+
+
+def publish():
+    """이 프로세스의 기록을 공유 캐시에 올립니다. (같은 캐시를 쓰는 다른 프로세스/관리 명령에서 읽음)"""
+    timeout = max(_publish_interval() * 10, 600)
+    cache.set(_process_key(PROCESS_ID), local_samples(), timeout)
+    processes = cache.get(PROCESSES_KEY) or []
+    if PROCESS_ID not in processes:
+        cache.set(PROCESSES_KEY, [*processes, PROCESS_ID][-100:], None)
+
+
+def publish_due():
+    # PERF_PUBLISH_INTERVAL 초가 지났으면 True (여러 스레드 중 하나만 True 를 받음)
+    global _last_publish
+    now = time.monotonic()
+    with _samples_lock:
+        if now - _last_publish < _publish_interval():
+            return False
+        _last_publish = now
+    return True
+
+
+def collected_samples():
+    """모든 프로세스(공유 캐시에 올라온 것 + 이 프로세스)의 기록을 화면별로 합칩니다."""
+    processes = cache.get(PROCESSES_KEY) or []
+    published = cache.get_many([_process_key(p) for p in processes if p != PROCESS_ID])
+    merged = defaultdict(list)
+    for samples in [*published.values(), local_samples()]:
+        for view, rows in samples.items():
+            merged[view].extend(rows)
+    return merged
+
+
+def reset():
+    """기록 삭제 (이 프로세스 + 공유 캐시)"""
+    with _samples_lock:
+        _samples.clear()
+    processes = cache.get(PROCESSES_KEY) or []
+    cache.delete_many([PROCESSES_KEY, *[_process_key(p) for p in processes]])
+
+
+def percentile(values, pct):
+    # 가장 가까운 순위 방식 (run_benchmarks 의 지연 시간 백분위도 이 함수 사용)
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples=None):
+    """화면별 요약: 요청 수, 전체 시간 p50/p95/p99, 평균 쿼리 수, 쿼리 시간 p95, 템플릿 시간 p95, 캐시 적중률"""
+    if samples is None:
+        samples = collected_samples()
+    report = []
+    for view, rows in samples.items():
+        if not rows:
+            continue
+        columns = dict(zip(FIELDS, zip(*rows)))
+        hits, misses = sum(columns['cache_hits']), sum(columns['cache_misses'])
+        report.append({
+            'view': view,
+            'count': len(rows),
+            'p50_ms': percentile(columns['total_ms'], 50),
+            'p95_ms': percentile(columns['total_ms'], 95),
+            'p99_ms': percentile(columns['total_ms'], 99),
+            'db_count_avg': round(sum(columns['db_count']) / len(rows), 1),
+            'db_p95_ms': percentile(columns['db_ms'], 95),
+            'template_p95_ms': percentile(columns['template_ms'], 95),
+            'cache_hit_ratio': round(hits / (hits + misses), 3) if hits + misses else None,
+        })
+    report.sort(key=lambda row: row['p95_ms'], reverse=True)
+    return report
+
+
+# ----------------------------------------------------------------------------
+# 미들웨어
+# ----------------------------------------------------------------------------
+
+def server_timing(total, stats):
+    return ', '.join([
+        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.db_count} queries"',
+        f'tpl;dur={stats.template_time * 1000:.1f}',
+        f'cache;desc="{stats.cache_hits} hit {stats.cache_misses} miss"',
+        f'total;dur={total * 1000:.1f}',
+    ])
+
+
+class PerfMiddleware:
+    """PERF_SAMPLE_RATE 비율의 요청을 측정하는 미들웨어 (WSGI/ASGI, sync/async 뷰 모두 지원)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        install()
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if random.random() >= _sample_rate():
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        response = self.finish(request, response, time.perf_counter() - started, stats)
+        if publish_due():
+            publish()
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= _sample_rate():
+            return await self.get_response(request)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        response = self.finish(request, response, time.perf_counter() - started, stats)
+        if publish_due():
+            # 캐시 백엔드가 DB 캐시일 수도 있으므로 스레드에서 실행
+            await sync_to_async(publish)()
+        return response
+
+    def finish(self, request, response, total, stats):
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match is not None else 'unresolved'
+        if getattr(settings, 'PERF_SERVER_TIMING', True):
+            response.headers['Server-Timing'] = server_timing(total, stats)
+        record(view_name, total, stats)
+        return response
@@ -0,0 +1,122 @@
+# 게시판(Board) 목록 프로세스 캐시
+# 게시판 화면은 모두 get_object_or_404(Board, code=board_code) 로 시작해서 요청마다 Board 쿼리가 한 번씩 나갔습니다.
+# 게시판은 몇 줄뿐이고 거의 바뀌지 않으므로, 프로세스마다 한 번 읽어서 메모리에 두고 코드로 찾습니다.
+#  - 같은 프로세스: Board 저장/삭제 시그널(boards/signals.py)에서 invalidate() -> 바로 다시 읽음
+#  - 다른 프로세스(워커): invalidate() 가 공유 캐시의 버전 번호를 올리고,
+#    각 프로세스는 BOARD_REGISTRY_CHECK_INTERVAL 초마다 버전을 확인해서 바뀌었으면 다시 읽습니다.
+#  - 버전 번호는 캐시에 있으므로 워커마다 따로인 캐시(locmem 기본값)에서는 다른 워커의 변경이 보이지 않습니다.
+#    그래서 버전과 관계없이 읽은 지 BOARD_REGISTRY_MAX_AGE 초가 지나면 무조건 다시 읽습니다.
+# 돌려주는 Board 객체는 여러 요청이 함께 쓰므로 읽기 전용으로만 사용합니다. (수정은 Board.objects 로)
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
+
+from .models import Board
+
+VERSION_KEY = 'boards:registry:version'
+
+_lock = threading.Lock()
+# 현재 프로세스가 들고 있는 상태 (by_code, by_id, 읽었을 때의 버전, 마지막 버전 확인 시각, 읽은 시각)
+_state = None
+
+
+def _check_interval():
+    return getattr(settings, 'BOARD_REGISTRY_CHECK_INTERVAL', 1.0)
+
+
+def _max_age():
+    return getattr(settings, 'BOARD_REGISTRY_MAX_AGE', 60.0)
+
+
+def _shared_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # 버전 키가 캐시에서 사라진 경우: 현재 시각(밀리초)으로 새로 시작 (예전 번호로 돌아가지 않도록)
+        cache.add(VERSION_KEY, int(time.time() * 1000), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _load():
+    global _state
+    with _lock:
+        version = _shared_version()
+        boards = list(Board.objects.all())
+        now = time.monotonic()
+        _state = (
+            {board.code: board for board in boards},
+            {board.pk: board for board in boards},
+            version,
+            now,
+            now,
+        )
+        return _state
+
+
+def _fresh():
+    """확인 주기 안이면 메모리의 상태를 그대로 (I/O 없음), 아니면 None"""
+    state = _state
+    if state is not None and time.monotonic() - state[3] < _check_interval():
+        return state
+    return None
+
+
+def _current():
+    global _state
+    state = _fresh()
+    if state is not None:
+        return state
+    state = _state
+    now = time.monotonic()
+    if state is not None and now - state[4] < _max_age() and _shared_version() == state[2]:
+        # 다른 프로세스에서 바뀐 것이 없음 -> 확인 시각만 갱신
+        state = (*state[:3], now, state[4])
+        with _lock:
+            if _state is not None and _state[2] == state[2]:
+                _state = state
+        return state
+    return _load()
+
+
+def get(code):
+    """게시판 코드로 Board 를 찾습니다. (없으면 None)"""
+    return _current()[0].get(code)
+
+
+def get_by_id(board_id):
+    return _current()[1].get(board_id)
+
+
+def all_boards():
+    return list(_current()[0].values())
+
+
+def get_or_404(code):
+    board = get(code)
+    if board is None:
+        raise Http404('게시판이 없습니다.')
+    return board
+
+
+async def aget_or_404(code):
+    """get_or_404() 의 async 버전 - 확인 주기 안에서는 스레드 전환 없이 메모리에서 바로 찾습니다."""
+    state = _fresh() or await sync_to_async(_current)()
+    board = state[0].get(code)
+    if board is None:
+        raise Http404('게시판이 없습니다.')
+    return board
+
+
+def invalidate():
+    """게시판이 추가/수정/삭제되었을 때: 이 프로세스는 바로, 다른 프로세스는 다음 버전 확인 때 다시 읽습니다."""
+    global _state
+    with _lock:
+        _state = None
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, int(time.time() * 1000), timeout=None)
@@ -0,0 +1,296 @@
+# 게시글 검색 백엔드
+# 기존 검색은 Q(title__icontains=q) | Q(content__icontains=q) 로,
+# 모든 글의 content를 LIKE '%q%' 로 처음부터 끝까지 훑습니다. (글이 많아질수록 느려짐)
+# 여기서는 DB가 제공하는 전문 검색(Full-Text Search) 색인을 사용합니다.
+#  - SQLite    : FTS5 가상 테이블 (boards_post_fts), bm25() 로 정확도 순 정렬
+#  - PostgreSQL: tsvector 컬럼 + GIN 색인 테이블 (boards_post_search), ts_rank() 로 정렬
+#  - 그 외/실패 : 기존 icontains 방식
+# 한국어는 띄어쓰기(단어 경계)만으로 검색이 잘 안 되므로('안녕하세요'에서 '하세' 검색 불가)
+# SEARCH_NGRAM=True 이면 글자를 2글자씩(bigram) 잘라서 색인합니다.
+# 검색할 때는 색인 테이블을 글과 JOIN 합니다. (boards/models.py 의 PostFTS / PostSearchDocument)
+# -> 관련도는 색인이 찾은 글마다 한 번만 계산되고, 글 테이블 별칭(alias)은 ORM 이 붙여 줍니다.
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, FloatField, Func, Lookup, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from .models import PostSearchDocument
+
+SQLITE_TABLE = 'boards_post_fts'
+POSTGRES_TABLE = 'boards_post_search'
+
+# 검색어를 단어 단위로 나눌 때 사용 (문자/숫자만 남김)
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def ngram_mode():
+    return getattr(settings, 'SEARCH_NGRAM', True)
+
+
+def ngrams(text, n=2):
+    """'안녕하세요 django' -> ['안녕', '녕하', '하세', '세요', 'dj', 'ja', 'an', 'ng', 'go']
+
+    n글자보다 짧은 단어는 그대로 둡니다.
+    """
+    grams = []
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) <= n:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+def short_words(q):
+    """n-gram 색인으로 찾을 수 없는 1글자 단어 목록
+
+    색인에는 2글자 조각만 있으므로 1글자 단어는 조각의 첫 글자로만 찾을 수 있어서
+    단어 끝 글자('안녕하세요'의 '요')를 놓칩니다. 이런 단어는 icontains 로 따로 거릅니다.
+    """
+    if not ngram_mode():
+        return []
+    return [word for word in _WORD_RE.findall(q.lower()) if len(word) < 2]
+
+
+def contains_all(queryset, words):
+    # 단어마다 제목이나 내용에 포함된 글만 (AND)
+    for word in words:
+        queryset = queryset.filter(Q(title__icontains=word) | Q(content__icontains=word))
+    return queryset
+
+
+def index_text(text):
+    # 색인에 넣을 문자열 (n-gram 모드면 2글자 조각들을 공백으로 이어붙임)
+    if ngram_mode():
+        return ' '.join(ngrams(text or ''))
+    return text or ''
+
+
+class IcontainsBackend:
+    """기존 방식: LIKE '%q%' 순차 검색 (색인 없음, 정렬은 호출한 쪽 그대로)"""
+
+    ranked = False
+
+    def install(self):
+        pass
+
+    def uninstall(self):
+        pass
+
+    def search(self, queryset, q):
+        return queryset.filter(Q(title__icontains=q) | Q(content__icontains=q))
+
+    def index(self, post):
+        pass
+
+    def remove(self, post_id):
+        pass
+
+    def reindex(self, queryset, chunk_size=1000):
+        return 0
+
+    def index_many(self, queryset, chunk_size=1000):
+        return 0
+
+
+class SqliteFTSBackend(IcontainsBackend):
+    """SQLite FTS5 전문 검색 (rowid = 게시글 id)"""
+
+    ranked = True
+
+    def install(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} "
+                f"USING fts5(title, content, tokenize='unicode61')"
+            )
+
+    def uninstall(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {SQLITE_TABLE}")
+
+    def match_expression(self, q):
+        # FTS5 MATCH 문법으로 변환. 각 조각을 큰따옴표로 감싸 특수문자를 무력화합니다.
+        # n-gram 모드: 단어마다 조각들을 구(phrase)로 묶어 순서대로 붙어있는 것만 찾음
+        #              '하세요' -> "하세 세요" / 1글자 단어는 여기서 빼고 icontains 로 거름 (short_words)
+        # 일반 모드  : "django"* (단어 접두어 검색)
+        # 여러 단어는 공백으로 이어서 모두 포함(AND)하는 글을 찾습니다.
+        parts = []
+        for word in _WORD_RE.findall(q.lower()):
+            if not ngram_mode():
+                parts.append(f'"{word}"*')
+            elif len(word) >= 2:
+                parts.append('"' + ' '.join(ngrams(word)) + '"')
+        return ' '.join(parts)
+
+    def search(self, queryset, q):
+        expression = self.match_expression(q)
+        short = short_words(q)
+        if not expression and not short:
+            return super().search(queryset, q)
+        if expression:
+            # JOIN boards_post_fts ON rowid = 글 번호 WHERE boards_post_fts MATCH '검색식'
+            # rank(= bm25())는 값이 작을수록(음수) 더 관련도가 높으므로 부호를 뒤집어 사용
+            queryset = queryset.filter(fts__document=expression).annotate(search_rank=-F('fts__rank'))
+        return contains_all(queryset, short)
+
+    def index(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid = %s", [post.pk])
+            cursor.execute(
+                f"INSERT INTO {SQLITE_TABLE} (rowid, title, content) VALUES (%s, %s, %s)",
+                [post.pk, index_text(post.title), index_text(post.content)],
+            )
+
+    def remove(self, post_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid = %s", [post_id])
+
+    def reindex(self, queryset, chunk_size=1000):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_TABLE}")
+        return self.index_many(queryset, chunk_size)
+
+    def index_many(self, queryset, chunk_size=1000):
+        # 색인에 아직 없는 글들을 한 번에 추가 (bulk_create 처럼 시그널 없이 넣은 글)
+        return _bulk_index(
+            queryset, chunk_size,
+            f"INSERT INTO {SQLITE_TABLE} (rowid, title, content) VALUES (%s, %s, %s)",
+        )
+
+
+class PostgresBackend(IcontainsBackend):
+    """PostgreSQL tsvector + GIN 색인 (게시글마다 한 행)"""
+
+    ranked = True
+
+    # 'simple' 설정: 언어별 어간 분석 없이 토큰 그대로 (한국어 n-gram과 함께 쓰기 위함)
+    config = 'simple'
+
+    def install(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ("
+                f"post_id bigint PRIMARY KEY REFERENCES boards_post(id) ON DELETE CASCADE, "
+                f"document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {POSTGRES_TABLE}_document_gin "
+                f"ON {POSTGRES_TABLE} USING GIN (document)"
+            )
+
+    def uninstall(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {POSTGRES_TABLE}")
+
+    def tsquery(self, q):
+        # 단어마다 phraseto_tsquery(붙어있는 조각 순서 일치)를 만들고 && (AND)로 묶습니다.
+        # 반환값: (SQL 조각, 파라미터 목록)
+        if ngram_mode():
+            words = [' '.join(ngrams(word)) for word in _WORD_RE.findall(q.lower()) if len(word) >= 2]
+        else:
+            words = _WORD_RE.findall(q.lower())
+        sql = ' && '.join(f"phraseto_tsquery('{self.config}', %s)" for _ in words)
+        return sql, words
+
+    def search(self, queryset, q):
+        tsquery, params = self.tsquery(q)
+        short = short_words(q)
+        if not params and not short:
+            return super().search(queryset, q)
+        if params:
+            # JOIN boards_post_search ON post_id = 글 번호 WHERE document @@ tsquery
+            query = RawSQL(tsquery, params)
+            rank = Func(F('search_document__document'), query, function='ts_rank', output_field=FloatField())
+            queryset = queryset.filter(search_document__document__tsmatch=query).annotate(search_rank=rank)
+        return contains_all(queryset, short)
+
+    # 제목(A)에 걸린 단어가 내용(B)보다 높은 점수를 받도록 가중치를 줍니다.
+    def _upsert_sql(self):
+        return (
+            f"INSERT INTO {POSTGRES_TABLE} (post_id, document) VALUES "
+            f"(%s, setweight(to_tsvector('{self.config}', %s), 'A') || "
+            f"setweight(to_tsvector('{self.config}', %s), 'B')) "
+            f"ON CONFLICT (post_id) DO UPDATE SET document = EXCLUDED.document"
+        )
+
+    def index(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(self._upsert_sql(), [post.pk, index_text(post.title), index_text(post.content)])
+
+    def remove(self, post_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {POSTGRES_TABLE} WHERE post_id = %s", [post_id])
+
+    def reindex(self, queryset, chunk_size=1000):
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {POSTGRES_TABLE}")
+        return self.index_many(queryset, chunk_size)
+
+    def index_many(self, queryset, chunk_size=1000):
+        return _bulk_index(queryset, chunk_size, self._upsert_sql())
+
+
+class TSMatch(Lookup):
+    """document @@ tsquery (PostgreSQL 전문 검색 조건)"""
+
+    lookup_name = 'tsmatch'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} @@ {rhs}', [*lhs_params, *rhs_params]
+
+
+PostSearchDocument._meta.get_field('document').register_lookup(TSMatch)
+
+
+def _bulk_index(queryset, chunk_size, sql):
+    # 본문(content)이 큰 글이 많을 수 있으므로 chunk 단위로 읽고 executemany로 넣습니다.
+    count = 0
+    batch = []
+    rows = queryset.order_by('pk').values_list('pk', 'title', 'content')
+    with connection.cursor() as cursor:
+        for pk, title, content in rows.iterator(chunk_size=chunk_size):
+            batch.append((pk, index_text(title), index_text(content)))
+            if len(batch) >= chunk_size:
+                cursor.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+            count += len(batch)
+    return count
+
+
+# SEARCH_BACKEND 설정값 -> 백엔드 클래스
+BACKENDS = {
+    'icontains': IcontainsBackend,
+    'sqlite': SqliteFTSBackend,
+    'postgresql': PostgresBackend,
+}
+
+
+def get_backend():
+    """설정(SEARCH_BACKEND)과 현재 DB 종류에 맞는 검색 백엔드를 반환합니다.
+
+    'auto'(기본값)면 DB 종류로 고르고, 'boards.search.IcontainsBackend' 처럼
+    점(.)으로 된 경로를 주면 직접 만든 백엔드 클래스를 사용할 수 있습니다.
+    """
+    name = getattr(settings, 'SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = connection.vendor if connection.vendor in BACKENDS else 'icontains'
+    if '.' in name:
+        return import_string(name)()
+    return BACKENDS[name]()
+
+
+def search_posts(queryset, q):
+    """게시글 queryset을 검색어 q로 거른 결과를 반환합니다.
+
+    전문 검색 백엔드면 search_rank(관련도) 값이 함께 붙습니다.
+    """
+    return get_backend().search(queryset, q)
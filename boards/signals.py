@@ -0,0 +1,137 @@
+# 모델 저장/삭제 시 자동으로 실행되는 후처리(시그널) 모음
+# apps.py 의 BoardsConfig.ready() 에서 import 되어 연결됩니다.
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import dashboard, images, pagecache, registry
+from .models import Board, Comment, Post
+from .search import get_backend
+
+
+# 글 저장(작성/수정) 시 검색 색인 갱신
+@receiver(post_save, sender=Post)
+def update_search_index(sender, instance, **kwargs):
+    get_backend().index(instance)
+
+
+# 글 삭제 시 검색 색인에서도 제거
+@receiver(post_delete, sender=Post)
+def remove_search_index(sender, instance, **kwargs):
+    get_backend().remove(instance.pk)
+
+
+# 메인 대시보드 캐시 무효화 (boards/dashboard.py)
+# 글 작성/수정/삭제 -> 전체 공통 구역(인기글, 최신글) 삭제 + 작성자의 사용자별 구역 버전 올림
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_home_for_post(sender, instance, **kwargs):
+    dashboard.invalidate_global()
+    dashboard.bump_user_version(instance.author_id)
+
+
+# 댓글 작성/삭제 -> 댓글 작성자의 '내가 쓴 댓글' 구역
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_home_for_comment(sender, instance, **kwargs):
+    dashboard.bump_user_version(instance.author_id)
+
+
+# 좋아요 추가/취소 -> 누른 사람의 '좋아요 한 글' 구역
+# post.likes.add()/remove() (관리자 페이지 등) 를 쓰는 경우입니다.
+# 중간 테이블(Post.likes.through)을 직접 다루면 Django가 시그널을 보내지 않으므로
+# post_like 뷰에서는 dashboard.bump_user_version() 을 직접 호출합니다.
+@receiver(m2m_changed, sender=Post.likes.through)
+def invalidate_home_for_like_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        # user.like_posts.add(...) 처럼 사용자 쪽에서 바꾼 경우
+        dashboard.bump_user_version(instance.pk)
+    else:
+        for user_id in pk_set or ():
+            dashboard.bump_user_version(user_id)
+
+
+# 게시판 추가/수정/삭제 -> 프로세스마다 캐시해 둔 게시판 목록 다시 읽기 (boards/registry.py)
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_board_registry(sender, instance, **kwargs):
+    registry.invalidate()
+
+
+# 비로그인 사용자용 화면 캐시 무효화 (boards/pagecache.py)
+# 게시판 이름/설명 변경 -> 그 게시판 목록 화면
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_pages_for_board(sender, instance, **kwargs):
+    pagecache.bump(pagecache.board_tag(instance.code))
+
+
+# 글 작성/수정/삭제 -> 그 글의 상세 화면 + 게시판 목록 화면
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_pages_for_post(sender, instance, **kwargs):
+    pagecache.invalidate_post(instance.pk, board_id=instance.board_id)
+
+
+# 댓글 작성/수정/삭제 -> 댓글이 달린 글의 상세 화면 + 목록 화면(댓글 수)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_pages_for_comment(sender, instance, **kwargs):
+    pagecache.invalidate_post(instance.post_id)
+
+
+# 좋아요 (post.likes.add()/remove() 를 쓰는 경우 - post_like 뷰는 직접 무효화)
+@receiver(m2m_changed, sender=Post.likes.through)
+def invalidate_pages_for_like_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    for post_id in (pk_set or ()) if reverse else (instance.pk,):
+        pagecache.invalidate_post(post_id)
+
+
+# 이미지 축소본(썸네일/WebP) 만들기 (boards/images.py)
+# 게시글 첨부 이미지, 프로필 사진이 새로 올라오면 작업 큐에 넣습니다. (요청 응답은 기다리지 않음)
+# 트랜잭션이 확정된 뒤에 넣어야 작업 스레드가 롤백된 업로드를 처리하지 않습니다.
+# 사용자는 로그인할 때마다(last_login) 저장되므로, 이번 저장에서 새 파일이 올라온 경우에만 넣습니다.
+#  - update_fields 에 그 필드가 없으면 파일은 그대로
+#  - 새로 올린 파일은 저장 직전(pre_save)까지 아직 저장소에 쓰이지 않은(_committed=False) 상태
+UPLOAD_FLAG = '_thumbnail_uploads'
+
+
+def _mark_uploads(instance, field_names, update_fields):
+    instance.__dict__[UPLOAD_FLAG] = {
+        name for name in field_names
+        if (update_fields is None or name in update_fields)
+        and getattr(instance, name) and not getattr(instance, name)._committed
+    }
+
+
+def _enqueue_thumbnails(instance, field_name):
+    if field_name not in instance.__dict__.pop(UPLOAD_FLAG, ()):
+        return
+    name = getattr(instance, field_name).name
+    if images.needs_processing(name):
+        transaction.on_commit(lambda: images.enqueue(name))
+
+
+@receiver(pre_save, sender=Post)
+def mark_post_image_upload(sender, instance, update_fields=None, **kwargs):
+    _mark_uploads(instance, ['image'], update_fields)
+
+
+@receiver(post_save, sender=Post)
+def make_post_image_thumbnails(sender, instance, **kwargs):
+    _enqueue_thumbnails(instance, 'image')
+
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def mark_avatar_upload(sender, instance, update_fields=None, **kwargs):
+    _mark_uploads(instance, ['avatar'], update_fields)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def make_avatar_thumbnails(sender, instance, **kwargs):
+    _enqueue_thumbnails(instance, 'avatar')
@@ -0,0 +1,32 @@
+# boards 앱의 백그라운드 작업 (tasks/queue.py)
+# settings.TASK_QUEUE_ENABLED = True 일 때 요청 처리 대신 워커(run_task_worker)에서 실행됩니다.
+from tasks.queue import task
+
+from . import images, trending, viewcount
+
+
+# 조회수 반영: 한 번에 꺼낸 작업들의 {글 번호: 증가량} 을 합쳐서 UPDATE 몇 번으로 처리
+@task('boards.apply_views', batch=True)
+def apply_views(payloads):
+    counts = {}
+    for payload in payloads:
+        for post_id, n in payload['counts'].items():
+            # JSON 으로 저장되면서 글 번호가 문자열이 되므로 다시 숫자로
+            counts[int(post_id)] = counts.get(int(post_id), 0) + n
+    viewcount.apply(counts)
+
+
+# 이미지 축소본(썸네일/WebP) 만들기 - 같은 이미지는 dedup_key 로 한 번만 대기
+@task('boards.make_thumbnails')
+def make_thumbnails(name):
+    images.process(name)
+
+
+# 인기글 순위 다시 계산 - 실행할 때마다 TRENDING_REFRESH_INTERVAL 뒤의 다음 계산을 예약
+# (처음 한 번은 python manage.py refresh_trending --schedule 로 넣습니다.)
+@task('boards.refresh_trending')
+def refresh_trending():
+    # 먼저 예약해 두어야 이번 계산이 실패해도 주기가 끊기지 않음
+    # (실패한 이 작업의 재시도는 같은 dedup_key 로 대기 중인 다음 예약에 합쳐짐)
+    trending.schedule()
+    trending.refresh()
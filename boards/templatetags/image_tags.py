@@ -0,0 +1,39 @@
+# 이미지 축소본 템플릿 태그 (boards/images.py)
+# 사용법: {% load image_tags %}
+#   {% picture user.avatar 32 height=32 class="rounded-circle" alt="profile" %}
+#     -> WebP 를 지원하는 브라우저는 WebP, 아니면 JPEG/PNG 축소본을 받는 <picture> 태그
+#   {% thumbnail_url post.image 480 %}
+#     -> 표시 크기에 맞는 WebP 축소본 URL만 필요할 때
+# 축소본이 아직 만들어지지 않았으면 원본 URL을 그대로 사용합니다.
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from boards import images
+
+register = template.Library()
+
+
+@register.simple_tag
+def thumbnail_url(field, width, format=images.WEBP):
+    return images.variant_url(field, int(width), format)
+
+
+@register.simple_tag
+def picture(field, size, **attrs):
+    """size: 화면에 보여줄 가로 크기(px). 이 크기에 맞는 축소본을 고릅니다.
+    나머지 키워드(class, alt, width, height ...)는 img 태그 속성으로 그대로 들어갑니다."""
+    if not field:
+        return ''
+    size = int(size)
+    webp = images.variant_url(field, size)
+    fallback = images.variant_url(field, size, 'fallback')
+    attrs.setdefault('alt', '')
+    attrs.setdefault('loading', 'lazy')
+    img_attrs = format_html_join(' ', '{}="{}"', attrs.items())
+    if webp == field.url:
+        # 축소본이 아직 없음 -> 원본 한 장
+        return format_html('<img src="{}" {}>', fallback, img_attrs)
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}"><img src="{}" {}></picture>',
+        webp, fallback, img_attrs,
+    )
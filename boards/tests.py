@@ -1,3 +1,882 @@
-from django.test import TestCase
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.paginator import Paginator
+from django.db import DatabaseError, OperationalError, connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import dashboard, images, likes, registry, search, trending, viewcount
+from .models import Board, Comment, HotPost, Post
+from .pagination import _cursor_query, cursor_paginate, decode_cursor, encode_cursor, page_window
+from .viewfilter import ViewedFilter
+
+User = get_user_model()
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'tests'}}
+
+# 전체 테이블 스캔을 뜻하는 실행 계획 문구
+# SQLite    : 'SCAN boards_post' (뒤에 USING INDEX 가 없으면 테이블 전체를 읽음)
+# PostgreSQL: 'Seq Scan on boards_post'
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (?!.*\bUSING\b)(?P<table>\w+)'),
+    'postgresql': re.compile(r'\bSeq Scan on (?P<table>\w+)'),
+}
+
+
+class QueryPlanAssertions:
+    """queryset 의 EXPLAIN 에 색인 없는 전체 테이블 스캔이 없는지 확인 (accounts/tests.py 에서도 사용)"""
+
+    def assertUsesIndex(self, queryset):
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            self.skipTest(f'실행 계획 형식을 모르는 DB: {connection.vendor}')
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # 데이터가 적으면 PostgreSQL은 색인이 있어도 Seq Scan 을 고르므로
+                # '색인을 쓸 수 있는가'만 보도록 이 트랜잭션 안에서 순차 스캔을 끕니다.
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        scans = [match.group('table') for match in pattern.finditer(plan)]
+        self.assertFalse(scans, f"전체 스캔 ({', '.join(scans)})\n{plan}")
+
+
+def create_post(board=None, author=None, **fields):
+    author = author or User.objects.create_user(f'author{User.objects.count()}')
+    board = board or Board.objects.create(code=f'b{Board.objects.count()}', title='테스트 게시판')
+    fields.setdefault('title', '제목')
+    fields.setdefault('content', '내용')
+    return Post.objects.create(board=board, author=author, **fields)
+
+
+# 화면 테스트 공통: 캐시는 테스트마다 비우고, 조회수는 버퍼에만 쌓았다가 버림 (UPDATE 가 쿼리 수에 섞이지 않도록)
+@override_settings(
+    CACHES=LOCMEM_CACHE, PAGE_CACHE_ENABLED=True, VIEW_COUNT_FLUSH_INTERVAL=3600, TASK_QUEUE_ENABLED=False,
+    DATABASE_REPLICAS=[],
+)
+class BoardViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('viewer')
+        cls.board = Board.objects.create(code='free', title='자유게시판')
+        cls.post = create_post(cls.board, cls.user, title='상세', content='본문')
+        # 댓글 작성자가 여러 명이어도 쿼리 수가 같아야 함 (N+1 없음)
+        for i in range(3):
+            Comment.objects.create(post=cls.post, author=User.objects.create_user(f'commenter{i}'), content=f'댓글 {i}')
+
+    def setUp(self):
+        cache.clear()
+        # 게시판 목록은 프로세스 시작 후 첫 요청에서만 읽으므로 미리 읽어 둠
+        registry.invalidate()
+        registry.all_boards()
+
+    def tearDown(self):
+        viewcount._drain()
+
+    def detail_url(self, post=None):
+        post = post or self.post
+        return reverse('boards:board_detail', args=[self.board.code, post.pk])
+
+
+class BoardDetailQueryTests(BoardViewTestCase):
+    def test_anonymous(self):
+        # 글 + 댓글(작성자 JOIN) - ETag 는 화면 캐시 태그 버전만 사용 (쿼리 없음)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.detail_url())
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '댓글 2')
+
+    def test_anonymous_page_cache_hit(self):
+        self.client.get(self.detail_url())
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url())
+        self.assertEqual(response.status_code, 200)
+
+    def test_logged_in(self):
+        # 위 2개 + 세션 + 사용자 + 안 읽은 쪽지 수(캐시가 비었을 때만)
+        self.client.force_login(self.user)
+        with self.assertNumQueries(5):
+            response = self.client.get(self.detail_url())
+        self.assertEqual(response.status_code, 200)
+        with self.assertNumQueries(4):
+            self.client.get(self.detail_url())
+
+    def test_comment_count_does_not_add_queries(self):
+        self.client.force_login(self.user)
+        self.client.get(self.detail_url())
+        for i in range(5):
+            Comment.objects.create(post=self.post, author=User.objects.create_user(f'extra{i}'), content='추가 댓글')
+        with self.assertNumQueries(4):
+            self.client.get(self.detail_url())
+
+    def test_not_modified_without_queries(self):
+        etag = self.client.get(self.detail_url())['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_comment_changes_etag(self):
+        etag = self.client.get(self.detail_url())['ETag']
+        comment = Comment.objects.create(post=self.post, author=self.user, content='새 댓글')
+        response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '새 댓글')
+
+        etag = response['ETag']
+        comment.content = '고친 댓글'
+        comment.save()
+        self.assertEqual(self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_deleted_post_returns_404(self):
+        etag = self.client.get(self.detail_url())['ETag']
+        Post.objects.filter(pk=self.post.pk).get().delete()
+        self.assertEqual(self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag).status_code, 404)
+
+
+
+# 화면 캐시를 끈 경우(locmem 등): 태그 버전은 워커마다 따로이므로 ETag 를 DB 값으로 계산
+@override_settings(PAGE_CACHE_ENABLED=False)
+class ConditionalWithoutSharedCacheTests(BoardViewTestCase):
+    def list_url(self, **params):
+        url = reverse('boards:board_list', args=[self.board.code])
+        return f'{url}?sort={params["sort"]}' if params else url
+
+    def assertChanges(self, url, change):
+        """change() 뒤에는 예전 ETag 로 304 가 아니라 200 이어야 함 (다른 워커의 태그 버전 없이)"""
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        change()
+        # 이 프로세스의 태그 버전이 아니라 DB 값으로 달라져야 하므로 캐시를 비움
+        cache.clear()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_detail_not_modified(self):
+        # 태그 버전 대신 글 한 줄 + 댓글 MAX(updated_at) 를 읽음
+        response = self.client.get(self.detail_url())
+        self.assertTrue(response.has_header('ETag'))
+        self.assertTrue(response.has_header('Last-Modified'))
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_like_and_comment_counts(self):
+        self.assertChanges(self.detail_url(), lambda: Post.objects.filter(pk=self.post.pk).update(like_count=1))
+        comment = self.post.comments.first()
+        comment.content = '고침'
+        # 댓글 수정은 글의 updated_at 을 바꾸지 않음 -> 댓글 MAX(updated_at)
+        self.assertChanges(self.detail_url(), comment.save)
+        self.assertChanges(self.detail_url(), lambda: (
+            Comment.objects.filter(pk=comment.pk).delete(),
+            Post.objects.filter(pk=self.post.pk).update(comment_count=2),
+        ))
+
+    def test_detail_deleted_post_returns_404(self):
+        etag = self.client.get(self.detail_url())['ETag']
+        Post.objects.filter(pk=self.post.pk).get().delete()
+        self.assertEqual(self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag).status_code, 404)
+
+    def test_list_delete_and_counts(self):
+        other = create_post(self.board, self.user, title='다른 글')
+        self.assertChanges(self.list_url(), lambda: Post.objects.filter(pk=other.pk).update(like_count=3))
+        self.assertChanges(self.list_url(), lambda: Post.objects.filter(pk=other.pk).update(comment_count=3))
+        # 삭제는 MAX(updated_at) 를 바꾸지 않음 (가장 최근 글이 아니면)
+        older = Post.objects.filter(board=self.board).order_by('updated_at').first()
+        self.assertChanges(self.list_url(), lambda: Post.objects.filter(pk=older.pk).delete())
+
+    def test_list_hot_ranking(self):
+        self.assertChanges(self.list_url(sort='hot'), lambda: HotPost.objects.create(
+            board=self.board, post=self.post, rank=1, score=1.0, computed_at=timezone.now(),
+        ))
+
+
+class BoardListLinkTests(BoardViewTestCase):
+    def test_query_is_urlencoded_in_links(self):
+        # 검색어의 &, #, + 가 링크를 깨거나 다른 파라미터(mode=cursor 등)로 끼어들지 않아야 함
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('boards:board_list', args=[self.board.code]), {'q': 'a&mode=cursor#+'})
+        self.assertContains(response, '?q=a%26mode%3Dcursor%23%2B&sort=likes')
+        self.assertContains(response, '?page=1&q=a%26mode%3Dcursor%23%2B&sort=')
+        self.assertNotContains(response, 'q=a&mode=cursor')
+
+
+# 게시판 화면은 게시판을 프로세스 캐시(boards/registry.py)에서 찾으므로 boards_board 쿼리가 없어야 함
+# 화면 캐시/304 가 끼어들지 않도록 로그인 사용자로 요청
+class BoardLookupQueryTests(BoardViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+        self.client.get(reverse('home'))    # 세션/안 읽은 쪽지 수 캐시 채우기
+
+    def assertQueriesWithoutBoard(self, num, request):
+        with self.assertNumQueries(num), CaptureQueriesContext(connection) as queries:
+            response = request()
+        self.assertFalse([q['sql'] for q in queries if 'FROM "boards_board"' in q['sql']])
+        return response
+
+    def test_board_list(self):
+        response = self.assertQueriesWithoutBoard(5, lambda: self.client.get(reverse('boards:board_list', args=['free'])))
+        self.assertEqual(response.status_code, 200)
+
+    def test_board_detail(self):
+        response = self.assertQueriesWithoutBoard(4, lambda: self.client.get(self.detail_url()))
+        self.assertEqual(response.status_code, 200)
+
+    def test_board_write(self):
+        response = self.assertQueriesWithoutBoard(2, lambda: self.client.get(reverse('boards:board_write', args=['free'])))
+        self.assertEqual(response.status_code, 200)
+
+    def test_board_edit(self):
+        url = reverse('boards:board_edit', args=['free', self.post.pk])
+        response = self.assertQueriesWithoutBoard(4, lambda: self.client.get(url))
+        self.assertEqual(response.status_code, 200)
+
+    def test_board_delete(self):
+        doomed = create_post(self.board, self.user, title='삭제될 글')
+        url = reverse('boards:board_delete', args=['free', doomed.pk])
+        response = self.assertQueriesWithoutBoard(9, lambda: self.client.get(url))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Post.objects.filter(pk=doomed.pk).exists())
+
+    def test_comment_create(self):
+        url = reverse('boards:comment_create', args=['free', self.post.pk])
+        response = self.assertQueriesWithoutBoard(8, lambda: self.client.post(url, {'content': '댓글'}))
+        self.assertEqual(response.status_code, 302)
+
+    def test_unknown_board_404(self):
+        url = reverse('boards:board_detail', args=['no-such-board', self.post.pk])
+        response = self.assertQueriesWithoutBoard(2, lambda: self.client.get(url))
+        self.assertEqual(response.status_code, 404)
+
+    def test_board_save_reloads_this_process(self):
+        board = Board.objects.get(pk=self.board.pk)
+        board.title = '바뀐 이름'
+        board.save()
+        self.assertEqual(registry.get('free').title, '바뀐 이름')
+
+    @override_settings(BOARD_REGISTRY_CHECK_INTERVAL=0)
+    def test_board_save_reloads_other_processes(self):
+        # 다른 워커 프로세스를 흉내: 저장 전에 읽어 둔 상태를 그대로 들고 있고, 공유 캐시의 버전만 바뀜
+        stale = registry._current()
+        board = Board.objects.get(pk=self.board.pk)
+        board.title = '바뀐 이름'
+        board.save()
+        registry._state = stale
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(registry.get('free').title, '바뀐 이름')
+        self.assertEqual(len([q for q in queries if 'FROM "boards_board"' in q['sql']]), 1)
+        # 다시 읽은 뒤에는 버전이 같으므로 Board 쿼리 없음
+        with self.assertNumQueries(0):
+            registry.get('free')
+
+    @override_settings(BOARD_REGISTRY_CHECK_INTERVAL=0, BOARD_REGISTRY_MAX_AGE=30)
+    def test_reload_after_max_age_without_shared_version(self):
+        # 워커마다 캐시가 따로(locmem)라서 다른 워커의 저장이 버전 번호를 바꾸지 못하는 경우
+        registry._current()
+        Board.objects.filter(pk=self.board.pk).update(title='다른 워커에서 바꾼 이름')
+        now = time.monotonic()
+        with mock.patch.object(registry, 'time', mock.Mock(time=time.time, monotonic=lambda: now + 29)):
+            self.assertEqual(registry.get('free').title, '자유게시판')
+        with mock.patch.object(registry, 'time', mock.Mock(time=time.time, monotonic=lambda: now + 31)):
+            self.assertEqual(registry.get('free').title, '다른 워커에서 바꾼 이름')
+
+
+
+# 관리자 목록 화면 (config/admin_perf.py): 작성자/게시판/글을 JOIN 으로 읽으므로 줄이 늘어도 쿼리 수가 같아야 함
+@override_settings(CACHES=LOCMEM_CACHE, DATABASE_REPLICAS=[])
+class AdminChangelistQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', password='-')
+        cls.board = Board.objects.create(code='free', title='자유게시판')
+        cls.add_rows(0, 5)
+
+    @classmethod
+    def add_rows(cls, start, end):
+        for i in range(start, end):
+            author = User.objects.create_user(f'writer{i}')
+            post = create_post(cls.board, author, title=f'관리자 확인 {i}', content='-' * 1000)
+            Comment.objects.create(post=post, author=author, content='댓글')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def assertQueriesConstant(self, num, url):
+        self.client.get(url)    # 첫 요청의 일회성 쿼리(게시판 목록 캐시 등) 제외
+        with self.assertNumQueries(num):
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.add_rows(5, 30)
+        with self.assertNumQueries(num):
+            response = self.client.get(url)
+        self.assertEqual(response.context['cl'].result_count, 30)
+
+    def test_post_changelist(self):
+        self.assertQueriesConstant(8, reverse('admin:boards_post_changelist'))
+
+    def test_post_changelist_year_filter(self):
+        url = reverse('admin:boards_post_changelist') + f'?created={timezone.now().year}'
+        self.assertQueriesConstant(5, url)
+
+    def test_comment_changelist(self):
+        self.assertQueriesConstant(5, reverse('admin:boards_comment_changelist'))
+
+    def test_estimated_count_skips_full_count(self):
+        # 통계를 갱신하고 추정 개수 기준을 0으로 낮추면 거르지 않은 목록에서 전체 COUNT(*) 가 없어야 함
+        call_command('analyze_db', stdout=StringIO())
+        url = reverse('admin:boards_post_changelist')
+        with self.settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=0), CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        counts = [q['sql'] for q in queries if 'COUNT(' in q['sql']]
+        self.assertFalse([sql for sql in counts if 'WHERE' not in sql], counts)
+        self.assertEqual(response.context['cl'].result_count, 5)
+
+
+class DashboardInvalidationTests(BoardViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.other = User.objects.create_user('other')
+        dashboard.build_home_context(self.user)
+        dashboard.build_home_context(self.other)
+
+    def global_cached(self):
+        return all(dashboard.global_key(section) in cache for section in dashboard.GLOBAL_SECTIONS)
+
+    def user_cached(self, user):
+        version = dashboard.user_version(user.pk)
+        return all(dashboard.user_key(user.pk, version, section) in cache for section in dashboard.USER_SECTIONS)
+
+    def assertInvalidated(self, change, global_=False, users=()):
+        dashboard.build_home_context(self.user)
+        dashboard.build_home_context(self.other)
+        change()
+        self.assertEqual(self.global_cached(), not global_)
+        for user in (self.user, self.other):
+            self.assertEqual(self.user_cached(user), user not in users, user.username)
+
+    def test_post_create_update_delete(self):
+        post = create_post(self.board, self.other, title='새 글')
+        self.assertInvalidated(lambda: create_post(self.board, self.user), global_=True, users=[self.user])
+        post.title = '고친 글'
+        self.assertInvalidated(post.save, global_=True, users=[self.other])
+        self.assertInvalidated(post.delete, global_=True, users=[self.other])
+
+    def test_comment_create_delete(self):
+        comment = Comment.objects.create(post=self.post, author=self.other, content='댓글')
+        self.assertInvalidated(
+            lambda: Comment.objects.create(post=self.post, author=self.user, content='내 댓글'), users=[self.user],
+        )
+        self.assertInvalidated(comment.delete, users=[self.other])
+
+    def test_like_toggle_view(self):
+        self.client.force_login(self.other)
+        url = reverse('boards:post_like_toggle', args=[self.board.code, self.post.pk])
+        self.assertInvalidated(lambda: self.client.post(url), users=[self.other])
+        self.assertInvalidated(lambda: self.client.post(url), users=[self.other])
+
+    def test_like_m2m(self):
+        self.assertInvalidated(lambda: self.post.likes.add(self.other), users=[self.other])
+        self.assertInvalidated(lambda: self.user.like_posts.add(self.post), users=[self.user])
+        self.assertInvalidated(lambda: self.post.likes.remove(self.other), users=[self.other])
+
+    def test_home_shows_new_post(self):
+        self.client.force_login(self.user)
+        self.assertNotContains(self.client.get(reverse('home')), '방금 쓴 글')
+        create_post(self.board, self.user, title='방금 쓴 글')
+        self.assertContains(self.client.get(reverse('home')), '방금 쓴 글')
+
+    def test_warm_home_reads_no_sections(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('home'))
+        # 세션 + 사용자만 (구역 데이터와 안 읽은 쪽지 수는 캐시)
+        with self.assertNumQueries(2):
+            self.client.get(reverse('home'))
+
+
+# 이미지 축소본 작업은 새 파일이 올라온 저장에서만 (로그인마다 저장되는 last_login 등은 제외)
+class ThumbnailSignalTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root.name))
+        self.enterContext(mock.patch.object(images, 'enqueue'))
+        self.user = User.objects.create_user('uploader')
+
+    def upload(self, name='photo.jpg'):
+        return SimpleUploadedFile(name, b'-', content_type='image/jpeg')
+
+    def saved(self, instance, **kwargs):
+        """instance.save(**kwargs) 후 큐에 넣은 이미지 이름 목록"""
+        images.enqueue.reset_mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save(**kwargs)
+        return [call.args[0] for call in images.enqueue.call_args_list]
+
+    def test_avatar_only_on_upload(self):
+        self.user.avatar = self.upload()
+        self.assertEqual(self.saved(self.user), [self.user.avatar.name])
+        self.user.last_login = timezone.now()
+        self.assertEqual(self.saved(self.user, update_fields=['last_login']), [])
+        self.assertEqual(self.saved(self.user), [])
+
+        self.user.avatar = self.upload('other.jpg')
+        self.assertEqual(self.saved(self.user, update_fields=['last_login']), [])
+        self.assertEqual(self.saved(self.user, update_fields=['avatar']), [self.user.avatar.name])
+
+    def test_post_image_only_on_upload(self):
+        post = Post(board=Board.objects.create(code='photo', title='사진'), author=self.user, title='-', content='-')
+        post.image = self.upload()
+        self.assertEqual(self.saved(post), [post.image.name])
+        post.title = '고친 제목'
+        self.assertEqual(self.saved(post), [])
+
+
+# 인기글: refresh_trending 을 돌리기 전(HotPost 없음)에는 조회수 순, 계산한 뒤에는 저장된 순위
+class TrendingFallbackTests(BoardViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.popular = create_post(self.board, self.user, title='조회수 많은 글')
+        Post.objects.filter(pk=self.popular.pk).update(views=100)
+
+    def hot_list(self):
+        url = reverse('boards:board_list', args=[self.board.code])
+        self.client.force_login(self.user)
+        return [post.pk for post in self.client.get(url, {'sort': 'hot'}).context['posts']]
+
+    def test_top_without_ranking_uses_views(self):
+        self.assertFalse(HotPost.objects.exists())
+        self.assertEqual([post.pk for post in trending.top(limit=5)], [self.popular.pk, self.post.pk])
+        self.assertEqual([post.pk for post in trending.top(self.board, limit=1)], [self.popular.pk])
+        self.assertEqual(self.hot_list(), [self.popular.pk, self.post.pk])
+
+    def test_home_without_ranking_is_not_empty(self):
+        self.client.force_login(self.user)
+        hot_posts = self.client.get(reverse('home')).context['hot_posts']
+        self.assertEqual([post.pk for post in hot_posts], [self.popular.pk, self.post.pk])
+
+    def test_stored_ranking_wins(self):
+        for board in (None, self.board):
+            HotPost.objects.create(board=board, post=self.post, rank=1, score=1.0, computed_at=timezone.now())
+        self.assertEqual([post.pk for post in trending.top(limit=5)], [self.post.pk])
+        self.assertEqual(self.hot_list(), [self.post.pk])
+
+
+# 주기 스레드가 테스트 도중 끼어들지 않도록 반영 주기를 길게 잡고, flush() 는 테스트에서 직접 부릅니다.
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=3600, CACHES=LOCMEM_CACHE, TASK_QUEUE_ENABLED=False)
+class ViewCountTests(TransactionTestCase):
+    def setUp(self):
+        viewcount._drain()
+        cache.clear()
+        self.post = create_post()
+
+    def tearDown(self):
+        viewcount.stop_flusher()
+
+    def views(self):
+        self.post.refresh_from_db(fields=['views'])
+        return self.post.views
+
+    def hit_concurrently(self, threads=8, hits=500):
+        # 여러 스레드가 조회를 기록하는 동안 다른 스레드가 계속 flush -> 유실/중복 없이 모두 반영되어야 함
+        done = threading.Event()
+        errors = []
+
+        def flusher():
+            try:
+                while not done.is_set():
+                    viewcount.flush()
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        def visitor():
+            for _ in range(hits):
+                viewcount.record_hit(self.post.pk)
+
+        flushing = threading.Thread(target=flusher)
+        flushing.start()
+        visitors = [threading.Thread(target=visitor) for _ in range(threads)]
+        for thread in visitors:
+            thread.start()
+        for thread in visitors:
+            thread.join()
+        done.set()
+        flushing.join()
+        self.assertEqual(errors, [])
+        viewcount.flush()
+        return threads * hits
+
+    def test_concurrent_hits_are_not_lost(self):
+        total = self.hit_concurrently()
+        self.assertEqual(self.views(), total)
+
+    @override_settings(VIEW_COUNT_SHARED_CACHE=True)
+    def test_concurrent_hits_are_not_lost_shared_cache(self):
+        total = self.hit_concurrently()
+        self.assertEqual(self.views(), total)
+        self.assertEqual(viewcount.pending(self.post.pk), 0)
+
+    @override_settings(VIEW_COUNT_SHARED_CACHE=True)
+    def test_shared_add_retries_when_key_races(self):
+        # add 실패(키 있음) -> 다른 워커가 flush 로 키를 지워 incr 실패
+        # -> 또 다른 워커가 먼저 다시 add 해서 add 실패 -> incr 성공 (조회수가 사라지지 않음)
+        key = viewcount._cache_key(self.post.pk)
+        add, incr = cache.add, cache.incr
+        races = iter([lambda: None, lambda: cache.delete(key), lambda: cache.set(key, 2), lambda: None])
+
+        def racing_add(*args, **kwargs):
+            next(races)()
+            return add(*args, **kwargs)
+
+        def racing_incr(*args, **kwargs):
+            next(races)()
+            return incr(*args, **kwargs)
+
+        cache.set(key, 1)
+        with mock.patch.object(cache, 'add', racing_add), mock.patch.object(cache, 'incr', racing_incr):
+            viewcount._add_shared(self.post.pk, 3)
+        self.assertEqual(cache.get(key), 5)
+
+    def test_failed_flush_keeps_counts(self):
+        for _ in range(3):
+            viewcount.record_hit(self.post.pk)
+        with mock.patch.object(viewcount, 'apply', side_effect=DatabaseError), self.assertRaises(DatabaseError):
+            viewcount.flush()
+        self.assertEqual(viewcount.pending(self.post.pk), 3)
+        viewcount.flush()
+        self.assertEqual(self.views(), 3)
+
+    @override_settings(VIEW_COUNT_SHARED_CACHE=True)
+    def test_failed_flush_keeps_counts_shared_cache(self):
+        for _ in range(3):
+            viewcount.record_hit(self.post.pk)
+        with mock.patch.object(viewcount, 'apply', side_effect=DatabaseError), self.assertRaises(DatabaseError):
+            viewcount.flush()
+        self.assertEqual(viewcount.pending(self.post.pk), 3)
+        self.assertIsNone(cache.get(viewcount.FLUSH_LOCK_KEY))
+        viewcount.flush()
+        self.assertEqual(self.views(), 3)
+        self.assertEqual(viewcount.pending(self.post.pk), 0)
+
+    @override_settings(VIEW_COUNT_SHARED_CACHE=True)
+    def test_flush_all_restores_counts_on_failure(self):
+        viewcount.record_hit(self.post.pk, count=5)
+        viewcount._drain()      # 다른 워커가 기록한 조회수처럼 이 프로세스 버퍼에는 글 번호가 없음
+        with mock.patch.object(viewcount, 'apply', side_effect=DatabaseError), self.assertRaises(DatabaseError):
+            viewcount.flush_all()
+        self.assertEqual(viewcount.pending(self.post.pk), 5)
+        viewcount.flush_all()
+        self.assertEqual(self.views(), 5)
+
+    def test_flusher_logs_errors(self):
+        viewcount.record_hit(self.post.pk)
+        stop = threading.Event()
+        with mock.patch.object(viewcount, 'flush', side_effect=[DatabaseError('boom'), None]), \
+                mock.patch.object(stop, 'wait', side_effect=[False, False, True]), \
+                self.assertLogs('boards.viewcount', 'ERROR') as logs:
+            viewcount._run_flusher(stop)
+        self.assertIn('조회수 반영 실패', logs.output[0])
+
+
+class LikeToggleTests(TransactionTestCase):
+    def setUp(self):
+        self.post = create_post()
+        self.users = [User.objects.create_user(f'liker{i}') for i in range(4)]
+
+    def toggle(self, user_id):
+        # 테스트 DB(SQLite 공유 캐시 메모리 DB)는 다른 쓰기 트랜잭션을 기다리지 않고 바로 'table is locked' 를 냅니다.
+        # 트랜잭션 전체가 취소되므로 다시 누르는 것과 같음 (IntegrityError 등 다른 오류는 그대로 실패)
+        while True:
+            try:
+                return likes.toggle_like(self.post.pk, user_id)
+            except OperationalError as exc:
+                if 'locked' not in str(exc):
+                    raise
+                time.sleep(0.001)
+
+    def test_concurrent_toggles(self):
+        # 사용자마다 두 스레드가 같은 좋아요 버튼을 번갈아 누름 -> 중간 테이블과 like_count 가 같아야 함
+        presses = {user.pk: 0 for user in self.users}
+        errors = []
+        lock = threading.Lock()
+
+        def presser(user_id, times):
+            try:
+                for _ in range(times):
+                    self.toggle(user_id)
+                    with lock:
+                        presses[user_id] += 1
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        # 사용자 i 는 모두 합쳐 20 + i 번 누름 -> 홀수 번 누른 사용자만 좋아요 상태
+        threads = [
+            threading.Thread(target=presser, args=(user.pk, times))
+            for i, user in enumerate(self.users)
+            for times in (10, 10 + i)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.post.refresh_from_db(fields=['like_count'])
+        self.assertEqual(self.post.like_count, self.post.likes.count())
+        liked = {user.pk for user in self.post.likes.all()}
+        self.assertEqual(liked, {user_id for user_id, count in presses.items() if count % 2})
+
+    def test_toggle_missing_post(self):
+        with self.assertRaises(Post.DoesNotExist):
+            likes.toggle_like(self.post.pk + 1000, self.users[0].pk)
+        self.assertFalse(likes.Like.objects.exists())
+
+
+class CursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(code='cursor', title='커서')
+        cls.author = User.objects.create_user('cursor_author')
+        # 같은 시각에 쓴 글이 여러 개 있어도 id 로 순서가 정해져야 함
+        now = timezone.now()
+        for i in range(25):
+            post = create_post(cls.board, cls.author, title=f'글 {i}')
+            Post.objects.filter(pk=post.pk).update(created_at=now - timedelta(minutes=i // 3))
+
+    def posts(self):
+        return Post.objects.filter(board=self.board)
+
+    def walk(self, per_page=10):
+        pages, after = [], None
+        while True:
+            page = cursor_paginate(self.posts(), after=after, per_page=per_page)
+            pages.append([post.pk for post in page])
+            if not page.has_next:
+                return pages
+            after = page.next_cursor
+
+    def test_walk_visits_every_post_once_in_order(self):
+        pages = self.walk()
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        expected = list(self.posts().order_by('-created_at', '-id').values_list('pk', flat=True))
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_new_posts_do_not_shift_next_page(self):
+        first = cursor_paginate(self.posts(), per_page=10)
+        expected = cursor_paginate(self.posts(), after=first.next_cursor, per_page=10)
+        for _ in range(3):
+            create_post(self.board, self.author, title='새 글')
+        second = cursor_paginate(self.posts(), after=first.next_cursor, per_page=10)
+        self.assertEqual([p.pk for p in second], [p.pk for p in expected])
+
+    def test_previous_cursor_returns_same_page(self):
+        first = cursor_paginate(self.posts(), per_page=10)
+        second = cursor_paginate(self.posts(), after=first.next_cursor, per_page=10)
+        self.assertTrue(second.has_previous)
+        back = cursor_paginate(self.posts(), before=second.previous_cursor, per_page=10)
+        self.assertEqual([p.pk for p in back], [p.pk for p in first])
+        self.assertFalse(back.has_previous)
+        self.assertTrue(back.has_next)
+
+    def test_cursor_round_trip_and_invalid_token(self):
+        post = self.posts().first()
+        self.assertEqual(decode_cursor(encode_cursor(post)), (post.created_at, post.pk))
+        self.assertIsNone(decode_cursor('not-a-cursor'))
+        page = cursor_paginate(self.posts(), after='not-a-cursor', per_page=10)
+        self.assertFalse(page.has_previous)
+        self.assertEqual(len(page), 10)
+
+    def test_cursor_query_has_no_offset(self):
+        first = cursor_paginate(self.posts(), per_page=10)
+        with self.assertNumQueries(1) as queries:
+            cursor_paginate(self.posts(), after=first.next_cursor, per_page=10)
+        self.assertNotIn('OFFSET', queries.captured_queries[0]['sql'].upper())
+
+    def test_cursor_query_uses_index_range(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite 실행 계획 형식')
+        cursor = encode_cursor(self.posts().first())
+        for direction in ('after', 'before'):
+            qs, _, _ = _cursor_query(self.posts(), **{'after': None, 'before': None, direction: cursor}, per_page=10)
+            plan = qs.explain()
+            self.assertIn('post_board_created_idx', plan)
+            self.assertRegex(plan, r'board_id=\? AND created_at[<>]')
+
+
+# 자주 실행되는 화면별 쿼리가 색인을 타는지 (색인 마이그레이션이 빠졌거나 쿼리 모양이 바뀐 경우를 잡음)
+# 실제 값은 의미가 없으므로 1번 게시판/사용자 기준으로 실행 계획만 확인합니다.
+class BoardQueryPlanTests(QueryPlanAssertions, TestCase):
+    def test_board_list(self):
+        self.assertUsesIndex(Post.objects.filter(board_id=1).order_by('-created_at', '-id')[:10])
+
+    def test_home_hot_posts(self):
+        self.assertUsesIndex(HotPost.objects.filter(board__isnull=True).order_by('rank')[:5])
+
+    def test_board_list_hot(self):
+        self.assertUsesIndex(HotPost.objects.filter(board_id=1).order_by('rank')[:10])
+
+    def test_trending_refresh(self):
+        since = datetime(2000, 1, 1, tzinfo=dt_timezone.utc)
+        self.assertUsesIndex(Post.objects.filter(created_at__gte=since).values_list('pk', 'views'))
+
+    def test_home_my_posts(self):
+        self.assertUsesIndex(Post.objects.filter(author_id=1).order_by('-created_at')[:5])
+
+    def test_home_my_comments(self):
+        self.assertUsesIndex(Comment.objects.filter(author_id=1).order_by('-created_at')[:5])
+
+    def test_post_comments(self):
+        self.assertUsesIndex(Comment.objects.filter(post_id=1).order_by('created_at'))
+
+
+@override_settings(VIEW_FILTER_BITS=2048, VIEW_FILTER_HASHES=4)
+class ViewedFilterTests(SimpleTestCase):
+    today = date(2026, 3, 1)
+
+    def filled(self, keys):
+        viewed = ViewedFilter.from_cookie(None, today=self.today)
+        for key in keys:
+            viewed.add(key)
+        return viewed
+
+    def false_positive_rate(self, n, probes=100_000):
+        viewed = self.filled(range(n))
+        return sum(key in viewed for key in range(n, n + probes)) / probes
+
+    def test_no_false_negatives(self):
+        viewed = self.filled(range(1, 501))
+        self.assertTrue(all(key in viewed for key in range(1, 501)))
+
+    def test_false_positive_rate_within_documented_bound(self):
+        # 모듈 설명: n=100 이면 약 0.1%, n=200 이면 약 1.1%
+        self.assertLess(self.false_positive_rate(100), 0.002)
+        self.assertLess(self.false_positive_rate(200), 0.015)
+
+    def test_cookie_round_trip(self):
+        value = self.filled([3, 14, 159]).to_cookie()
+        self.assertTrue(value.startswith('20260301.'))
+        self.assertLess(len(value), 400)
+        viewed = ViewedFilter.from_cookie(value, today=self.today)
+        self.assertTrue(all(key in viewed for key in (3, 14, 159)))
+        self.assertNotIn(2, viewed)
+
+    def test_day_rollover_resets(self):
+        value = self.filled([1, 2, 3]).to_cookie()
+        viewed = ViewedFilter.from_cookie(value, today=self.today + timedelta(days=1))
+        self.assertEqual(viewed.day, '20260302')
+        self.assertFalse(any(viewed.bits))
+        self.assertNotIn(1, viewed)
+
+    def test_wrong_size_cookie_is_empty(self):
+        value = self.filled([1, 2, 3]).to_cookie()
+        with self.settings(VIEW_FILTER_BITS=1024):
+            viewed = ViewedFilter.from_cookie(value, today=self.today)
+            self.assertEqual(viewed.size, 1024)
+        self.assertFalse(any(viewed.bits))
+
+    def test_corrupt_cookie_is_empty(self):
+        for value in (None, '', 'garbage', '20260301.', '20260301.!!!@@@', '20260301.abc'):
+            with self.subTest(value=value):
+                viewed = ViewedFilter.from_cookie(value, today=self.today)
+                self.assertEqual(viewed.size, 2048)
+                self.assertFalse(any(viewed.bits))
+
+
+class PageWindowTests(SimpleTestCase):
+    def window(self, number, num_pages=100, size=5):
+        return list(page_window(Paginator(range(num_pages), 1).page(number), size=size))
+
+    def test_middle(self):
+        self.assertEqual(self.window(50), list(range(45, 56)))
+
+    def test_clamped_to_first_and_last_page(self):
+        self.assertEqual(self.window(2), list(range(1, 8)))
+        self.assertEqual(self.window(99), list(range(94, 101)))
+
+    def test_fewer_pages_than_window(self):
+        self.assertEqual(self.window(1, num_pages=3), [1, 2, 3])
+
+
+@override_settings(SEARCH_BACKEND='sqlite', SEARCH_NGRAM=True)
+class SqliteSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        if connection.vendor != 'sqlite':
+            return
+        cls.board = Board.objects.create(code='search', title='검색')
+        cls.author = User.objects.create_user('search_author')
+        texts = [
+            ('안녕하세요 장고', '데이터베이스 성능 이야기'),
+            ('장고 장고 장고', '장고 검색 색인 장고'),
+            ('캐시 이야기', '서버 캐시 설정'),
+            ('쪽지 기능', '받은 쪽지함과 보낸 쪽지함'),
+            ('Django tips', 'QuerySet and search'),
+        ]
+        cls.posts = [create_post(cls.board, cls.author, title=title, content=content) for title, content in texts]
+        Comment.objects.create(post=cls.posts[1], author=cls.author, content='댓글')
+
+    def setUp(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite FTS5 백엔드')
+
+    def search(self, q):
+        return search.search_posts(Post.objects.filter(board=self.board), q)
+
+    def expected(self, q):
+        # 기준: 단어마다 제목이나 내용에 포함 (icontains)
+        words = search._WORD_RE.findall(q.lower())
+        return set(search.contains_all(Post.objects.filter(board=self.board), words).values_list('pk', flat=True))
+
+    def test_matches_icontains_per_word(self):
+        for q in ['장고', '하세', '데이터베이스 성능', '쪽 지', '요', '함', 'django', 'query', '없는단어']:
+            with self.subTest(q=q):
+                self.assertEqual(set(self.search(q).values_list('pk', flat=True)), self.expected(q))
+
+    def test_rank_orders_by_relevance(self):
+        results = list(self.search('장고').order_by('-search_rank'))
+        self.assertEqual(results[0], self.posts[1])
+        self.assertGreater(results[0].search_rank, results[-1].search_rank)
+
+    def test_rank_is_computed_in_one_join(self):
+        sql = str(self.search('장고').order_by('-search_rank').query)
+        self.assertEqual(sql.upper().count('SELECT'), 1)
+        self.assertIn('JOIN "boards_post_fts"', sql)
+
+    def test_works_under_aliasing(self):
+        # 글 테이블이 다른 별칭(U0 등)으로 들어가는 서브쿼리 / 같은 테이블이 두 번 JOIN 되는 경우
+        matched = self.search('장고')
+        comments = Comment.objects.filter(post__in=matched)
+        self.assertEqual(list(comments.values_list('post_id', flat=True)), [self.posts[1].pk])
+        self.assertEqual(
+            set(Post.objects.filter(pk__in=matched.values('pk')).values_list('pk', flat=True)),
+            self.expected('장고'),
+        )
+        same_author = matched.filter(author__posts__title='캐시 이야기').distinct()
+        self.assertEqual(same_author.count(), len(self.expected('장고')))
+
+    def test_one_char_only_query_is_unranked(self):
+        qs = self.search('요')
+        self.assertNotIn('search_rank', qs.query.annotations)
+        self.assertNotIn('boards_post_fts', str(qs.query))
+
+    def test_deleted_post_leaves_index(self):
+        post = create_post(self.board, self.author, title='삭제할 글', content='지워질 내용')
+        self.assertTrue(self.search('삭제할').exists())
+        post.delete()
+        self.assertFalse(self.search('삭제할').exists())
@@ -0,0 +1,201 @@
+# 인기글(hot) 순위 계산 / 조회
+# 기존 메인 인기글은 Post.objects.order_by('-views')[:5] 였습니다.
+# -> 누적 조회수 기준이라 몇 년 전 글이 계속 1위를 차지하고, 요청마다 전체 글을 정렬합니다.
+#
+# 점수 = (조회수 * TRENDING_VIEW_WEIGHT + 좋아요 * TRENDING_LIKE_WEIGHT + 댓글 * TRENDING_COMMENT_WEIGHT)
+#        * 0.5 ^ (글 나이(시간) / TRENDING_HALF_LIFE_HOURS)
+# (반감기마다 점수가 절반이 되는 지수 감쇠 -> 새 글이 같은 반응을 얻으면 예전 글보다 위로)
+#
+# refresh() 가 주기적으로(python manage.py refresh_trending 또는 작업 큐) 점수를 계산해서
+# 전체 / 게시판별 TOP N 을 HotPost 테이블에 저장하고, 화면은 top() 으로 저장된 순위를 rank 순서로 읽기만 합니다.
+#  - refresh_trending 은 따로 예약해서 돌려야 합니다. (cron, --interval, 또는 --schedule + run_task_worker)
+#    한 번도 돌리지 않았으면 HotPost 가 비어 있으므로 화면은 조회수 순으로 대신 보여줍니다.
+#  - 계산 대상은 최근 TRENDING_WINDOW_HOURS 안에 쓴 글뿐입니다. (그보다 오래된 글은 감쇠로 점수가 거의 0)
+#    -> 전체 글 수가 늘어나도 계산량은 '최근 글 수'에만 비례
+#  - 순위가 그대로인 게시판은 다시 쓰지 않고, 바뀐 게시판만 HotPost 를 교체하고 화면 캐시를 무효화합니다.
+import heapq
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from . import dashboard, pagecache, registry
+from .models import HotPost, Post
+from .pagination import count_cache_key
+
+# 작업 큐에서 다음 계산 예약이 하나만 대기하도록 하는 dedup_key
+REFRESH_DEDUP_KEY = 'trending:refresh'
+
+
+def _size():
+    # 전체 / 게시판별로 저장할 순위 개수 (게시판 목록 '인기순' 탭은 이 개수까지만 보여줌)
+    return getattr(settings, 'TRENDING_SIZE', 50)
+
+
+def _half_life_hours():
+    return getattr(settings, 'TRENDING_HALF_LIFE_HOURS', 24)
+
+
+def _window_hours():
+    return getattr(settings, 'TRENDING_WINDOW_HOURS', 24 * 7)
+
+
+def _weights():
+    return (
+        getattr(settings, 'TRENDING_VIEW_WEIGHT', 1),
+        getattr(settings, 'TRENDING_LIKE_WEIGHT', 5),
+        getattr(settings, 'TRENDING_COMMENT_WEIGHT', 3),
+    )
+
+
+def refresh_interval():
+    return getattr(settings, 'TRENDING_REFRESH_INTERVAL', 60)
+
+
+# ----------------------------------------------------------------------------
+# 점수 계산
+# ----------------------------------------------------------------------------
+
+def score(views, likes, comments, created_at, now):
+    """글 하나의 인기 점수 (now 시점 기준)"""
+    view_weight, like_weight, comment_weight = _weights()
+    engagement = views * view_weight + likes * like_weight + comments * comment_weight
+    age_hours = max(0.0, (now - created_at).total_seconds() / 3600)
+    return engagement * math.exp(-math.log(2) * age_hours / _half_life_hours())
+
+
+def compute(now=None):
+    """최근 글의 점수를 계산해서 {게시판 id(None=전체): [(점수, 글 id), ...] 높은 순} 을 돌려줍니다."""
+    now = now or timezone.now()
+    since = now - timedelta(hours=_window_hours())
+    rows = (
+        Post.objects.filter(created_at__gte=since)
+        .values_list('pk', 'board_id', 'views', 'like_count', 'comment_count', 'created_at')
+        .iterator(chunk_size=2000)
+    )
+
+    by_board = defaultdict(list)
+    for pk, board_id, views, likes, comments, created_at in rows:
+        value = score(views, likes, comments, created_at, now)
+        if value > 0:
+            # 점수가 같으면 최신 글(id 큰 글)이 위로
+            by_board[board_id].append((value, pk))
+
+    size = _size()
+    ranking = {None: heapq.nlargest(size, (entry for entries in by_board.values() for entry in entries))}
+    for board_id, entries in by_board.items():
+        ranking[board_id] = heapq.nlargest(size, entries)
+    return ranking
+
+
+def refresh(now=None):
+    """순위를 다시 계산해서 HotPost 에 저장하고, 순위가 바뀐 범위(None=전체, 게시판 id) 목록을 돌려줍니다."""
+    now = now or timezone.now()
+    ranking = compute(now)
+
+    stored = defaultdict(list)
+    for board_id, post_id in HotPost.objects.order_by('board_id', 'rank').values_list('board_id', 'post_id'):
+        stored[board_id].append(post_id)
+
+    # 점수는 시간이 지나면 조금씩 줄어들 뿐이므로, 순서가 그대로인 범위는 다시 쓰지 않습니다.
+    changed = [
+        board_id for board_id in set(ranking) | set(stored)
+        if [pk for _, pk in ranking.get(board_id, [])] != stored.get(board_id, [])
+    ]
+    if not changed:
+        return []
+
+    with transaction.atomic():
+        for board_id in changed:
+            HotPost.objects.filter(board_id=board_id).delete()
+        HotPost.objects.bulk_create([
+            HotPost(board_id=board_id, post_id=pk, rank=rank, score=value, computed_at=now)
+            for board_id in changed
+            for rank, (value, pk) in enumerate(ranking.get(board_id, []), start=1)
+        ])
+
+    _invalidate(changed)
+    return changed
+
+
+def _invalidate(changed):
+    # 메인 인기글 구역 / 게시판 목록 화면(인기순 탭) 캐시 + 인기순 탭의 전체 개수 캐시
+    if None in changed:
+        dashboard.invalidate_global()
+    boards = [registry.get_by_id(board_id) for board_id in changed if board_id is not None]
+    boards = [board for board in boards if board is not None]
+    if boards:
+        pagecache.bump(*[pagecache.board_tag(board.code) for board in boards])
+        cache.delete_many([count_cache_key(board, scope='hot') for board in boards])
+
+
+def schedule(delay=None):
+    """작업 큐에 다음 순위 계산을 예약합니다. (boards/tasks.py 의 refresh_trending 이 실행 후 다시 예약)"""
+    from tasks import queue
+
+    queue.enqueue('boards.refresh_trending', dedup_key=REFRESH_DEDUP_KEY,
+                  delay=refresh_interval() if delay is None else delay)
+
+
+# ----------------------------------------------------------------------------
+# 조회
+# ----------------------------------------------------------------------------
+
+# 인기글 목록에 보여줄 글 컬럼 (본문 content 는 읽지 않음)
+TOP_FIELDS = (
+    'title', 'excerpt', 'created_at', 'views', 'like_count', 'comment_count',
+    'board__code', 'board__title', 'author__username',
+)
+
+
+def top(board=None, limit=None):
+    """저장된 인기글 순위 (board=None 이면 전체 게시판 통합)
+
+    Post 목록을 순위 순서대로 돌려주며, 각 글에 hot_rank / hot_score 를 붙여 둡니다.
+    hotpost_board_rank_idx 색인으로 limit 줄만 읽으므로 전체 글 수와 관계없이 일정한 시간이 걸립니다.
+    아직 순위를 계산한 적이 없으면(refresh_trending 을 돌리기 전) 예전처럼 조회수 순으로 대신합니다.
+    (점수 계산은 글 수에 비례하므로 요청 안에서 하지 않음)
+    """
+    entries = (
+        HotPost.objects.select_related('post__board', 'post__author')
+        .only(*[f'post__{field}' for field in TOP_FIELDS], 'rank', 'score')
+        .order_by('rank')
+    )
+    if board is None:
+        entries = entries.filter(board__isnull=True)
+    else:
+        entries = entries.filter(board=board)
+
+    posts = []
+    for entry in entries[:limit or _size()]:
+        post = entry.post
+        post.hot_rank, post.hot_score = entry.rank, entry.score
+        posts.append(post)
+    if not posts:
+        posts = _by_views(board, limit or _size())
+    return posts
+
+
+def _by_views(board, limit):
+    """순위가 아직 없을 때 대신 보여줄 조회수 순 목록 (기존 메인 인기글과 같은 기준)"""
+    posts = Post.objects.select_related('board', 'author').only(*TOP_FIELDS).order_by('-views', '-id')
+    if board is not None:
+        posts = posts.filter(board=board)
+    posts = list(posts[:limit])
+    for rank, post in enumerate(posts, 1):
+        post.hot_rank, post.hot_score = rank, None
+    return posts
+
+
+def hot_queryset(posts, board):
+    """게시판 목록 queryset 을 그 게시판의 인기 순위에 든 글만, 순위 순서로 (board_list 의 ?sort=hot)
+
+    그 게시판의 순위가 아직 없으면 top() 과 마찬가지로 조회수 순 TRENDING_SIZE 개로 대신합니다.
+    """
+    if not HotPost.objects.filter(board=board).exists():
+        return posts.order_by('-views', '-id')[:_size()]
+    return posts.filter(hot_entries__board=board).order_by('hot_entries__rank')
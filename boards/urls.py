@@ -1,5 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from . import views # 현재 폴더(.)에 있는 views.py를 가져옴
+from . import async_views # 읽기 화면의 async(ASGI) 버전
+
+# ASYNC_READ_VIEWS=True 면 목록/상세 화면을 async 뷰로 연결합니다. (ASGI 서버로 실행할 때)
+read_views = async_views if settings.ASYNC_READ_VIEWS else views
 
 # URL 네임스페이스(JSP에서 <c:url value='boards:list'> 처럼 쓰기 위함)
 app_name = 'boards'
@@ -18,17 +23,20 @@ urlpatterns = [
     # 주소 패턴: /board/자유게시판코드/
     # <str:board_code>: 자바의 @PathVariable String boardCode 와 동일
     # URL에 들어온 값을 'board_code'라는 변수에 담아 view로 넘깁니다.
-    path('<str:board_code>/', views.board_list, name='board_list'),
+    path('<str:board_code>/', read_views.board_list, name='board_list'),
 
     # 상세 화면
     # <int:pk> : 정수형(int) 변수를 받아서 'pk'라는 이름으로 뷰에 넘깁니다.
     # 자바의 @PathVariable int pk 와 같습니다.
     # 예시 URL: /board/free/1/
-    path('<str:board_code>/<int:pk>', views.board_detail, name='board_detail'),
+    path('<str:board_code>/<int:pk>', read_views.board_detail, name='board_detail'),
 
     # 등록 화면
     path('<str:board_code>/write/', views.board_write, name='board_write'),
 
+    # 글/댓글 내보내기 (관리자 전용, ?format=jsonl|csv&gzip=1)
+    path('<str:board_code>/export/', views.board_export, name='board_export'),
+
     # 수정 화면(글 번호 pk가 필요)
     path('<str:board_code>/<int:pk>/edit/', views.board_edit, name='board_edit'),
 
@@ -40,4 +48,5 @@ urlpatterns = [
 
     # 좋아요 토글 URL
     path('<str:board_code>/<int:pk>/like/', views.post_like, name='post_like'),
+    path('<str:board_code>/<int:pk>/like/toggle/', views.post_like_toggle, name='post_like_toggle'),    # 좋아요 API (JSON)
 ]
\ No newline at end of file
@@ -0,0 +1,260 @@
+# 조회수 버퍼링(write-behind) 모듈
+# 기존에는 상세 페이지 조회마다 post.views += 1; post.save() 를 실행했습니다.
+# -> 글 전체 행(row)을 다시 쓰고, 동시 요청끼리 값을 덮어써서 조회수가 유실되며,
+#    SQLite 쓰기 잠금까지 잡습니다.
+# 여기서는 조회 이벤트를 메모리(선택적으로 공유 캐시)에 모아두었다가
+# 주기적으로 UPDATE ... SET views = views + n 형태로 한 번에 반영합니다.
+import atexit
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from config.db_router import incidental_writes
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키 접두어 (공유 캐시 모드에서 사용)
+CACHE_KEY_PREFIX = 'viewcount'
+FLUSH_LOCK_KEY = f'{CACHE_KEY_PREFIX}:flush-lock'
+
+# 프로세스 내부 누적 버퍼 {post_id: 누적 조회수}
+_buffer = defaultdict(int)
+_lock = threading.Lock()
+
+# 주기적 반영(flush) 스레드
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def _flush_interval():
+    # 0 이하이면 버퍼링 없이 즉시 반영합니다. (테스트 환경 등)
+    return getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 10)
+
+
+def _use_shared_cache():
+    # True면 여러 프로세스(워커)가 공유하는 캐시(CACHES['default'])에 누적합니다.
+    return getattr(settings, 'VIEW_COUNT_SHARED_CACHE', False)
+
+
+def _cache_key(post_id):
+    return f'{CACHE_KEY_PREFIX}:{post_id}'
+
+
+def record_hit(post_id, count=1):
+    """조회 1건을 기록합니다. DB에는 flush() 시점에 반영됩니다."""
+    if _flush_interval() <= 0:
+        # 버퍼링을 끈 경우: F() 식으로 바로 반영 (경쟁 조건 없음)
+        _save({post_id: count})
+        return
+
+    if _use_shared_cache():
+        _add_shared(post_id, count)
+
+    # 공유 캐시 모드에서도 "이 프로세스가 건드린 글 번호"를 알기 위해 로컬 버퍼에 기록합니다.
+    with _lock:
+        _buffer[post_id] += count
+
+    _ensure_flusher()
+
+
+def _add_shared(post_id, count):
+    key = _cache_key(post_id)
+    # add()는 키가 없을 때만 저장 -> 이미 있으면 incr()로 원자적 증가
+    # add와 incr 사이에 다른 프로세스가 flush하며 키를 지우거나(incr 실패),
+    # 지운 키를 다시 add 하면(add 실패) 처음부터 다시 - 둘 중 하나가 성공할 때까지
+    while True:
+        if cache.add(key, count, timeout=None):
+            return
+        try:
+            cache.incr(key, count)
+            return
+        except ValueError:
+            continue
+
+
+def pending(post_id):
+    """아직 DB에 반영되지 않은 조회수 (화면 표시 보정용)"""
+    if _use_shared_cache():
+        return cache.get(_cache_key(post_id), 0)
+    with _lock:
+        return _buffer.get(post_id, 0)
+
+
+def _drain():
+    # 버퍼를 비우면서 {post_id: n} 스냅샷을 꺼냅니다.
+    global _buffer
+    with _lock:
+        snapshot = _buffer
+        _buffer = defaultdict(int)
+    return snapshot
+
+
+def _drain_shared(post_ids):
+    # 공유 캐시에서 누적값을 읽고, 읽은 만큼만 차감합니다.
+    # (읽은 뒤 다른 프로세스가 증가시킨 값은 남아서 다음 flush 때 반영됩니다.)
+    counts = {}
+    keys = {_cache_key(pid): pid for pid in post_ids}
+    for key, value in cache.get_many(list(keys)).items():
+        if not value:
+            continue
+        try:
+            cache.decr(key, value)
+        except ValueError:
+            continue
+        # 0 이 된 키도 지우지 않습니다. decr 과 delete 사이에 다른 프로세스가 incr 한 조회수까지 지워지므로
+        # (키는 조회된 글마다 하나뿐이고, 0 인 키는 다음 flush 에서 건너뜀)
+        counts[keys[key]] = value
+    return counts
+
+
+def _flush_shared(post_ids):
+    # 공유 캐시에서 꺼낸 값을 반영합니다. 반영(_save)이 실패하면 꺼낸 만큼 캐시에 되돌려 놓습니다.
+    # (decr 로 먼저 차감해야 동시에 flush 하는 다른 프로세스와 같은 조회수를 두 번 반영하지 않음)
+    counts = _drain_shared(post_ids)
+    try:
+        return _save(counts)
+    except Exception:
+        for post_id, n in counts.items():
+            _add_shared(post_id, n)
+        raise
+
+
+def _save(counts):
+    # 작업 큐를 쓰는 경우(TASK_QUEUE_ENABLED) UPDATE 는 워커에서 실행합니다. (boards/tasks.py 의 apply_views)
+    # 큐에는 INSERT 한 줄만 넣고, 워커가 여러 작업을 모아서 한 번에 반영합니다.
+    from tasks import queue
+
+    if not queue.enabled():
+        return apply(counts)
+    counts = {post_id: n for post_id, n in counts.items() if n > 0}
+    if counts:
+        queue.enqueue('boards.apply_views', {'counts': counts})
+    return len(counts)
+
+
+def apply(counts):
+    # 같은 증가량(n)을 가진 글끼리 묶어서 UPDATE 한 번으로 처리합니다.
+    # UPDATE boards_post SET views = views + n WHERE id IN (...)
+    from .models import Post
+
+    by_amount = defaultdict(list)
+    for post_id, n in counts.items():
+        if n > 0:
+            by_amount[n].append(post_id)
+
+    updated = 0
+    # 상세 화면(GET)에서 바로 반영해도 원본 고정 쿠키는 심지 않음 (config/db_router.py)
+    with incidental_writes():
+        for n, post_ids in by_amount.items():
+            updated += Post.objects.filter(pk__in=post_ids).update(views=F('views') + n)
+    return updated
+
+
+def flush():
+    """버퍼에 쌓인 조회수를 DB에 반영하고, 반영된 글 개수를 반환합니다."""
+    snapshot = _drain()
+    if not snapshot:
+        return 0
+
+    if not _use_shared_cache():
+        try:
+            return _save(snapshot)
+        except Exception:
+            # DB 오류 시 조회수를 잃지 않도록 버퍼에 되돌려 놓습니다.
+            with _lock:
+                for post_id, n in snapshot.items():
+                    _buffer[post_id] += n
+            raise
+
+    # 공유 캐시 모드: 동시에 두 프로세스가 flush하지 않도록 캐시 잠금을 겁니다.
+    if not cache.add(FLUSH_LOCK_KEY, 1, timeout=60):
+        # 다른 프로세스가 flush 중이면 글 번호만 남겨두고 다음 주기로 미룹니다.
+        with _lock:
+            for post_id in snapshot:
+                _buffer.setdefault(post_id, 0)
+        return 0
+    try:
+        return _flush_shared(snapshot.keys())
+    except Exception:
+        # 조회수는 캐시에 되돌려 놓았으므로 글 번호만 남겨서 다음 주기에 다시 꺼냅니다.
+        with _lock:
+            for post_id in snapshot:
+                _buffer.setdefault(post_id, 0)
+        raise
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+def flush_all(chunk_size=1000):
+    """관리 명령용: 이 프로세스 버퍼 + 공유 캐시에 남은 모든 조회수를 반영합니다.
+
+    공유 캐시 모드에서는 어느 워커가 어떤 글을 조회했는지 알 수 없으므로
+    글 번호를 chunk_size 단위로 훑으면서 캐시에 남은 누적값을 모두 꺼냅니다.
+    """
+    from .models import Post
+
+    updated = flush()
+    if not _use_shared_cache():
+        return updated
+
+    post_ids = Post.objects.order_by('pk').values_list('pk', flat=True)
+    chunk = []
+    for post_id in post_ids.iterator(chunk_size=chunk_size):
+        chunk.append(post_id)
+        if len(chunk) >= chunk_size:
+            updated += _flush_shared(chunk)
+            chunk = []
+    if chunk:
+        updated += _flush_shared(chunk)
+    return updated
+
+
+def _run_flusher(stop_event):
+    interval = _flush_interval()
+    while not stop_event.wait(interval):
+        try:
+            flush()
+        except Exception:
+            # 주기 스레드는 죽지 않고 다음 주기에 다시 시도합니다. (조회수는 버퍼/캐시에 남아 있음)
+            logger.exception('조회수 반영 실패')
+
+
+def _ensure_flusher():
+    # 첫 조회가 들어올 때 주기적 반영 스레드를 한 번만 띄웁니다.
+    global _flusher
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is not None:
+            return
+        stop_event = threading.Event()
+        thread = threading.Thread(target=_run_flusher, args=(stop_event,), name='viewcount-flusher', daemon=True)
+        thread.stop_event = stop_event
+        thread.start()
+        _flusher = thread
+
+
+def stop_flusher():
+    """주기 스레드를 멈추고 남은 조회수를 반영합니다."""
+    global _flusher
+    with _flusher_lock:
+        thread, _flusher = _flusher, None
+    if thread is not None:
+        thread.stop_event.set()
+        thread.join()
+    flush()
+
+
+def _flush_quietly():
+    try:
+        flush()
+    except Exception:
+        logger.exception('종료 시 조회수 반영 실패')
+
+
+# 프로세스 종료 시 버퍼에 남은 조회수를 반영
+atexit.register(_flush_quietly)
@@ -2,78 +2,139 @@
 # login_required : 로그인 안 한 사람은 못 들어오게 막는 어노테이션(Spring Security 설정과 유사)
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from .models import Board, Post, Comment
+from django.contrib.admin.views.decorators import staff_member_required
+from .models import Post, Comment
 from .forms import PostForm, CommentForm # 방금 만든 폼 가져오기
+from . import viewcount # 조회수 버퍼링(write-behind)
+from . import dashboard # 메인 대시보드 캐시
+from . import perf # 요청 단위 성능 측정
+from . import pagecache # 비로그인 사용자 화면 캐시
+from . import conditional # 조건부 요청(ETag / 304)
+from . import trending # 인기글 순위 (시간 감쇠 점수)
+from . import registry # 게시판 목록 프로세스 캐시 (코드 -> Board)
+from .export import FORMATS as EXPORT_FORMATS, BoardExport # 글/댓글 내보내기 (JSONL/CSV 스트리밍)
+from .viewfilter import COOKIE_NAME as VIEWED_COOKIE, ViewedFilter # 오늘 읽은 글 쿠키 (조회수 중복 방지)
+from .likes import toggle_like # 좋아요 토글 (동시 클릭에도 안전)
+from .dashboard import build_home_context
+from .search import search_posts
+from .pagination import CachedCountPaginator, cached_count, count_cache_key, cursor_paginate, page_window
+from django.conf import settings
+from config.db_router import replica_reads # 읽기 위주 화면은 복제 DB에서 조회
+from django.core.cache import cache
 from django.contrib import messages # 알림 메시지 띄우기용 (옵션)
-from django.core.paginator import Paginator # 페이징 도구
-from django.db.models import Q  # OR 조건을 쓰기 위한 도구
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Prefetch, Value
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_POST
 from django.utils import timezone
 from datetime import datetime, timedelta, time  # 날짜 계산용
 
 # 메인 페이지
+@replica_reads
 @login_required
 def home(request):
-    # 1. 내가 쓴 글(최신순 5개)
-    my_posts = Post.objects.filter(author=request.user).order_by('-created_at')[:5]
-
-    # 2. 내가 쓴 댓글 (최신순 5개)
-    # select_related('post'): 댓글이 달린 게시판 제목도 같이 가져오기 위해 (DB 성능 최적화)
-    my_comments = Comment.objects.filter(author=request.user).select_related('post').order_by('-created_at')[:5]
-
-    # 3. 내가 좋아요 한 글(최신순 5개)
-    # STEP 4에서 related_name='like_posts'로 설정했었습니다.
-    like_posts = request.user.like_posts.all().order_by('-id')[:5]
+    # 구역별 데이터는 boards/dashboard.py 에서 캐시와 함께 관리합니다.
+    # 1. 내가 쓴 글 / 내가 쓴 댓글 / 내가 좋아요 한 글 (사용자별 캐시)
+    # 2. 전체 인기글 / 자유게시판 최신글 (전체 공통 캐시)
+    context = build_home_context(request.user)
+    
+    return render(request, 'home.html', context)
 
-    # 커뮤니티 현황
-    # 1. 전체 게시판 통합 인기글 (조회수 높은 순 TOP 5)
-    # (나중에 '좋아요' 순으로 바꾸려면 order_by('-likes)로 변경 가능)
-    hot_posts = Post.objects.all().order_by('-views')[:5]
+# 게시판 목록 정렬 옵션 (?sort=값 -> order_by 기준)
+LIST_SORTS = {
+    'likes': ('-like_count', '-id'),
+    'comments': ('-comment_count', '-id'),
+    'views': ('-views', '-id'),
+}
+
+# 게시판 목록에서 실제로 보여주는 컬럼만 읽습니다. (번호, 제목, 미리보기, 작성자, 작성일, 조회수, 좋아요, 댓글 수)
+# 길이 제한 없는 본문(content)과 이미지 경로, 작성자의 나머지 컬럼(비밀번호 해시, 프로필 등)은 읽지 않습니다.
+# [주의] 템플릿에서 여기 없는 필드를 쓰면 글마다 쿼리가 한 번씩 더 나갑니다. (지연 로딩)
+LIST_FIELDS = ('title', 'excerpt', 'created_at', 'views', 'like_count', 'comment_count', 'board_id', 'author__username')
+
+# 게시판 목록 queryset (board_list 와 async 버전이 함께 사용)
+# 반환값: (queryset, 실제로 적용된 sort 값)
+def board_list_queryset(board, q, sort):
+    # Post 테이블에서 board가 위에서 찾은 board인 것만 필터링
+    # order_by('-created_at'): 작성일 역순(내림차순) 정렬. 앞에 '-'가 붙으면 DESC
+    # 같은 시간에 쓴 글이 있어도 순서가 흔들리지 않도록 id를 보조 정렬 기준으로 추가
+    # select_related('author'): 목록에 작성자 이름을 보여주므로 JOIN 으로 함께 가져옴 (N+1 방지)
+    # only(LIST_FIELDS): 목록에 보여주는 컬럼만 SELECT
+    posts = Post.objects.filter(board=board).select_related('author').only(*LIST_FIELDS).order_by('-created_at', '-id')
 
-    # 2. 자유게시판(free) 최신글 Top 5
-    # 주의: admin 페이지에서 코드가 'free'인 게시판을 먼저 만들어야 에러가 안 납니다.!
-    # 만약 게시판이 없다면 빈 리스트로 반환되므로 에러는 안납니다.
-    free_posts = Post.objects.filter(board__code='free').order_by('-created_at')[:5]
+    # 2-1. 검색 로직 추가
+    # URL에서 'q'라는 파라미터를 가져옵니다. (예: ?q=안녕)
+    if q:
+        # 기존: 제목/내용에 q가 포함된 것 필터링 (icontains = SQL의 LIKE %q%, 전체 글을 훑음)
+        #posts = posts.filter(Q(title__icontains=q) | Q(content__icontains=q))
+        # 변경: 전문 검색 색인(boards/search.py) 사용 -> 관련도(search_rank) 높은 순으로 정렬
+        posts = search_posts(posts, q)
+        if 'search_rank' in posts.query.annotations:
+            posts = posts.order_by('-search_rank', '-created_at', '-id')
+
+    # 2-1-1. 정렬 (?sort=likes 좋아요순 / comments 댓글순 / views 조회순)
+    # 좋아요 수/댓글 수는 Post에 저장된 카운터 컬럼(색인 있음)으로 정렬하므로 COUNT/GROUP BY가 없습니다.
+    if sort in LIST_SORTS:
+        posts = posts.order_by(*LIST_SORTS[sort])
+    elif sort == 'hot':
+        # 인기순 탭: 미리 계산해 둔 이 게시판의 인기 순위(boards/trending.py)에 든 글만 순위 순서로
+        posts = trending.hot_queryset(posts, board)
+    else:
+        sort = ''
+    return posts, sort
 
-    context = {
-        'my_posts': my_posts,
-        'my_comments': my_comments,
-        'like_posts': like_posts,
-        'hot_posts': hot_posts,
-        'free_posts': free_posts,
-    }
-    
-    return render(request, 'home.html', context)
 
 # 자바 Controller 메서드와 동일
 # request: 자바의 HttpServletRequest
 # board_code: URL에서 넘겨받은 게시판 코드 (예 : 'free')
+# 비로그인 사용자에게는 그려 둔 목록 화면을 재사용 (이 게시판의 글/댓글/좋아요가 바뀌면 바로 무효화)
+@replica_reads
+@conditional.conditional_page(conditional.board_list_validators)
+@pagecache.cache_anonymous_page(lambda board_code: [pagecache.board_tag(board_code)])
 def board_list(request, board_code):
 
     # 1. 게시판 정보 가져오기
     # BOARD 테이블에서 code가 board_code인 데이터를 찾습니다.
     # get_objtect_or_404: 데이터가 없으면 404 에러 페이지를 띄워줍니다(예외처리 자동화)
-    board = get_object_or_404(Board, code=board_code)
-
-    # 2. 해당 게시판의 글 목록 가져오기(모든 글)
-    # Post 테이블에서 board가 위에서 찾은 board인 것만 필터링
-    # order_by('-created_at'): 작성일 역순(내림차순) 정렬. 앞에 '-'가 붙으면 DESC
-    posts = Post.objects.filter(board=board).order_by('-created_at')
+    # -> 게시판은 프로세스에 캐시해 둔 목록에서 찾습니다. (쿼리 없음, boards/registry.py)
+    board = registry.get_or_404(board_code)
 
-    # 2-1. 검색 로직 추가
-    # URL에서 'q'라는 파라미터를 가져옵니다. (예: ?q=안녕)
+    # 2. 해당 게시판의 글 목록 가져오기 (검색어 q, 정렬 sort 반영)
     q = request.GET.get('q', '')
-
-    if q:
-        # 제목(title)에 q가 포함되어 있거나(OR) 내용(content)에 q가 포함된 것 필터링
-        #icontains : 대소문자 구별 없이 포함 여부 확인 (SQL의 LIKE %q%)
-        posts = posts.filter(Q(title__icontains=q) | Q(content__icontains=q))
+    posts, sort = board_list_queryset(board, q, request.GET.get('sort', ''))
 
     # 2-2. 페이징 처리
+    # 전체 글 개수(COUNT)는 캐시에 잠시 저장해두고 재사용합니다. (근사값)
+    count_key = count_cache_key(board, q, scope='hot' if sort == 'hot' else '')
+
+    # [커서 모드] ?mode=cursor 또는 설정(BOARD_LIST_PAGINATION='cursor')으로 켭니다.
+    # 페이지 번호 대신 after/before 토큰으로 이동 -> OFFSET 스캔이 없어 뒤쪽 페이지도 빠름
+    # (커서는 작성일 기준이므로 다른 정렬을 골랐을 때는 페이지 번호 방식을 사용)
+    mode = request.GET.get('mode', getattr(settings, 'BOARD_LIST_PAGINATION', 'page'))
+    if mode == 'cursor' and not sort:
+        page_obj = cursor_paginate(
+            posts,
+            after=request.GET.get('after'),
+            before=request.GET.get('before'),
+            per_page=10,
+        )
+        context = {
+            'board' : board,
+            'posts' : page_obj,
+            'q': q,
+            'sort': sort,
+            'cursor_mode': True,
+            'total_count': cached_count(posts, count_key),
+        }
+        return render(request, 'boards/board_list.html', context)
+
     # URL에서 'page'라는 파라미터를 가져옴 (없으면 기본값 1)
     page = request.GET.get('page', 1)
 
     # Paginator(데이터전체, 한페이지_개수) : 글을 10개씩 자르겠다는 설정
-    paginator = Paginator(posts, 10)
+    # CachedCountPaginator: 매 요청 COUNT(*) 대신 캐시된 개수를 사용하는 Paginator
+    paginator = CachedCountPaginator(posts, 10, count_key=count_key)
 
     # page_obj : 요청한 페이지에 해당하는 '진짜 데이터'와 '페이징 정보'가 담긴
     page_obj = paginator.get_page(page)
@@ -85,6 +146,10 @@ def board_list(request, board_code):
         #'posts' : posts
         'posts' : page_obj, # 기존 all_posts 대신 잘린 데이터(page_obj)를 넘깁니다.
         'q': q, # 검색어 템플릿으로 다시 돌려줘야 검색창에 글자가 유지됩니다.
+        'sort': sort,
+        # 전체 페이지 번호 대신 현재 페이지 앞뒤 5개만 보여줍니다.
+        'page_range': page_window(page_obj, size=5),
+        'total_count': paginator.count,
     }
 
     # 4. HTML 파일 렌더링
@@ -92,14 +157,84 @@ def board_list(request, board_code):
     return render(request, 'boards/board_list.html', context)
 
 
+# 상세 화면용 게시글 queryset
+# 템플릿에서 post.comments.count, post.likes.count, user in post.likes.all 처럼 쓰면
+# 그때마다 쿼리가 나가고(N+1), 좋아요 누른 사람 전체를 불러옵니다.
+# 댓글 수/좋아요 수는 Post에 저장된 카운터(comment_count, like_count)를 쓰고,
+# 내가 좋아요 했는지 여부와 댓글 목록만 미리 계산해서 붙여둡니다.
+def post_detail_queryset(user):
+    if user.is_authenticated:
+        # 좋아요 테이블에 (이 글, 나) 행이 있는지만 확인 (EXISTS)
+        has_liked = Exists(Post.likes.through.objects.filter(post=OuterRef('pk'), user=user.pk))
+    else:
+        has_liked = Value(False)
+
+    return (
+        Post.objects
+        .select_related('author', 'update_author')
+        .annotate(has_liked=has_liked)
+        .prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author').order_by('created_at', 'id'),
+                to_attr='comment_list',
+            )
+        )
+    )
+
+
+# 오늘 밤 자정까지 남은 시간(초) - 조회수 쿠키 유지 시간
+def seconds_until_midnight():
+    # 내일 0시 구하기
+    tomorrow = datetime.now() + timedelta(days=1)
+    midnight = datetime.combine(tomorrow, time.min)
+    return (midnight - datetime.now()).total_seconds()
+
+
+# 조회수 증가 (쿠키 사용) - 캐시된 화면(boards/pagecache.py)을 보여줄 때도 실행됩니다.
+def count_view(request, response, board_code, pk):
+    # 1. 오늘 읽은 글 목록 쿠키 읽기
+    # 기존: 글마다 hitboard_{게시판}_{글번호} 쿠키를 하나씩 심음 -> 쿠키 수백 개가 모든 요청에 실려 감
+    # 변경: 오늘 읽은 글 번호를 고정 크기 Bloom filter 쿠키 하나에 담음 (boards/viewfilter.py)
+    viewed = ViewedFilter.from_cookie(request.COOKIES.get(VIEWED_COOKIE))
+
+    # 2. 오늘 처음 읽는 글일 때만 조회수 증가
+    # (배포 당일에는 예전 방식 쿠키가 남아 있으므로 함께 확인 - 자정에 모두 만료됨)
+    if pk not in viewed and request.COOKIES.get(f'hitboard_{board_code}_{pk}') is None:
+        # 기존: post.views += 1; post.save() -> 글 전체를 다시 저장하고 동시 요청 시 조회수 유실
+        # 변경: 버퍼에 기록만 하고, 주기적으로 views = views + n 으로 일괄 반영
+        viewcount.record_hit(pk)
+
+        # 3. 쿠키 설정(오늘 밤 자정까지만 유지)
+        # response에 쿠키 심기 (set_cookie)
+        viewed.add(pk)
+        response.set_cookie(VIEWED_COOKIE, viewed.to_cookie(), max_age=seconds_until_midnight(), httponly=True, samesite='Lax')
+
+
+# URL 의 게시판 코드 + 글 번호로 (게시판, 글) 찾기 - 상세/수정/삭제/댓글 저장에서 사용
+# 기존: 게시판 쿼리 + 글 쿼리 (2번)
+# 변경: 게시판은 프로세스 캐시(boards/registry.py)에서 찾고, 글만 WHERE id = ? AND board_id = ? 로 1번
+def get_board_post(board_code, pk, queryset=None):
+    board = registry.get_or_404(board_code)
+    post = get_object_or_404(Post.objects.all() if queryset is None else queryset, pk=pk, board_id=board.pk)
+    # post.board 를 접근해도 다시 조회하지 않도록 찾아 둔 게시판을 붙여 둠
+    post.board = board
+    return board, post
+
+
+# 비로그인 사용자에게는 그려 둔 화면을 재사용 (글/댓글/좋아요가 바뀌면 바로 무효화)
+@replica_reads
+@conditional.conditional_page(conditional.board_detail_validators, on_not_modified=count_view)
+@pagecache.cache_anonymous_page(
+    lambda board_code, pk: [pagecache.post_tag(pk)], on_hit=count_view,
+)
 def board_detail(request, board_code, pk):
-    # 1. 게시판 확인(URL의 board_code가 유효한지)
-    board = get_object_or_404(Board, code=board_code)
-
-    # 2. 게시글 가져오기
+    # 1. 게시판 확인(URL의 board_code가 유효한지) + 2. 게시글 가져오기
     # Post 테이블에서 id가 pk인 것을 찾습니다.
-    # board=board 조건은, 남의 게시판 글을 ID만 바꿔서 접근하는 것을 막기 위합니다.
-    post = get_object_or_404(Post, pk=pk, board=board)
+    # board 조건은, 남의 게시판 글을 ID만 바꿔서 접근하는 것을 막기 위합니다.
+    # 댓글 수/좋아요 수/내가 좋아요 했는지 여부를 한 번의 쿼리로 함께 가져오고(annotate),
+    # 댓글 목록은 작성자까지 JOIN 해서 한 번에 미리 가져옵니다(prefetch).
+    board, post = get_board_post(board_code, pk, post_detail_queryset(request.user))
 
     # 2-1 조회수 1 증가 로직
     # 단순하게 새로고침할 때 마다 증가하는 방식입니다.
@@ -107,31 +242,21 @@ def board_detail(request, board_code, pk):
     #post.views += 1
     #post.save()
 
-    # 조회수 증가 로직 (쿠키 사용) 으로 변경
-    # 1. 쿠키 이름 정의(예: hitboard_free_15)
-    cookie_name = f'hitboard_{board_code}_{pk}'
+    # 조회수 증가 로직 (쿠키 사용) 으로 변경 -> count_view()
+
+    # 아직 DB에 반영되지 않은(버퍼에 쌓인) 조회수를 화면 표시용으로만 더해줍니다.
+    post.views += viewcount.pending(post.pk)
 
     # 2. 렌더링 미리 준비 (응답 객체를 만들어야 쿠키를 심을 수 있음)
     response = render(request, 'boards/board_detail.html', {
         'board' : board,
         'post' : post,
-        'comments' : post.comments.select_related('author').all(),  # 최적화 포함
-        'form' : CommentForm()  #댓글 폼
+        'comments' : post.comment_list,  # 작성자까지 미리 가져온 댓글 목록 (템플릿에서 추가 쿼리 없음)
+        'comment_form' : CommentForm()  #댓글 폼
     })
 
     # 3. 쿠키 확인: 쿠키가 없을 때만 조회수 증가
-    if request.COOKIES.get(cookie_name) is None:
-        post.views += 1
-        post.save()
-
-        # 4. 쿠키 설정(오늘 밤 자정까지만 유지)
-        # 내일 0시 구하기
-        tomorrow = datetime.now() + timedelta(days=1)
-        midnight = datetime.combine(tomorrow, time.min)
-        expires = (midnight - datetime.now()).total_seconds()
-
-        # response에 쿠키 심기 (set_cookie)
-        response.set_cookie(cookie_name, 'true', max_age=expires)
+    count_view(request, response, board_code, pk)
     
     """
     # 2-2 댓글 입력 폼을 생성해서 템플릿으로 보냄
@@ -151,7 +276,7 @@ def board_detail(request, board_code, pk):
 @login_required # 로그인이 필수라고 선언(로그인 안 되어 있으면 로그인 페이지로 보냄)
 def board_write(request, board_code):
     # 1.  게시판 확인
-    board = get_object_or_404(Board, code=board_code)
+    board = registry.get_or_404(board_code)
 
     # 2. 요청 방식에 따른 분기 (GET vs POST)
     if request.method == 'POST':
@@ -170,6 +295,9 @@ def board_write(request, board_code):
 
             post.save() # 이제 DB에 INSERT 전송
 
+            # 목록의 캐시된 전체 글 개수를 지워서 새 글이 바로 반영되도록 함
+            cache.delete(count_cache_key(board))
+
             # 글 작성 후 상세 페이지로 이동
             return redirect('boards:board_detail', board_code=board.code, pk=post.pk)
     else:
@@ -182,8 +310,7 @@ def board_write(request, board_code):
 # 게시글 수정
 @login_required
 def board_edit(request, board_code, pk):
-    board = get_object_or_404(Board, code=board_code)
-    post = get_object_or_404(Post, pk=pk, board=board)
+    board, post = get_board_post(board_code, pk)
 
     # [권한 체크] 작성자가 아니면 수정 불가
     if post.author != request.user and not request.user.is_board_manager and not request.user.superuser:
@@ -213,8 +340,7 @@ def board_edit(request, board_code, pk):
 # 게시글 삭제
 @login_required
 def board_delete(request, board_code, pk):
-    board = get_object_or_404(Board, code=board_code)
-    post = get_object_or_404(Post, pk=pk, board=board)
+    board, post = get_board_post(board_code, pk)
 
     # [권한 체크] 작성자가 아니면 삭제 불가
     '''
@@ -231,6 +357,7 @@ def board_delete(request, board_code, pk):
     # 기존 : 작성자 본인만 / 변경 : 작성자 본인 or 게시판 관리자 or 시스템관리자 가 삭제 가능
     if request.user == post.author or request.user.is_board_manager or request.user.is_superuser:
         post.delete()
+        cache.delete(count_cache_key(board))   # 캐시된 전체 글 개수 갱신
         return redirect('boards:board_list', board_code=board_code)
     else:
         # 권한 없는 사람이 시도하면 에러 페이지(403)를 띄우거나 뒤로 보냄
@@ -240,8 +367,7 @@ def board_delete(request, board_code, pk):
 # 댓글 저장 기능
 @login_required
 def comment_create(request, board_code, pk):
-    board = get_object_or_404(Board, code=board_code)
-    post = get_object_or_404(Post, pk=pk, board=board)
+    board, post = get_board_post(board_code, pk)
 
     if request.method == 'POST':
         form = CommentForm(request.POST)
@@ -249,7 +375,12 @@ def comment_create(request, board_code, pk):
             comment = form.save(commit=False)
             comment.author = request.user   # 작성자 : 현재 로그인한 사람
             comment.post = post             # 게시글 : 현재 보고 있는 글
-            comment.save()
+
+            # 댓글 저장과 댓글 수(+1) 갱신을 하나의 트랜잭션으로 묶습니다.
+            # F('comment_count') + 1 : DB에서 직접 더하므로 동시에 댓글이 달려도 숫자가 유실되지 않음
+            with transaction.atomic():
+                comment.save()
+                Post.objects.filter(pk=post.pk).update(comment_count=F('comment_count') + 1)
     
     # 댓글 저장 후 다시 상세 페이지로 리다이렉트
     return redirect('boards:board_detail', board_code=board.code, pk=post.pk)
@@ -292,23 +423,71 @@ def comment_delete(request, comment_pk):
 
     # 기존 : 작성자 본인만 / 변경 : 작성자 본인 or 게시판 관리자 or 시스템관리자가 삭제 가능
     if request.user == comment.author or request.user.is_board_manager or request.user.is_superuser:
-        comment.delete()
+        # 댓글 삭제와 댓글 수(-1) 갱신을 하나의 트랜잭션으로 묶습니다.
+        with transaction.atomic():
+            deleted, _ = Comment.objects.filter(pk=comment.pk).delete()
+            if deleted:
+                Post.objects.filter(pk=comment.post_id, comment_count__gt=0).update(comment_count=F('comment_count') - 1)
     
     # 삭제 후 원래 있던 게시글 상세 페이지로 돌아갑니다.
     return redirect('boards:board_detail', board_code=comment.post.board.code, pk=comment.post.pk)
 
+def _toggle_like(request, pk):
+    # [로직] 좋아요 토글 (Toggle) - 자세한 내용은 boards/likes.py
+    try:
+        liked, like_count = toggle_like(pk, request.user.pk)
+    except Post.DoesNotExist:
+        raise Http404('게시글이 없습니다.')
+
+    # 메인 화면의 '좋아요 한 글' 캐시 갱신 (중간 테이블 직접 변경은 시그널이 없으므로 직접 호출)
+    dashboard.bump_user_version(request.user.pk)
+    # 비로그인 사용자용 상세/목록 화면 캐시도 같은 이유로 직접 무효화
+    pagecache.invalidate_post(pk)
+    return liked, like_count
+
+
+# 좋아요 (JavaScript 를 쓰지 않는 경우): 처리 후 상세 페이지로 다시 이동
 @login_required
 def post_like(request, board_code, pk):
-    post = get_object_or_404(Post, pk=pk)
+    _toggle_like(request, pk)
 
-    # [로직] 좋아요 토글 (Toggle)
-    # filter(id=...): 현재 게시글의 좋아요 목록에 내 아이디가 있는지 확인
-    if post.likes.filter(id=request.user.id).exists():
-        # 이미 눌렀다면 -> 취소 (remove)
-        post.likes.remove(request.user)
-    else:
-        # 안 눌렀다면 -> 추가 (add)
-        post.likes.add(request.user)
-    
     # 처리가 끝나면 상세 페이지로 다시 이동
-    return redirect('boards:board_detail', board_code=board_code, pk=pk)
\ No newline at end of file
+    return redirect('boards:board_detail', board_code=board_code, pk=pk)
+
+
+# 좋아요 API (상세 페이지의 JavaScript 에서 호출)
+# 페이지 전체를 다시 그리지 않고 {"liked": true, "like_count": 12} 만 돌려줍니다.
+@require_POST
+@login_required
+def post_like_toggle(request, board_code, pk):
+    liked, like_count = _toggle_like(request, pk)
+    return JsonResponse({'liked': liked, 'like_count': like_count})
+
+
+# 화면별 성능 측정 결과 (boards/perf.py) - 관리자(staff)만
+# 모든 워커 프로세스의 기록을 합쳐 p95 가 느린 화면부터 JSON 으로 보여줍니다.
+@staff_member_required
+def perf_report(request):
+    return JsonResponse({
+        'enabled': settings.PERF_INSTRUMENTATION,
+        'sample_rate': settings.PERF_SAMPLE_RATE,
+        'views': perf.summarize(),
+    }, json_dumps_params={'ensure_ascii': False, 'indent': 2})
+
+
+# 게시판 글/댓글 내보내기 (boards/export.py) - 관리자(staff)만
+# /board/<게시판 코드>/export/?format=jsonl|csv&gzip=1
+# 묶음 단위로 만들면서 바로 보내므로 게시판이 커도 서버 메모리는 일정합니다.
+@staff_member_required
+def board_export(request, board_code):
+    board = registry.get_or_404(board_code)
+    fmt = request.GET.get('format', 'jsonl')
+    if fmt not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(f'format 은 {", ".join(EXPORT_FORMATS)} 중 하나입니다.')
+
+    export = BoardExport(board, fmt, compress=request.GET.get('gzip') == '1')
+    # ASGI 서버에서는 async iterator 로 넘겨야 전체를 메모리에 모으지 않고 조각마다 보냄
+    content = aiter(export) if isinstance(request, ASGIRequest) else iter(export)
+    response = StreamingHttpResponse(content, content_type=export.content_type)
+    response['Content-Disposition'] = f'attachment; filename="{export.filename}"'
+    return response
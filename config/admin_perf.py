@@ -0,0 +1,127 @@
+# 관리자 페이지 목록(changelist) 성능 설정 (boards/admin.py, accounts/admin.py 에서 사용)
+# 기본 ModelAdmin 목록 화면은 글/댓글이 많아지면 느려집니다.
+#  - 페이지마다 COUNT(*) 를 두 번 (걸러진 개수 + 전체 개수) -> 테이블 전체를 셈
+#  - date_hierarchy 는 연도 목록을 SELECT DISTINCT 연도 ... 로 구함 -> 테이블 전체를 읽음
+#  - list_display 의 외래 키(작성자, 게시판, 글)는 줄마다 쿼리 (N+1), ForeignKey 입력란은 전체 목록 <select>
+# 여기서는
+#  - EstimatedCountPaginator: 거르지 않은 목록은 DB 통계의 추정 행 수 사용 (PostgreSQL reltuples, SQLite sqlite_stat1)
+#  - DateDrillDownFilter    : 연도 -> 월 필터 (연도 범위는 색인 양 끝 두 줄로, 거르기는 색인 범위 검색으로)
+#  - FastChangelistMixin    : 위 두 가지 + 전체 개수 COUNT 끄기 + 목록에서 큰 컬럼(본문) 읽지 않기
+# 를 제공합니다. 추정 행 수는 통계를 갱신해야 맞으므로 python manage.py analyze_db 를 주기적으로 실행하세요.
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+def _estimate_threshold():
+    # 추정 행 수가 이보다 적으면 정확한 COUNT(*) 사용 (작은 테이블은 세는 비용이 작고, 추정이 부정확함)
+    return getattr(settings, 'ADMIN_ESTIMATED_COUNT_THRESHOLD', 100000)
+
+
+def estimated_row_count(model, using='default'):
+    """DB 통계에 저장된 테이블 행 수 추정값 (통계가 없으면 None)"""
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # ANALYZE / autovacuum 이 채우는 값 (한 번도 분석하지 않은 테이블은 -1)
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+            row = cursor.fetchone()
+            return row[0] if row and row[0] >= 0 else None
+        if connection.vendor == 'sqlite':
+            # ANALYZE(analysis_limit 로 표본만 읽음) 가 만드는 sqlite_stat1 의 'stat' 첫 숫자 = 행 수
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [table])
+            row = cursor.fetchone()
+            return int(row[0].split()[0]) if row else None
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """거르지 않은(검색/필터 없는) 큰 목록은 COUNT(*) 대신 통계의 추정 행 수를 쓰는 Paginator
+
+    추정값이므로 마지막 페이지 번호가 실제와 조금 다를 수 있습니다.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= _estimate_threshold():
+                return estimate
+        return super().count
+
+
+class DateDrillDownFilter(admin.SimpleListFilter):
+    """date_hierarchy 대신 쓰는 연도 -> 월 필터
+
+    연도 목록: 가장 오래된/최근 값 두 개만 색인으로 읽어서 그 사이 연도를 나열 (DISTINCT 스캔 없음)
+    거르기  : field >= 시작 AND field < 끝 (색인 범위 검색)
+    """
+    field_name = None   # 하위 클래스에서 지정 (예: 'created_at')
+
+    def lookups(self, request, model_admin):
+        value = self.value() or ''
+        if value[:4].isdigit():
+            # 연도를 고른 상태: 그 연도 + 12개월
+            year = int(value[:4])
+            return [(str(year), f'{year}년 전체')] + [(f'{year}-{month:02d}', f'{year}년 {month}월') for month in range(1, 13)]
+
+        values = model_admin.get_queryset(request).order_by(self.field_name).values_list(self.field_name, flat=True)
+        first, last = values.first(), values.last()
+        if first is None:
+            return []
+        first_year, last_year = timezone.localtime(first).year, timezone.localtime(last).year
+        return [(str(year), f'{year}년') for year in range(last_year, first_year - 1, -1)]
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if not value:
+            return queryset
+        try:
+            if len(value) == 4:
+                start = datetime(int(value), 1, 1)
+                end = datetime(start.year + 1, 1, 1)
+            else:
+                start = datetime.strptime(value, '%Y-%m')
+                end = datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+        except ValueError:
+            return queryset
+        tz = timezone.get_current_timezone()
+        return queryset.filter(**{
+            f'{self.field_name}__gte': timezone.make_aware(start, tz),
+            f'{self.field_name}__lt': timezone.make_aware(end, tz),
+        })
+
+
+class FastChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        # 목록 화면에서는 쓰지 않는 큰 컬럼(본문 등)을 읽지 않음 (수정 화면에는 영향 없음)
+        if self.model_admin.changelist_defer:
+            queryset = queryset.defer(*self.model_admin.changelist_defer)
+        return queryset
+
+
+class FastChangelistMixin:
+    """큰 테이블용 ModelAdmin 설정 (ModelAdmin 보다 앞에 상속)
+
+    list_select_related / autocomplete_fields 는 각 ModelAdmin 에서 지정합니다.
+    """
+    paginator = EstimatedCountPaginator
+    # 걸러진 개수 외에 '전체 N개' 를 위한 COUNT(*) 를 한 번 더 하지 않음
+    show_full_result_count = False
+    # 목록에서 읽지 않을 컬럼 (select_related 로 가져오는 관계의 컬럼도 'post__content' 처럼 지정 가능)
+    changelist_defer = ()
+
+    def get_changelist(self, request, **kwargs):
+        return FastChangeList
@@ -0,0 +1,177 @@
+# 읽기 전용 복제 DB(replica) 라우팅
+# settings.DATABASE_REPLICA_URLS 에 복제 DB를 적으면 'replica_1', 'replica_2' ... 로 등록되고
+# 읽기 위주 화면(@replica_reads: home, board_list, board_detail, message_list)의 조회 쿼리만 복제 DB로 보냅니다.
+# 쓰기와 그 밖의 화면은 모두 원본(default)을 사용합니다.
+#
+# 복제는 조금 늦게 따라오므로, 글/댓글/좋아요/쪽지를 쓴 직후 상세 화면으로 이동했을 때
+# 방금 쓴 내용이 안 보일 수 있습니다. (read-your-writes)
+# 그래서 요청 처리 중에 앱 데이터(boards, accounts)를 실제로 쓴 경우 응답에 쿠키를 심고,
+# 그 쿠키가 살아 있는 DATABASE_REPLICA_STICKY_SECONDS 동안은 그 사용자의 읽기도 원본에서 합니다.
+# GET 요청이라도 쓰기가 있으면 마찬가지입니다. (좋아요 링크 post_like, 쪽지 읽음 처리 message_detail)
+# 조회수 반영처럼 사용자가 바로 다시 확인할 내용이 아닌 쓰기는 incidental_writes() 로 감싸서 제외합니다.
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+STICKY_COOKIE = 'db_primary_until'
+
+# 요청 하나의 라우팅 상태 (ReplicaRoutingMiddleware / replica_reads 가 설정)
+_state = ContextVar('replica_routing_state', default=None)
+
+
+class RoutingState:
+    __slots__ = ('use_replica', 'wrote', 'incidental')
+
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+        self.incidental = False
+
+
+def _replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def _sticky_seconds():
+    return getattr(settings, 'DATABASE_REPLICA_STICKY_SECONDS', 10)
+
+
+def _routed_apps():
+    # 세션/캐시 테이블 등은 항상 원본 (방금 로그인한 세션을 복제 DB에서 못 찾는 일이 없도록)
+    return getattr(settings, 'DATABASE_REPLICA_APPS', ('boards', 'accounts'))
+
+
+def is_pinned(request):
+    """최근에 쓰기를 한 사용자면 True (쿠키의 만료 시각 이전)"""
+    try:
+        return float(request.COOKIES.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReplicaRouter:
+    """settings.DATABASE_ROUTERS 에 등록되는 라우터"""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        replicas = _replicas()
+        if state is None or not state.use_replica or not replicas:
+            return None
+        if model._meta.app_label not in _routed_apps():
+            return None
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        # 요청 처리 중에 앱 데이터를 바꾸면 (GET 포함) 응답에 원본 고정 쿠키를 심도록 표시
+        # (incidental_writes() 안의 조회수 반영 같은 부수적인 쓰기는 제외)
+        if state is not None and not state.incidental and model._meta.app_label in _routed_apps():
+            state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 원본과 복제본은 같은 데이터이므로 서로 다른 DB에서 읽은 객체끼리도 연결 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제 DB의 스키마는 복제로 따라오므로 migrate 는 원본에만
+        return db not in _replicas()
+
+
+class ReplicaRoutingMiddleware:
+    """요청마다 라우팅 상태를 만들고, 쓰기가 있었으면 원본 고정 쿠키를 심습니다."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.finish(state, response)
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.finish(state, response)
+
+    def finish(self, state, response):
+        if state.wrote:
+            window = _sticky_seconds()
+            response.set_cookie(
+                STICKY_COOKIE, str(int(time.time() + window)),
+                max_age=window, httponly=True, samesite='Lax',
+            )
+        return response
+
+
+@contextmanager
+def incidental_writes():
+    """이 안의 쓰기는 원본 고정 쿠키를 심지 않습니다. (조회수처럼 쓴 사용자가 바로 다시 확인하지 않는 값)"""
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    previous = state.incidental
+    state.incidental = True
+    try:
+        yield
+    finally:
+        state.incidental = previous
+
+
+def replica_reads(view):
+    """이 뷰의 조회 쿼리는 복제 DB에서 읽습니다. (최근에 쓰기를 한 사용자는 원본)"""
+    def enter(request):
+        state, token = _state.get(), None
+        if state is None:
+            # 미들웨어 없이 불린 경우 (테스트 클라이언트 설정이 다른 경우 등)
+            state = RoutingState()
+            token = _state.set(state)
+        previous = state.use_replica
+        state.use_replica = not is_pinned(request)
+        return state, previous, token
+
+    def leave(state, previous, token):
+        state.use_replica = previous
+        if token is not None:
+            _state.reset(token)
+
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            entered = enter(request)
+            try:
+                return await view(request, *args, **kwargs)
+            finally:
+                leave(*entered)
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        entered = enter(request)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            leave(*entered)
+    return wrapper
@@ -14,6 +14,7 @@ import dj_database_url
 from pathlib import Path
 from decouple import config     # 라이브러리 import
 from decouple import Csv
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -55,6 +56,7 @@ INSTALLED_APPS = [
     # Spring의 @ComponentScan 처럼, 여기에 등록해야 장고가 이 앱들을 관리합니다.
     'accounts', # 회원 관리 앱
     'boards',   # 게시판 관리 앱
+    'tasks',    # 백그라운드 작업 큐 (python manage.py run_task_worker)
 ]
 
 MIDDLEWARE = [
@@ -80,6 +82,8 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                # 상단 메뉴의 안 읽은 쪽지 배지 (accounts/unread.py)
+                'accounts.context_processors.unread_messages',
             ],
         },
     },
@@ -98,11 +102,113 @@ DATABASES = {
     }
 }
 
+# DB 연결 유지 설정 (모든 DB 공통)
+# CONN_MAX_AGE: 연결을 끊지 않고 재사용할 시간(초). 0 이면 요청마다 새로 연결 (PostgreSQL 은 매번 TCP + 인증)
+# (ASGI 로 실행할 때는 0 으로 두고 아래 DB_POOL 을 쓰는 것을 권장합니다.)
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+# 재사용하기 전에 연결이 살아 있는지 확인 (DB 재시작 후 첫 요청이 오류 나지 않도록)
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+
 # .env 파일에 'DATABASE_URL'이라는 설정이 있다면 그 설정으로 덮어씀 (배포용)
 db_config = config('DATABASE_URL', default=None)
 
 if db_config:
-    DATABASES['default'] = dj_database_url.parse(db_config)
+    DATABASES['default'] = dj_database_url.parse(
+        db_config, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=DB_CONN_HEALTH_CHECKS,
+    )
+else:
+    DATABASES['default'].update(CONN_MAX_AGE=DB_CONN_MAX_AGE, CONN_HEALTH_CHECKS=DB_CONN_HEALTH_CHECKS)
+
+# PostgreSQL 연결 풀 (psycopg 3 + psycopg_pool 필요: pip install "psycopg[binary,pool]")
+# 프로세스마다 연결을 DB_POOL_MIN_SIZE ~ DB_POOL_MAX_SIZE 개 열어 두고 요청끼리 나눠 씁니다.
+# 풀을 쓰면 CONN_MAX_AGE 는 0 이어야 합니다. (연결 재사용은 풀이 담당)
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+DB_POOL_MIN_SIZE = config('DB_POOL_MIN_SIZE', default=2, cast=int)
+DB_POOL_MAX_SIZE = config('DB_POOL_MAX_SIZE', default=10, cast=int)
+# 풀의 연결이 모두 사용 중일 때 기다리는 최대 시간(초)
+DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10, cast=int)
+
+# SQLite 설정 (기본 db.sqlite3 또는 DATABASE_URL=sqlite:///...)
+# - WAL: 읽기와 쓰기가 서로 막지 않음 (기본 journal 방식은 쓰는 동안 읽기도 대기)
+# - busy timeout: 다른 연결이 쓰는 중이면 바로 'database is locked' 오류 대신 이 시간(초)까지 기다림
+# - IMMEDIATE 트랜잭션: 시작할 때 쓰기 잠금을 잡아서, 읽다가 쓰기로 바꾸는 순간의 잠금 오류를 막음
+SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', default='WAL')
+SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default=20, cast=int)
+SQLITE_TRANSACTION_MODE = config('SQLITE_TRANSACTION_MODE', default='IMMEDIATE')
+# WAL 에서는 NORMAL 로도 DB 가 깨지지 않음 (전원이 꺼지면 마지막 커밋 몇 개만 잃을 수 있음)
+SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')
+# 연결마다 쓸 페이지 캐시 크기(KB)와 메모리 매핑 크기(MB)
+SQLITE_CACHE_SIZE_KB = config('SQLITE_CACHE_SIZE_KB', default=20000, cast=int)
+SQLITE_MMAP_SIZE_MB = config('SQLITE_MMAP_SIZE_MB', default=128, cast=int)
+
+# 읽기 전용 복제 DB (config/db_router.py) - 콤마로 구분한 DATABASE_URL 형식
+# 예: DATABASE_REPLICA_URLS=postgres://reader@replica1/board,postgres://reader@replica2/board
+# 로컬 확인용: DATABASE_REPLICA_URLS=sqlite:////tmp/replica.sqlite3 후 python manage.py sync_sqlite_replica
+DATABASE_REPLICA_URLS = config('DATABASE_REPLICA_URLS', default='', cast=Csv())
+DATABASE_REPLICAS = []
+for _index, _url in enumerate(DATABASE_REPLICA_URLS, start=1):
+    _alias = f'replica_{_index}'
+    DATABASES[_alias] = dj_database_url.parse(
+        _url, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=DB_CONN_HEALTH_CHECKS,
+    )
+    # 테스트 실행 시에는 복제 DB 대신 원본 테스트 DB를 그대로 사용
+    DATABASES[_alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(_alias)
+# 쓰기를 한 사용자의 읽기를 원본으로 고정하는 시간(초) - 복제 지연보다 길게
+DATABASE_REPLICA_STICKY_SECONDS = config('DATABASE_REPLICA_STICKY_SECONDS', default=10, cast=int)
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ['config.db_router.ReplicaRouter']
+    MIDDLEWARE.append('config.db_router.ReplicaRoutingMiddleware')
+
+for _db in DATABASES.values():
+    if _db['ENGINE'] == 'django.db.backends.sqlite3':
+        _db.setdefault('OPTIONS', {}).update({
+            'timeout': SQLITE_BUSY_TIMEOUT,
+            'transaction_mode': SQLITE_TRANSACTION_MODE,
+            # 연결할 때마다 실행 (Django 5.1+)
+            'init_command': ';'.join([
+                f'PRAGMA journal_mode={SQLITE_JOURNAL_MODE}',
+                f'PRAGMA synchronous={SQLITE_SYNCHRONOUS}',
+                f'PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}',
+                f'PRAGMA mmap_size={SQLITE_MMAP_SIZE_MB * 1024 * 1024}',
+                'PRAGMA temp_store=MEMORY',
+            ]),
+        })
+    elif _db['ENGINE'] == 'django.db.backends.postgresql' and DB_POOL:
+        _db['CONN_MAX_AGE'] = 0
+        _db.setdefault('OPTIONS', {})['pool'] = {
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+        }
+
+
+# Cache (캐시 설정)
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# CACHE_BACKEND 로 캐시 저장소를 고릅니다.
+# 'locmem'   : 프로세스 메모리 (기본값, 개발용 - 워커끼리 공유 안 됨)
+# 'file'     : 파일 캐시 (한 서버 안의 워커끼리 값은 보이지만 incr/decr 가 프로세스 사이에서 원자적이지 않음
+#               -> 동시에 올린 숫자가 사라질 수 있으므로 공유 캐시 대용이 아님, 개발/단일 워커용)
+# 'db'       : DB 캐시 (먼저 python manage.py createcachetable 실행 필요, incr/decr 는 원자적이지 않음)
+# 'redis'    : Redis (CACHE_LOCATION=redis://127.0.0.1:6379)
+# 'memcached': Memcached (CACHE_LOCATION=127.0.0.1:11211, pymemcache 설치 필요)
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'default'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / '.cache')),
+    'db': ('django.core.cache.backends.db.DatabaseCache', 'django_cache'),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379'),
+    'memcached': ('django.core.cache.backends.memcached.PyMemcacheCache', '127.0.0.1:11211'),
+}
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+_cache_class, _cache_location = CACHE_BACKENDS[CACHE_BACKEND]
+
+CACHES = {
+    'default': {
+        'BACKEND': _cache_class,
+        'LOCATION': config('CACHE_LOCATION', default=_cache_location),
+        'TIMEOUT': config('CACHE_TIMEOUT', default=300, cast=int),
+    }
+}
 
 
 # Password validation
@@ -166,4 +272,147 @@ LOGOUT_REDIRECT_URL = '/accounts/login/'
 MEDIA_URL = '/media/'
 
 # 2. 실제 파일이 저장될 하드디스크 경로(프로젝트폴더/media/)
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# 조회수 버퍼링 설정 (boards/viewcount.py)
+# 조회수를 메모리에 모았다가 몇 초마다 한 번에 DB에 반영할지 (0이면 버퍼링 없이 즉시 반영)
+VIEW_COUNT_FLUSH_INTERVAL = config('VIEW_COUNT_FLUSH_INTERVAL', default=10, cast=int)
+
+# True면 조회수를 공유 캐시(CACHES['default'])에 누적 -> 여러 워커 프로세스가 같은 값을 봄
+# 여러 프로세스가 같은 키를 incr 하므로 incr 가 원자적인 redis / memcached 에서만 켤 수 있습니다.
+VIEW_COUNT_SHARED_CACHE = config('VIEW_COUNT_SHARED_CACHE', default=False, cast=bool)
+if VIEW_COUNT_SHARED_CACHE and CACHE_BACKEND not in ('redis', 'memcached'):
+    raise ImproperlyConfigured('VIEW_COUNT_SHARED_CACHE 는 CACHE_BACKEND=redis/memcached 에서만 켤 수 있습니다.')
+
+# 게시판 목록 페이징 방식 (boards/pagination.py)
+# 'page'  : 기존 페이지 번호 방식 (?page=3)
+# 'cursor': 커서 방식 (?after=토큰) - 글이 아주 많은 게시판에서 뒤쪽 페이지도 빠름
+BOARD_LIST_PAGINATION = config('BOARD_LIST_PAGINATION', default='page')
+
+# 목록의 전체 글 개수(COUNT)를 캐시에 보관하는 시간(초)
+BOARD_LIST_COUNT_CACHE_TIMEOUT = config('BOARD_LIST_COUNT_CACHE_TIMEOUT', default=60, cast=int)
+
+# 게시글 검색 백엔드 (boards/search.py)
+# 'auto'(DB 종류에 맞게 자동 선택) / 'sqlite'(FTS5) / 'postgresql'(tsvector) / 'icontains'(기존 LIKE 검색)
+SEARCH_BACKEND = config('SEARCH_BACKEND', default='auto')
+
+# 한국어 검색용 2글자(bigram) 색인 사용 여부 (바꾼 뒤에는 python manage.py reindex_search 실행)
+SEARCH_NGRAM = config('SEARCH_NGRAM', default=True, cast=bool)
+
+# 메인 대시보드 캐시 시간(초) (boards/dashboard.py)
+# 전체 공통 구역(인기글, 자유게시판 최신글) - 글 작성/수정/삭제 시에는 바로 갱신됨
+HOME_GLOBAL_CACHE_TIMEOUT = config('HOME_GLOBAL_CACHE_TIMEOUT', default=60, cast=int)
+# 사용자별 구역(내 글, 내 댓글, 좋아요 한 글) - 본인이 글/댓글/좋아요를 바꾸면 바로 갱신됨
+HOME_USER_CACHE_TIMEOUT = config('HOME_USER_CACHE_TIMEOUT', default=300, cast=int)
+
+# 읽기 위주 화면(home, board_list, board_detail, message_list)을 async 뷰로 연결할지 여부
+# ASGI 서버(uvicorn config.asgi:application 등)로 실행할 때 True 로 설정하면 스레드 전환 없이 처리됩니다.
+# (WSGI 서버에서는 False 유지 - async 뷰를 WSGI에서 돌리면 오히려 느려집니다.)
+ASYNC_READ_VIEWS = config('ASYNC_READ_VIEWS', default=False, cast=bool)
+
+# 업로드 이미지 축소본(썸네일/WebP) 설정 (boards/images.py)
+# False 로 두면 템플릿이 축소본 대신 원본 URL을 사용합니다.
+THUMBNAIL_ENABLED = config('THUMBNAIL_ENABLED', default=True, cast=bool)
+# 만들어 둘 축소본 가로 크기(px) - 바꾼 뒤에는 python manage.py build_thumbnails 실행
+THUMBNAIL_SIZES = config('THUMBNAIL_SIZES', default='64,320,960', cast=Csv(int))
+# True: 업로드 후 작업 스레드에서 변환 (요청 응답을 기다리게 하지 않음) / False: 저장할 때 바로 변환
+THUMBNAIL_ASYNC = config('THUMBNAIL_ASYNC', default=True, cast=bool)
+
+# 안 읽은 쪽지 개수 캐시 시간(초) (accounts/unread.py)
+# 보내기/읽기 때는 바로 갱신되고, 이 시간이 지나면 DB 기준으로 다시 계산합니다.
+UNREAD_COUNT_CACHE_TIMEOUT = config('UNREAD_COUNT_CACHE_TIMEOUT', default=300, cast=int)
+
+# 요청 단위 성능 측정 (boards/perf.py)
+# True 면 PerfMiddleware 를 추가해서 화면별 쿼리 수/시간, 템플릿 시간, 캐시 적중, 전체 시간을 기록합니다.
+# 결과: 응답 Server-Timing 헤더, /perf/ (관리자 전용), python manage.py perf_report
+PERF_INSTRUMENTATION = config('PERF_INSTRUMENTATION', default=False, cast=bool)
+# 측정할 요청 비율 (1.0 = 전부, 0.05 = 5%) - 운영에서는 낮게 두고 켜 두면 됩니다.
+PERF_SAMPLE_RATE = config('PERF_SAMPLE_RATE', default=1.0, cast=float)
+# 화면별로 메모리에 보관할 최근 측정 개수 (p95/p99 계산용)
+PERF_RESERVOIR_SIZE = config('PERF_RESERVOIR_SIZE', default=1000, cast=int)
+# 몇 초마다 측정값을 공유 캐시에 올릴지 (여러 워커 프로세스의 값을 합쳐 보기 위함)
+PERF_PUBLISH_INTERVAL = config('PERF_PUBLISH_INTERVAL', default=30, cast=int)
+# 응답에 Server-Timing 헤더를 붙일지 여부
+PERF_SERVER_TIMING = config('PERF_SERVER_TIMING', default=True, cast=bool)
+
+if PERF_INSTRUMENTATION:
+    # 다른 미들웨어 시간까지 포함하도록 맨 앞에 둡니다.
+    MIDDLEWARE.insert(0, 'boards.perf.PerfMiddleware')
+
+# 비로그인 사용자용 게시판 화면 캐시 (boards/pagecache.py)
+# 목록/상세 화면 HTML 을 통째로 저장해서 재사용합니다. 글/댓글/좋아요가 바뀌면 바로 무효화됩니다.
+# 무효화는 캐시 저장소에 기록하므로 워커끼리 값이 보이는 캐시(CACHE_BACKEND 가 locmem 이 아님)에서만 켤 수 있습니다.
+# (locmem 이면 다른 워커는 무효화를 모른 채 예전 화면을 계속 보여줌) 기본값은 그런 캐시를 쓸 때만 켜짐
+# 태그 버전은 바뀌기만 하면 되므로 file/db 처럼 incr 가 원자적이지 않은 캐시도 괜찮습니다. (올린 횟수가 아니라 값이 달라지는지만 봄)
+PAGE_CACHE_ENABLED = config('PAGE_CACHE_ENABLED', default=CACHE_BACKEND != 'locmem', cast=bool)
+if PAGE_CACHE_ENABLED and CACHE_BACKEND == 'locmem':
+    raise ImproperlyConfigured('PAGE_CACHE_ENABLED 는 공유 캐시(CACHE_BACKEND=file/db/redis/memcached)에서만 켤 수 있습니다.')
+# 저장한 화면을 그대로 보여줄 시간(초) - 조회수 표시는 이 시간만큼 늦게 반영될 수 있습니다.
+PAGE_CACHE_TIMEOUT = config('PAGE_CACHE_TIMEOUT', default=60, cast=int)
+# 만료 후 한 요청이 다시 그리는 동안 다른 요청에 예전 화면을 대신 보여줄 수 있는 시간(초)
+PAGE_CACHE_STALE_TIMEOUT = config('PAGE_CACHE_STALE_TIMEOUT', default=30, cast=int)
+# 다시 그리는 요청의 잠금 유지 시간(초) - 그 요청이 죽어도 이 시간이 지나면 다른 요청이 다시 그림
+PAGE_CACHE_LOCK_TIMEOUT = config('PAGE_CACHE_LOCK_TIMEOUT', default=10, cast=int)
+# 예전 화면도 없을 때 다시 그려지기를 기다리는 최대 시간(초)
+PAGE_CACHE_WAIT_TIMEOUT = config('PAGE_CACHE_WAIT_TIMEOUT', default=2, cast=float)
+
+# 조건부 요청(ETag / Last-Modified -> 304) (boards/conditional.py)
+# 템플릿을 바꿔서 배포할 때 값을 바꾸면 브라우저에 저장된 예전 목록/상세 화면을 모두 새로 받습니다.
+PAGE_ETAG_VERSION = config('PAGE_ETAG_VERSION', default='1')
+
+# 백그라운드 작업 큐 (tasks/queue.py, 실행: python manage.py run_task_worker)
+# True 면 조회수 반영, 이미지 축소본 만들기를 요청 안에서 하지 않고 DB 큐에 넣습니다. (워커를 꼭 함께 실행)
+TASK_QUEUE_ENABLED = config('TASK_QUEUE_ENABLED', default=False, cast=bool)
+# 실패 시 최대 시도 횟수 (넘으면 '실패' 로 남겨 두고 관리자 페이지에서 다시 시도)
+TASK_MAX_ATTEMPTS = config('TASK_MAX_ATTEMPTS', default=5, cast=int)
+# 재시도 대기 시간(초): TASK_RETRY_BACKOFF * 2^(시도-1), 최대 TASK_RETRY_BACKOFF_MAX
+TASK_RETRY_BACKOFF = config('TASK_RETRY_BACKOFF', default=5, cast=int)
+TASK_RETRY_BACKOFF_MAX = config('TASK_RETRY_BACKOFF_MAX', default=600, cast=int)
+# 이 시간(초) 동안 끝나지 않은 '실행 중' 작업은 워커가 죽은 것으로 보고 다시 '대기'로 돌립니다.
+TASK_LOCK_TIMEOUT = config('TASK_LOCK_TIMEOUT', default=300, cast=int)
+# 워커가 한 번에 꺼낼 작업 수 (같은 종류의 작업은 한 번에 묶어서 처리)
+TASK_BATCH_SIZE = config('TASK_BATCH_SIZE', default=100, cast=int)
+# 할 일이 없을 때 다시 확인하는 간격(초)
+TASK_POLL_INTERVAL = config('TASK_POLL_INTERVAL', default=1.0, cast=float)
+
+# 인기글 순위 (boards/trending.py, 계산: python manage.py refresh_trending)
+# 순위는 요청 안에서 계산하지 않으므로 refresh_trending 을 반드시 주기적으로 돌려야 합니다.
+#  - cron 등으로 python manage.py refresh_trending 을 TRENDING_REFRESH_INTERVAL 마다
+#  - 또는 python manage.py refresh_trending --interval 60 을 계속 띄워 두기
+#  - 또는 TASK_QUEUE_ENABLED 를 켜고 python manage.py refresh_trending --schedule 한 번 + run_task_worker
+# 한 번도 계산하지 않았으면 메인 인기글 / 게시판 인기순 탭은 조회수 순으로 대신 보여줍니다.
+# 점수 = (조회수 * VIEW + 좋아요 * LIKE + 댓글 * COMMENT 가중치) * 0.5 ^ (글 나이 / 반감기)
+TRENDING_VIEW_WEIGHT = config('TRENDING_VIEW_WEIGHT', default=1, cast=float)
+TRENDING_LIKE_WEIGHT = config('TRENDING_LIKE_WEIGHT', default=5, cast=float)
+TRENDING_COMMENT_WEIGHT = config('TRENDING_COMMENT_WEIGHT', default=3, cast=float)
+# 점수가 절반으로 줄어드는 시간(시간 단위)
+TRENDING_HALF_LIFE_HOURS = config('TRENDING_HALF_LIFE_HOURS', default=24, cast=float)
+# 이 시간(시간 단위)보다 오래된 글은 순위 계산에서 제외 (기본 7일 -> 반감기 24시간이면 점수 1/128)
+TRENDING_WINDOW_HOURS = config('TRENDING_WINDOW_HOURS', default=168, cast=float)
+# 전체 / 게시판별로 저장할 순위 개수 (게시판 목록 '인기순' 탭에 보이는 최대 글 수)
+TRENDING_SIZE = config('TRENDING_SIZE', default=50, cast=int)
+# 순위를 다시 계산하는 간격(초) (refresh_trending --interval 기본값, 작업 큐 예약 간격)
+TRENDING_REFRESH_INTERVAL = config('TRENDING_REFRESH_INTERVAL', default=60, cast=int)
+
+# 조회수 중복 방지용 '오늘 읽은 글' 쿠키 (boards/viewfilter.py)
+# Bloom filter 비트 수 / 해시 수 - 비트 수를 늘리면 쿠키가 커지는 대신 거짓 양성(조회수 누락)이 줄어듭니다.
+# 기본값(2048비트, 해시 4개): 쿠키 약 350바이트, 하루 100개 읽으면 0.1%, 200개 읽으면 약 1.1%
+VIEW_FILTER_BITS = config('VIEW_FILTER_BITS', default=2048, cast=int)
+VIEW_FILTER_HASHES = config('VIEW_FILTER_HASHES', default=4, cast=int)
+
+# 게시판 목록 프로세스 캐시 (boards/registry.py)
+# 다른 워커 프로세스에서 게시판을 추가/수정/삭제했는지 공유 캐시의 버전을 몇 초마다 확인할지
+# (같은 프로세스 안의 변경은 저장/삭제 시그널로 바로 반영됩니다.)
+BOARD_REGISTRY_CHECK_INTERVAL = config('BOARD_REGISTRY_CHECK_INTERVAL', default=1.0, cast=float)
+# 버전과 관계없이 몇 초마다 게시판 목록을 무조건 다시 읽을지
+# 버전 번호가 워커끼리 공유되지 않는 캐시(locmem)에서는 다른 워커의 게시판 추가/수정이 이 시간 안에 반영됩니다.
+BOARD_REGISTRY_MAX_AGE = config('BOARD_REGISTRY_MAX_AGE', default=60.0, cast=float)
+
+# 관리자 목록 화면 (config/admin_perf.py)
+# 거르지 않은 목록의 행 수가 DB 통계상 이보다 많으면 COUNT(*) 대신 추정 행 수 사용
+# (통계 갱신: python manage.py analyze_db)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = config('ADMIN_ESTIMATED_COUNT_THRESHOLD', default=100000, cast=int)
+
+# 게시판 글/댓글 내보내기 (boards/export.py, python manage.py export_board / /board/<코드>/export/)
+# 한 번에 읽어서 내보내는 글 수 - 메모리 사용량은 이 묶음 하나만큼입니다.
+EXPORT_BATCH_SIZE = config('EXPORT_BATCH_SIZE', default=2000, cast=int)
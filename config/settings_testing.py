@@ -0,0 +1,13 @@
+# 테스트 전용 설정 (python manage.py test 가 기본으로 사용 - manage.py)
+# 운영 설정(config/settings.py)을 그대로 쓰고, 테스트에만 필요한 것을 더합니다.
+#   python manage.py test
+#   DJANGO_SETTINGS_MODULE=config.settings_testing python -m pytest
+# (파일 이름이 test*.py 이면 테스트 탐색이 이 모듈을 불러오므로 settings_testing.py)
+from .settings import *  # noqa: F401,F403
+from .settings import DATABASES, DATABASE_REPLICAS
+
+# 복제 DB 설정이 없어도 라우팅 테스트(config/tests.py)용 replica_1 을 둡니다.
+# 원본 테스트 DB의 미러이며, 라우터는 테스트에서 DATABASE_REPLICAS 를 바꿔서 켭니다.
+# (config.settings 의 DATABASES 를 고치지 않도록 새 dict)
+if not DATABASE_REPLICAS:
+    DATABASES = {**DATABASES, 'replica_1': {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}}
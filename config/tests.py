@@ -0,0 +1,112 @@
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import Message
+from boards import registry
+from boards.models import Board, Comment, Post
+from boards.tests import LOCMEM_CACHE
+
+from . import db_router
+
+User = get_user_model()
+
+# 테스트 설정(config/settings_testing.py)에만 있는 원본 테스트 DB 미러
+HAS_REPLICA = 'replica_1' in settings.DATABASES
+
+
+# 복제 DB 라우팅 (config/db_router.py)
+# replica_1 은 테스트에서 원본 테스트 DB의 미러이므로 (config/settings_testing.py) 내용은 같고,
+# 어느 DB로 갔는지는 연결별로 기록한 쿼리로 확인합니다.
+# (TestCase 는 DB마다 트랜잭션을 열어 두므로 같은 메모리 DB의 두 연결이 서로 잠금을 걸어 TransactionTestCase 사용)
+@override_settings(
+    DATABASE_REPLICAS=['replica_1'],
+    DATABASE_ROUTERS=['config.db_router.ReplicaRouter'],
+    MIDDLEWARE=[*settings.MIDDLEWARE, 'config.db_router.ReplicaRoutingMiddleware'],
+    DATABASE_REPLICA_STICKY_SECONDS=10,
+    CACHES=LOCMEM_CACHE, PAGE_CACHE_ENABLED=False, VIEW_COUNT_FLUSH_INTERVAL=0, TASK_QUEUE_ENABLED=False,
+)
+@skipUnless(HAS_REPLICA, 'replica_1 이 없음 - DJANGO_SETTINGS_MODULE=config.settings_testing 로 실행')
+class ReplicaRoutingTests(TransactionTestCase):
+    databases = {'default', 'replica_1'} if HAS_REPLICA else {'default'}
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('writer')
+        self.sender = User.objects.create_user('sender')
+        self.board = Board.objects.create(code='free', title='자유게시판')
+        self.post = Post.objects.create(board=self.board, author=self.user, title='제목', content='내용')
+        registry.invalidate()
+        registry.all_boards()
+        self.client.force_login(self.user)
+        self.now = 1_000_000.0
+        patcher = mock.patch.object(db_router, 'time', mock.Mock(time=lambda: self.now))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def detail_url(self):
+        return reverse('boards:board_detail', args=[self.board.code, self.post.pk])
+
+    def read_detail(self):
+        """상세 화면을 요청하고 글/댓글을 읽은 DB 이름을 돌려줍니다."""
+        with CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections['replica_1']) as replica:
+            response = self.client.get(self.detail_url())
+        self.assertEqual(response.status_code, 200)
+        read_on = {
+            alias for alias, queries in (('default', primary), ('replica_1', replica))
+            if any('FROM "boards_comment"' in query['sql'] for query in queries)
+        }
+        self.assertEqual(len(read_on), 1, read_on)
+        return read_on.pop()
+
+    def assertPinned(self, response):
+        self.assertIn(db_router.STICKY_COOKIE, response.cookies)
+        self.assertEqual(int(response.cookies[db_router.STICKY_COOKIE].value), int(self.now) + 10)
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.read_detail(), 'replica_1')
+        self.assertNotIn(db_router.STICKY_COOKIE, self.client.cookies)
+
+    def test_view_count_does_not_pin(self):
+        # 상세 화면의 조회수 반영(UPDATE)은 부수적인 쓰기 -> 다음 읽기도 복제 DB
+        self.read_detail()
+        self.post.refresh_from_db(fields=['views'])
+        self.assertEqual(self.post.views, 1)
+        self.assertNotIn(db_router.STICKY_COOKIE, self.client.cookies)
+        self.assertEqual(self.read_detail(), 'replica_1')
+
+    def test_sticky_window_after_post(self):
+        response = self.client.post(
+            reverse('boards:comment_create', args=[self.board.code, self.post.pk]), {'content': '방금 쓴 댓글'},
+        )
+        self.assertPinned(response)
+        self.assertTrue(Comment.objects.filter(content='방금 쓴 댓글').exists())
+
+        # 고정 시간 안: 원본에서 읽음
+        self.now += 9
+        self.assertEqual(self.read_detail(), 'default')
+        # 고정 시간이 지나면 다시 복제 DB
+        self.now += 2
+        self.assertEqual(self.read_detail(), 'replica_1')
+
+    def test_get_post_like_pins(self):
+        response = self.client.get(reverse('boards:post_like', args=[self.board.code, self.post.pk]))
+        self.assertEqual(response.status_code, 302)
+        self.assertPinned(response)
+        self.assertEqual(self.read_detail(), 'default')
+
+    def test_get_message_detail_marking_read_pins(self):
+        message = Message.objects.create(sender=self.sender, receiver=self.user, title='쪽지', content='-')
+        url = reverse('accounts:message_detail', args=[message.pk])
+        self.assertPinned(self.client.get(url))
+
+        # 이미 읽은 쪽지를 다시 열면 쓰기가 없으므로 고정 시간이 늘어나지 않음
+        self.now += 5
+        self.assertNotIn(db_router.STICKY_COOKIE, self.client.get(url).cookies)
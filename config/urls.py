@@ -19,13 +19,20 @@ from django.urls import path, include # include imports
 from django.conf import settings    # 설정 가져오기
 from django.conf.urls.static import static  #정적파일 연결 함수
 from boards import views as board_views  # boards 앱의 views를 가져옵니다.
+from boards import async_views as board_async_views  # 메인 페이지 async(ASGI) 버전
+
+# ASYNC_READ_VIEWS=True 면 메인 페이지를 async 뷰로 연결합니다.
+home_view = board_async_views.home if settings.ASYNC_READ_VIEWS else board_views.home
 
 urlpatterns = [
     # 루트 URL ('')을 home 뷰와 연결 -> 이름은 'home'
-    path('', board_views.home, name='home'), 
+    path('', home_view, name='home'), 
 
     path('admin/', admin.site.urls),
 
+    # 화면별 성능 측정 결과 (관리자 전용, PERF_INSTRUMENTATION=True 일 때 기록됨)
+    path('perf/', board_views.perf_report, name='perf_report'),
+
     # http://127.0.0.1:8000/board/ 로 시작하는 모든 요청은
     # boards 앱 안에 있는 urls.py 파일로 처리를 넘긴다는 뜻
     path('board/', include('boards.urls')),
@@ -0,0 +1,39 @@
+from django.contrib import admin, messages
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Task
+
+
+# 작업 큐 관리: 실패한 작업 확인 / 다시 시도
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'created_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'dedup_key')
+    readonly_fields = ('locked_by', 'locked_at', 'created_at', 'last_error')
+    ordering = ('-id',)
+    actions = ['retry_now']
+
+    @admin.action(description='선택한 작업을 지금 다시 실행')
+    def retry_now(self, request, queryset):
+        # 실패한 작업만 되살립니다. 같은 dedup_key 로 이미 대기 중인 작업이 있으면
+        # 대기 중 dedup_key 유일 제약(task_pending_dedup_key_uniq)에 걸리므로 그 줄은 건너뜁니다.
+        # (대기 중인 작업이 같은 일을 하므로 되살릴 필요가 없음)
+        updated, skipped = 0, []
+        for task in queryset.filter(status=Task.FAILED).order_by('id'):
+            try:
+                with transaction.atomic():
+                    updated += Task.objects.filter(pk=task.pk, status=Task.FAILED).update(
+                        status=Task.PENDING, attempts=0, run_at=timezone.now(), locked_by=None, locked_at=None,
+                    )
+            except IntegrityError:
+                skipped.append(task)
+        self.message_user(request, f'{updated}개 작업을 다시 대기열에 넣었습니다.')
+        if skipped:
+            self.message_user(
+                request,
+                '같은 중복 방지 키로 대기 중인 작업이 있어 건너뛰었습니다: '
+                + ', '.join(f'#{task.pk} ({task.dedup_key})' for task in skipped),
+                messages.WARNING,
+            )
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'tasks'
+    verbose_name = '백그라운드 작업'
+
+    def ready(self):
+        # 각 앱의 tasks.py (작업 함수 등록)를 불러옵니다. (admin.py 를 찾는 방식과 같음)
+        from django.utils.module_loading import autodiscover_modules
+        autodiscover_modules('tasks')
@@ -0,0 +1,74 @@
+import importlib
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from tasks import queue
+
+
+# 사용법:
+#   python manage.py run_task_worker                          (워커 1개, 계속 실행)
+#   python manage.py run_task_worker --concurrency 4          (스레드 4개)
+#   python manage.py run_task_worker --concurrency 4 --mode process   (프로세스 4개)
+#   python manage.py run_task_worker --once                   (지금 쌓인 작업만 처리하고 종료 - cron 등)
+# DB 작업 큐(tasks.Task)에서 작업을 꺼내 실행합니다. (settings.TASK_QUEUE_ENABLED = True 일 때 필요)
+# 이미지 변환처럼 CPU 를 많이 쓰는 작업이 많으면 --mode process 가 유리합니다.
+class Command(BaseCommand):
+    help = 'DB 작업 큐의 작업을 꺼내서 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1, help='동시에 실행할 워커 수')
+        parser.add_argument('--mode', choices=['thread', 'process'], default='thread', help='워커 실행 방식')
+        parser.add_argument('--batch-size', type=int, help='한 번에 꺼낼 작업 수 (기본: TASK_BATCH_SIZE)')
+        parser.add_argument('--poll-interval', type=float, help='할 일이 없을 때 확인 간격(초) (기본: TASK_POLL_INTERVAL)')
+        parser.add_argument('--once', action='store_true', help='실행할 수 있는 작업이 없으면 종료')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"등록된 작업: {', '.join(queue.registered())}")
+        started = time.perf_counter()
+        processed = run_workers(
+            options['concurrency'], options['mode'],
+            batch_size=options['batch_size'], poll_interval=options['poll_interval'], once=options['once'],
+        )
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(f'작업 {processed}개 처리 ({elapsed:.1f}초, 초당 {rate:.0f}개)'))
+
+
+def _setup_process(imports):
+    django.setup()
+    # 각 앱 tasks.py 밖에서 등록하는 작업 (벤치마크용 작업 등)
+    for module in imports:
+        importlib.import_module(module)
+
+
+def run_workers(concurrency, mode='thread', imports=(), **options):
+    """워커 concurrency 개를 실행하고 처리한 작업 수를 돌려줍니다. (run_benchmarks tasks 에서도 사용)
+
+    imports: 자식 프로세스(--mode process)에서 작업 등록을 위해 더 불러올 모듈 이름들
+    """
+    if concurrency <= 1:
+        return queue.work(**options)
+
+    if mode == 'process':
+        # 자식 프로세스가 부모의 DB 연결을 물려받지 않도록 닫고 시작
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=concurrency, initializer=_setup_process, initargs=(imports,),
+        ) as executor:
+            futures = [executor.submit(queue.work, **options) for _ in range(concurrency)]
+            return sum(future.result() for future in futures)
+
+    stop_event = threading.Event()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='task-worker') as executor:
+        futures = [executor.submit(queue.work, stop_event=stop_event, **options) for _ in range(concurrency)]
+        try:
+            return sum(future.result() for future in futures)
+        except KeyboardInterrupt:
+            # Ctrl+C: 각 워커가 지금 꺼낸 작업까지 끝내고 멈추도록
+            stop_event.set()
+            return sum(future.result() for future in futures)
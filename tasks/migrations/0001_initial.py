@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='작업 이름')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='인자')),
+                ('dedup_key', models.CharField(blank=True, max_length=200, null=True, verbose_name='중복 방지 키')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('run_at', models.DateTimeField(verbose_name='실행 예정')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveIntegerField(default=5, verbose_name='최대 시도 횟수')),
+                ('locked_by', models.CharField(blank=True, max_length=100, null=True, verbose_name='실행 워커')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='실행 시작')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일')),
+            ],
+            options={
+                'verbose_name': '작업',
+                'verbose_name_plural': '작업',
+                'indexes': [models.Index(fields=['status', 'run_at', 'id'], name='task_status_run_at_idx'), models.Index(fields=['locked_by'], name='task_locked_by_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('dedup_key',), name='task_pending_dedup_key_uniq')],
+            },
+        ),
+    ]
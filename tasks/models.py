@@ -0,0 +1,60 @@
+from django.db import models
+from django.db.models import Q
+
+
+# 백그라운드 작업 큐 (tasks/queue.py)
+# 별도 메시지 브로커(Redis, RabbitMQ 등) 없이 DB 테이블 하나를 큐로 사용합니다.
+# 요청 처리 중에는 줄만 추가(INSERT)하고, python manage.py run_task_worker 가 꺼내서 실행합니다.
+# 성공한 작업은 지우고, 실패한 작업은 재시도 간격을 늘려가며 다시 실행하다가
+# max_attempts 를 넘으면 'failed' 로 남겨 둡니다. (관리자 페이지에서 확인/재시도)
+class Task(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, '대기'),
+        (RUNNING, '실행 중'),
+        (FAILED, '실패'),
+    ]
+
+    # 등록된 작업 이름 (예: 'boards.make_thumbnails')
+    name = models.CharField(max_length=100, verbose_name="작업 이름")
+    # 작업 함수에 넘길 값 (JSON)
+    payload = models.JSONField(default=dict, blank=True, verbose_name="인자")
+
+    # 중복 방지 키: 같은 키로 '대기' 중인 작업이 있으면 새로 넣지 않습니다. (예: 같은 이미지 축소본 만들기)
+    dedup_key = models.CharField(max_length=200, null=True, blank=True, verbose_name="중복 방지 키")
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING, verbose_name="상태")
+    # 이 시각 이후에 실행 (재시도 대기, 지연 실행)
+    run_at = models.DateTimeField(verbose_name="실행 예정")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="시도 횟수")
+    max_attempts = models.PositiveIntegerField(default=5, verbose_name="최대 시도 횟수")
+
+    # 실행 중인 워커 표시 (워커가 죽으면 locked_at 기준으로 다시 '대기'로 돌립니다.)
+    locked_by = models.CharField(max_length=100, null=True, blank=True, verbose_name="실행 워커")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="실행 시작")
+
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록일")
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = '작업'
+        verbose_name_plural = '작업'
+        indexes = [
+            # 워커가 꺼낼 작업 찾기: WHERE status = 'pending' AND run_at <= ? ORDER BY run_at, id
+            models.Index(fields=['status', 'run_at', 'id'], name='task_status_run_at_idx'),
+            # 실행 중에 멈춘 작업 찾기 / 이번에 꺼낸 작업 다시 읽기
+            models.Index(fields=['locked_by'], name='task_locked_by_idx'),
+        ]
+        constraints = [
+            # '대기' 중인 작업끼리만 dedup_key 가 겹치지 않게 (실행 중에 다시 넣은 작업은 허용)
+            models.UniqueConstraint(
+                fields=['dedup_key'],
+                condition=Q(status='pending'),
+                name='task_pending_dedup_key_uniq',
+            ),
+        ]
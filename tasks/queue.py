@@ -0,0 +1,248 @@
+# DB 기반 백그라운드 작업 큐
+# 요청(뷰)에서는 enqueue() 로 Task 줄만 추가하고 바로 응답합니다.
+# 워커(python manage.py run_task_worker)가 작업을 꺼내서 실행합니다.
+#  - 꺼내기: '대기' 작업 N개를 골라 UPDATE ... SET status='running', locked_by=<이번 꺼내기 토큰>
+#            (WHERE status='pending' 조건 덕분에 여러 워커가 동시에 꺼내도 한 작업은 한 워커만 가져감)
+#  - 묶음 처리: batch=True 로 등록한 작업은 한 번에 꺼낸 같은 이름의 작업들을 함수 한 번으로 처리
+#  - 중복 방지: dedup_key 가 같은 '대기' 작업이 있으면 새로 넣지 않음 (INSERT ... ON CONFLICT DO NOTHING)
+#  - 재시도: 실패하면 TASK_RETRY_BACKOFF * 2^(시도-1) 초 뒤에 다시 (최대 TASK_RETRY_BACKOFF_MAX, 약간의 무작위 지연)
+#  - 워커가 죽어서 '실행 중'으로 남은 작업은 TASK_LOCK_TIMEOUT 이 지나면 다시 '대기'로 돌림
+#  - 작업 함수 실행과 성공한 작업 삭제는 한 트랜잭션 (작업 함수가 DB 에 반영한 내용이 두 번 적용되지 않도록)
+# 작업 함수는 각 앱의 tasks.py 에서 @task 로 등록합니다. (apps.py 에서 자동으로 불러옴)
+#
+#   @task('boards.make_thumbnails')
+#   def make_thumbnails(name): ...
+#
+#   enqueue('boards.make_thumbnails', {'name': name}, dedup_key=f'thumbnail:{name}')
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+
+# 등록된 작업 {이름: (함수, 묶음 처리 여부, 최대 시도 횟수)}
+_registry = {}
+
+
+def _max_attempts():
+    return getattr(settings, 'TASK_MAX_ATTEMPTS', 5)
+
+
+def _retry_backoff():
+    return getattr(settings, 'TASK_RETRY_BACKOFF', 5)
+
+
+def _retry_backoff_max():
+    return getattr(settings, 'TASK_RETRY_BACKOFF_MAX', 600)
+
+
+def _lock_timeout():
+    return getattr(settings, 'TASK_LOCK_TIMEOUT', 300)
+
+
+def enabled():
+    """True 면 부가 작업(조회수 반영, 이미지 축소본 등)을 요청 안에서 하지 않고 큐에 넣습니다."""
+    return getattr(settings, 'TASK_QUEUE_ENABLED', False)
+
+
+# ----------------------------------------------------------------------------
+# 등록 / 넣기
+# ----------------------------------------------------------------------------
+
+def task(name, batch=False, max_attempts=None):
+    """작업 함수 등록 데코레이터
+
+    batch=False: 함수(**payload) 를 작업마다 한 번씩 호출
+    batch=True : 함수([payload, ...]) 를 한 번에 꺼낸 같은 이름의 작업들에 대해 한 번 호출
+    """
+    def decorator(func):
+        _registry[name] = (func, batch, max_attempts)
+        return func
+    return decorator
+
+
+def registered():
+    return sorted(_registry)
+
+
+def enqueue(name, payload=None, dedup_key=None, delay=0):
+    """작업을 큐에 넣습니다. (현재 트랜잭션 안에서 INSERT 되므로 롤백되면 작업도 함께 취소됩니다.)
+
+    dedup_key 가 같은 '대기' 작업이 이미 있으면 아무것도 하지 않습니다.
+    """
+    if name not in _registry:
+        raise ValueError(f"등록되지 않은 작업입니다: {name}")
+    _, _, max_attempts = _registry[name]
+    task = Task(
+        name=name,
+        payload=payload or {},
+        dedup_key=dedup_key,
+        run_at=timezone.now() + timedelta(seconds=delay),
+        max_attempts=max_attempts or _max_attempts(),
+    )
+    if dedup_key is None:
+        task.save()
+    else:
+        Task.objects.bulk_create([task], ignore_conflicts=True)
+
+
+# ----------------------------------------------------------------------------
+# 꺼내기 / 실행
+# ----------------------------------------------------------------------------
+
+def claim(worker_id, limit):
+    """실행할 수 있는 작업을 최대 limit 개 꺼내서 '실행 중'으로 바꾸고 돌려줍니다."""
+    now = timezone.now()
+    token = f'{worker_id}:{uuid.uuid4().hex[:12]}'
+    ready = Task.objects.filter(status=Task.PENDING, run_at__lte=now).order_by('run_at', 'id')
+    if connection.features.has_select_for_update_skip_locked:
+        # PostgreSQL 등: 다른 워커가 잡고 있는 줄은 건너뛰므로 워커끼리 같은 작업을 두고 다투지 않음
+        with transaction.atomic():
+            ids = list(ready.select_for_update(skip_locked=True).values_list('pk', flat=True)[:limit])
+            _mark_running(ids, token, now)
+    else:
+        # SQLite: 읽기 트랜잭션을 쓰기로 올리다가 'database is locked' 가 나지 않도록 트랜잭션 없이 실행
+        # (UPDATE 의 status='pending' 조건 때문에 먼저 바꾼 워커만 가져감)
+        ids = list(ready.values_list('pk', flat=True)[:limit])
+        _mark_running(ids, token, now)
+    if not ids:
+        return []
+    return list(Task.objects.filter(locked_by=token, status=Task.RUNNING).order_by('run_at', 'id'))
+
+
+def _mark_running(ids, token, now):
+    if ids:
+        Task.objects.filter(pk__in=ids, status=Task.PENDING).update(
+            status=Task.RUNNING, locked_by=token, locked_at=now, attempts=F('attempts') + 1,
+        )
+
+
+def backoff(attempts):
+    """attempts 번째 실패 후 다음 시도까지 기다릴 시간(초)"""
+    delay = min(_retry_backoff_max(), _retry_backoff() * 2 ** max(0, attempts - 1))
+    # 같은 이유로 실패한 작업들이 동시에 다시 몰리지 않도록 50~100% 사이로 흩뜨림
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _fail(task, error):
+    task.last_error = error
+    task.locked_by = task.locked_at = None
+    if task.attempts >= task.max_attempts:
+        task.status = Task.FAILED
+    else:
+        task.status = Task.PENDING
+        task.run_at = timezone.now() + timedelta(seconds=backoff(task.attempts))
+    try:
+        with transaction.atomic():
+            task.save(update_fields=['status', 'run_at', 'last_error', 'locked_by', 'locked_at'])
+    except IntegrityError:
+        # 실행하는 동안 같은 dedup_key 로 새 작업이 들어와 있음 -> 그 작업이 대신 처리하므로 이 줄은 삭제
+        Task.objects.filter(pk=task.pk).delete()
+
+
+class _LockLost(Exception):
+    """실행하는 동안 작업이 다른 워커에게 넘어감 (TASK_LOCK_TIMEOUT 초과로 다시 '대기'가 된 경우)"""
+
+
+def _run_call(func, batch, members):
+    """작업 함수 실행과 그 작업 줄 삭제를 한 트랜잭션으로
+
+    함수가 DB 에 반영한 내용과 작업 삭제가 함께 커밋되므로, 그 사이에 워커가 죽어도
+    requeue_stale() 이 이미 반영된 작업을 다시 실행하지 않습니다. (예: 조회수 F('views') + n 두 번)
+    함수가 실패하면 함수가 바꾼 내용도 함께 취소되고 작업은 재시도됩니다.
+    """
+    with transaction.atomic():
+        if batch:
+            func([task.payload for task in members])
+        else:
+            func(**members[0].payload)
+        deleted, _ = Task.objects.filter(
+            pk__in=[task.pk for task in members], status=Task.RUNNING, locked_by=members[0].locked_by,
+        ).delete()
+        if deleted != len(members):
+            # 이미 다른 워커가 가져갔음 -> 이번 실행 결과는 취소 (그 워커가 한 번만 반영)
+            raise _LockLost
+
+
+def run(tasks):
+    """꺼낸 작업들을 실행하고, 성공한 작업 수를 돌려줍니다.
+
+    성공한 작업은 남겨둘 필요가 없으므로 함수 실행과 같은 트랜잭션에서 삭제합니다. (테이블이 계속 커지지 않도록)
+    """
+    groups = defaultdict(list)
+    for task in tasks:
+        groups[task.name].append(task)
+
+    done = 0
+    for name, group in groups.items():
+        if name not in _registry:
+            for task in group:
+                _fail(task, f"등록되지 않은 작업입니다: {name}")
+            continue
+        func, batch, _ = _registry[name]
+        calls = [group] if batch else [[task] for task in group]
+        for members in calls:
+            try:
+                _run_call(func, batch, members)
+            except _LockLost:
+                continue
+            except Exception:
+                error = traceback.format_exc()
+                for task in members:
+                    _fail(task, error)
+            else:
+                done += len(members)
+    return done
+
+
+def requeue_stale():
+    """TASK_LOCK_TIMEOUT 이 지나도록 '실행 중'인 작업(워커가 죽은 경우)을 다시 '대기'로 돌립니다."""
+    cutoff = timezone.now() - timedelta(seconds=_lock_timeout())
+    requeued = 0
+    for task in Task.objects.filter(status=Task.RUNNING, locked_at__lt=cutoff):
+        _fail(task, '워커가 제한 시간 안에 끝내지 못했습니다. (TASK_LOCK_TIMEOUT)')
+        requeued += 1
+    return requeued
+
+
+def work(worker_id=None, batch_size=None, poll_interval=None, once=False, stop_event=None):
+    """작업을 꺼내서 실행하는 반복문 (워커 스레드/프로세스 하나)
+
+    once=True 면 지금 실행할 수 있는 작업이 없어질 때 끝납니다.
+    실행한(성공한) 작업 수를 돌려줍니다.
+    """
+    # 기본 이름: 호스트:프로세스:스레드 (프로세스 풀에서는 자식 프로세스마다 다름)
+    worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}'
+    batch_size = batch_size or getattr(settings, 'TASK_BATCH_SIZE', 100)
+    if poll_interval is None:
+        poll_interval = getattr(settings, 'TASK_POLL_INTERVAL', 1.0)
+
+    processed = 0
+    try:
+        while stop_event is None or not stop_event.is_set():
+            tasks = claim(worker_id, batch_size)
+            if tasks:
+                processed += run(tasks)
+                continue
+            requeue_stale()
+            if once:
+                break
+            if stop_event is not None:
+                stop_event.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+    finally:
+        # 워커 스레드가 끝나면 그 스레드의 DB 연결도 닫습니다.
+        connection.close()
+    return processed
@@ -0,0 +1,220 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from boards.tests import LOCMEM_CACHE
+
+from . import queue
+from .models import Task
+
+calls = []
+
+
+@queue.task('tests.record')
+def record(**payload):
+    calls.append(payload)
+
+
+@queue.task('tests.broken', max_attempts=3)
+def broken(**payload):
+    raise RuntimeError('작업 실패')
+
+
+@queue.task('tests.write_then_fail')
+def write_then_fail(**payload):
+    # DB 에 무언가 반영한 뒤 실패
+    queue.enqueue('tests.record', {'written': True})
+    raise RuntimeError('작업 실패')
+
+
+@queue.task('tests.write')
+def write(**payload):
+    queue.enqueue('tests.record', {'written': True})
+
+
+@override_settings(TASK_RETRY_BACKOFF=5, TASK_RETRY_BACKOFF_MAX=60, TASK_LOCK_TIMEOUT=300)
+class QueueTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+        # 무작위 지연(50~100%) 없이 최대값으로
+        patcher = mock.patch.object(queue.random, 'uniform', side_effect=lambda low, high: high)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def enqueue(self, name='tests.record', **kwargs):
+        queue.enqueue(name, **kwargs)
+        return Task.objects.latest('id')
+
+
+class ClaimTests(QueueTestCase):
+    def test_claim_marks_running(self):
+        task = self.enqueue(payload={'n': 1})
+        claimed = queue.claim('worker', 10)
+        self.assertEqual([t.pk for t in claimed], [task.pk])
+        task.refresh_from_db()
+        self.assertEqual(task.status, Task.RUNNING)
+        self.assertEqual(task.attempts, 1)
+        self.assertTrue(task.locked_by.startswith('worker:'))
+        self.assertEqual(queue.claim('worker', 10), [])
+
+    def test_claim_limit_and_order(self):
+        tasks = [self.enqueue(payload={'n': i}) for i in range(5)]
+        first = queue.claim('a', 3)
+        second = queue.claim('b', 3)
+        self.assertEqual([t.pk for t in first], [t.pk for t in tasks[:3]])
+        self.assertEqual([t.pk for t in second], [t.pk for t in tasks[3:]])
+
+    def test_claim_skips_delayed(self):
+        self.enqueue(delay=60)
+        self.assertEqual(queue.claim('worker', 10), [])
+
+    def test_no_double_claim(self):
+        # 워커 a 가 작업을 고른 뒤 '실행 중'으로 바꾸기 직전에 워커 b 가 같은 작업을 먼저 가져감
+        tasks = [self.enqueue(payload={'n': i}) for i in range(3)]
+        mark_running = queue._mark_running
+        stolen = []
+
+        def racing(ids, token, now):
+            if token.startswith('a:') and not stolen:
+                stolen.append(None)
+                stolen.extend(queue.claim('b', 2))
+            mark_running(ids, token, now)
+
+        with mock.patch.object(queue, '_mark_running', racing):
+            mine = queue.claim('a', 10)
+
+        theirs = [t.pk for t in stolen[1:]]
+        self.assertEqual(theirs, [t.pk for t in tasks[:2]])
+        self.assertEqual([t.pk for t in mine], [tasks[2].pk])
+        # 두 번 가져간 작업이 없으므로 시도 횟수는 모두 1
+        self.assertEqual(set(Task.objects.values_list('attempts', flat=True)), {1})
+
+
+class RetryTests(QueueTestCase):
+    def test_backoff_doubles_up_to_max(self):
+        self.assertEqual([queue.backoff(n) for n in (1, 2, 3, 4, 5)], [5, 10, 20, 40, 60])
+
+    def test_failure_is_retried_later(self):
+        task = self.enqueue('tests.broken')
+        before = timezone.now()
+        self.assertEqual(queue.run(queue.claim('worker', 10)), 0)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, Task.PENDING)
+        self.assertIsNone(task.locked_by)
+        self.assertIsNone(task.locked_at)
+        self.assertIn('작업 실패', task.last_error)
+        self.assertGreaterEqual(task.run_at, before + timedelta(seconds=5))
+        self.assertLess(task.run_at, before + timedelta(seconds=10))
+        # 재시도 시각 전에는 다시 꺼내지 않음
+        self.assertEqual(queue.claim('worker', 10), [])
+
+    def test_failed_after_max_attempts(self):
+        task = self.enqueue('tests.broken')
+        self.assertEqual(task.max_attempts, 3)
+        for _ in range(3):
+            Task.objects.filter(pk=task.pk).update(run_at=timezone.now())
+            queue.run(queue.claim('worker', 10))
+        task.refresh_from_db()
+        self.assertEqual(task.status, Task.FAILED)
+        self.assertEqual(task.attempts, 3)
+        self.assertEqual(queue.claim('worker', 10), [])
+
+    def test_success_deletes_task(self):
+        self.enqueue(payload={'n': 1})
+        self.assertEqual(queue.run(queue.claim('worker', 10)), 1)
+        self.assertEqual(calls, [{'n': 1}])
+        self.assertFalse(Task.objects.exists())
+
+    def test_failure_rolls_back_function_writes(self):
+        task = self.enqueue('tests.write_then_fail')
+        self.assertEqual(queue.run(queue.claim('worker', 10)), 0)
+        # 함수가 넣은 작업은 실패와 함께 취소되고, 재시도할 작업만 남음
+        self.assertEqual(list(Task.objects.values_list('pk', flat=True)), [task.pk])
+
+    def test_lost_lock_discards_result(self):
+        # 다른 워커가 다시 실행할 작업이므로 이번 실행이 반영한 내용은 취소 (두 번 반영되지 않도록)
+        task = self.enqueue('tests.write')
+        claimed = queue.claim('worker', 10)
+        # 실행이 TASK_LOCK_TIMEOUT 을 넘겨서 다른 워커의 requeue_stale() 이 이 작업을 '대기'로 돌린 상황
+        Task.objects.filter(pk=task.pk).update(status=Task.PENDING, locked_by=None, locked_at=None)
+        self.assertEqual(queue.run(claimed), 0)
+        self.assertEqual(list(Task.objects.values_list('pk', 'status')), [(task.pk, Task.PENDING)])
+
+    def test_unregistered_name(self):
+        with self.assertRaises(ValueError):
+            queue.enqueue('tests.missing')
+
+
+class DedupTests(QueueTestCase):
+    def test_pending_duplicate_is_ignored(self):
+        queue.enqueue('tests.record', {'n': 1}, dedup_key='same')
+        queue.enqueue('tests.record', {'n': 2}, dedup_key='same')
+        self.assertEqual(list(Task.objects.values_list('payload', flat=True)), [{'n': 1}])
+
+    def test_enqueue_while_running(self):
+        # 실행 중인 작업과 같은 키의 새 작업은 허용 (실행 뒤에 바뀐 내용을 다시 처리해야 하므로)
+        queue.enqueue('tests.broken', dedup_key='same')
+        running = queue.claim('worker', 10)
+        queue.enqueue('tests.broken', dedup_key='same')
+        self.assertEqual(Task.objects.filter(status=Task.PENDING).count(), 1)
+
+        # 실행 중이던 작업이 실패해도 '대기'로 돌아가며 키가 겹치지 않도록 그 줄은 지움
+        queue.run(running)
+        self.assertEqual(list(Task.objects.values_list('status', 'attempts')), [(Task.PENDING, 0)])
+
+
+class RequeueStaleTests(QueueTestCase):
+    def test_requeue_stale(self):
+        stale = self.enqueue()
+        fresh = self.enqueue()
+        queue.claim('dead', 10)
+        Task.objects.filter(pk=stale.pk).update(locked_at=timezone.now() - timedelta(seconds=301))
+
+        self.assertEqual(queue.requeue_stale(), 1)
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(stale.status, Task.PENDING)
+        self.assertIsNone(stale.locked_by)
+        self.assertIn('TASK_LOCK_TIMEOUT', stale.last_error)
+        self.assertGreater(stale.run_at, timezone.now())
+        self.assertEqual(fresh.status, Task.RUNNING)
+
+    def test_stale_at_max_attempts_fails(self):
+        task = self.enqueue()
+        Task.objects.filter(pk=task.pk).update(attempts=task.max_attempts - 1)
+        queue.claim('dead', 10)
+        Task.objects.filter(pk=task.pk).update(locked_at=timezone.now() - timedelta(seconds=301))
+
+        queue.requeue_stale()
+        task.refresh_from_db()
+        self.assertEqual(task.status, Task.FAILED)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, DATABASE_REPLICAS=[])
+class RetryNowAdminTests(QueueTestCase):
+    def test_skips_dedup_key_already_pending(self):
+        admin = get_user_model().objects.create_superuser('admin', password='-')
+        self.client.force_login(admin)
+        pending = self.enqueue(dedup_key='same')
+        failed_same = self.enqueue(dedup_key='other')
+        Task.objects.filter(pk=failed_same.pk).update(status=Task.FAILED, dedup_key='same')
+        failed_other = self.enqueue(dedup_key='other')
+        Task.objects.filter(pk=failed_other.pk).update(status=Task.FAILED, attempts=5)
+
+        response = self.client.post(reverse('admin:tasks_task_changelist'), {
+            'action': 'retry_now', '_selected_action': [pending.pk, failed_same.pk, failed_other.pk],
+        }, follow=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '1개 작업을 다시 대기열에 넣었습니다.')
+        self.assertContains(response, f'#{failed_same.pk} (same)')
+        self.assertEqual(
+            dict(Task.objects.values_list('pk', 'status')),
+            {pending.pk: Task.PENDING, failed_same.pk: Task.FAILED, failed_other.pk: Task.PENDING},
+        )
+        failed_other.refresh_from_db()
+        self.assertEqual(failed_other.attempts, 0)